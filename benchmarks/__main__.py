@@ -0,0 +1,269 @@
+"""
+Offline benchmarks for the subscriber's hot paths.
+
+Runs each stage against synthetic blocks for each scenario and reports its throughput
+and peak memory; e.g. from the repository root::
+
+    python -m benchmarks
+    python -m benchmarks --scenario dense-payments --rounds 5 --output results.json
+    python -m benchmarks --baseline results.json --max-regression 0.2
+"""
+
+import argparse
+import dataclasses
+import json
+import logging
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+from algokit_subscriber import (
+    Arc28EventFilter,
+    Arc28EventGroup,
+    BalanceChangeFilter,
+    NamedTransactionFilter,
+    TransactionFilter,
+    TransactionSubscriptionParams,
+    compile_filters,
+    get_subscribed_transactions,
+)
+from algokit_subscriber._subscription import (
+    _extract_arc28_events,
+    _extract_balance_changes_from_indexer_transaction,
+    _get_txn_features,
+    _map_txn_and_inner_txns_to_subscribed_txn,
+)
+from algokit_subscriber._transform import get_block_transactions
+from benchmarks.blocks import SCENARIOS, count_transactions, make_blocks
+from synthetic.blocks import ACCOUNTS, DEX_APP_ID, LIQUIDITY, SWAPPED, FakeAlgod
+
+ARC28_GROUPS = [
+    Arc28EventGroup(
+        group_name="dex", events=[SWAPPED, LIQUIDITY], process_for_app_ids=[DEX_APP_ID]
+    )
+]
+
+FILTERS = [
+    NamedTransactionFilter(name="payments", filter=TransactionFilter(type="pay", min_amount=1000)),
+    NamedTransactionFilter(name="accounts", filter=TransactionFilter(sender=ACCOUNTS[:20])),
+    NamedTransactionFilter(name="asset", filter=TransactionFilter(type="axfer", asset_id=9)),
+    NamedTransactionFilter(name="dex", filter=TransactionFilter(app_id=DEX_APP_ID)),
+    NamedTransactionFilter(
+        name="swaps",
+        filter=TransactionFilter(
+            arc28_events=[Arc28EventFilter(group_name="dex", event_name="Swapped")]
+        ),
+    ),
+    NamedTransactionFilter(
+        name="large-transfers",
+        filter=TransactionFilter(
+            balance_changes=[BalanceChangeFilter(asset_id=0, min_absolute_amount=4000)]
+        ),
+    ),
+    NamedTransactionFilter(name="heartbeats", filter=TransactionFilter(type="hb")),
+    NamedTransactionFilter(name="state-proofs", filter=TransactionFilter(type="stpf")),
+]
+"""A realistic mix of filters to benchmark the filtering stages with."""
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class StageResult:
+    scenario: str
+    stage: str
+    items: int
+    """The number of items (transactions, or compiled filters) processed in each run."""
+    seconds: float
+    """The fastest run's duration."""
+    peak_memory_bytes: int
+    """The peak memory allocated during a run."""
+
+    @property
+    def items_per_second(self) -> float:
+        return self.items / self.seconds if self.seconds else float("inf")
+
+
+def measure(
+    scenario: str, stage: str, items: int, run: Callable[[], object], *, repeat: int
+) -> StageResult:
+    """Time the fastest of `repeat` runs, then trace the memory of one more."""
+    # Tracing slows allocations down a lot, so runs are timed without it
+    timings = list[float]()
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        run()
+        _, peak_memory_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return StageResult(scenario, stage, items, min(timings), peak_memory_bytes)
+
+
+def run_scenario(scenario: str, rounds: int, *, repeat: int) -> list[StageResult]:
+    """Benchmark each stage of processing the blocks of a scenario."""
+    blocks = make_blocks(scenario, rounds)
+    transactions = count_transactions(blocks)
+    filters = compile_filters(FILTERS, ARC28_GROUPS)
+    generated_filters = compile_filters(FILTERS, ARC28_GROUPS, generate_code=True)
+    reordered_filters = compile_filters(
+        FILTERS, ARC28_GROUPS, generate_code=True, reorder_after=1000
+    )
+    assert filters.arc28_dispatch is not None
+    arc28_dispatch = filters.arc28_dispatch
+    subscribed = _map_txn_and_inner_txns_to_subscribed_txn(
+        [t for b in blocks for t in get_block_transactions(b.block)]
+    )
+    params = TransactionSubscriptionParams(
+        filters=FILTERS,
+        arc28_events=ARC28_GROUPS,
+        watermark=0,
+        current_round=rounds,
+        max_rounds_to_sync=rounds,
+        sync_behaviour="sync-oldest",
+    )
+
+    stages: dict[str, tuple[int, Callable[[], object]]] = {
+        "transform": (
+            transactions,
+            lambda: [t for b in blocks for t in get_block_transactions(b.block)],
+        ),
+        "transform-projected": (
+            transactions,
+            lambda: [t for b in blocks for t in get_block_transactions(b.block, fields=[])],
+        ),
+        "post-filters": (
+            len(subscribed),
+            lambda: [
+                f.name
+                for t in subscribed
+                for features in [_get_txn_features(t)]
+                for f in filters
+                if f.matches(t, features)
+            ],
+        ),
+        "post-filters-generated": (
+            len(subscribed),
+            lambda: [
+                f.name
+                for t in subscribed
+                for features in [_get_txn_features(t)]
+                for f in generated_filters
+                if f.matches(t, features)
+            ],
+        ),
+        # the first run measures and reorders the checks, so the fastest run is of the result
+        "post-filters-reordered": (
+            len(subscribed),
+            lambda: [
+                f.name
+                for t in subscribed
+                for features in [_get_txn_features(t)]
+                for f in reordered_filters
+                if f.matches(t, features)
+            ],
+        ),
+        "arc28-decoding": (
+            len(subscribed),
+            lambda: [_extract_arc28_events(t, arc28_dispatch) for t in subscribed],
+        ),
+        "balance-changes": (
+            len(subscribed),
+            lambda: [_extract_balance_changes_from_indexer_transaction(t) for t in subscribed],
+        ),
+        "end-to-end": (
+            transactions,
+            lambda: get_subscribed_transactions(
+                params,
+                FakeAlgod(blocks),  # type: ignore[arg-type]
+                compiled_filters=filters,
+            ),
+        ),
+    }
+    return [
+        measure(scenario, stage, items, run, repeat=repeat)
+        for stage, (items, run) in stages.items()
+    ]
+
+
+def run_compile_filters(*, repeat: int, iterations: int = 100) -> StageResult:
+    """Benchmark compiling the filters, which is done once per subscriber."""
+    return measure(
+        "-",
+        "compile-filters",
+        len(FILTERS) * iterations,
+        lambda: [compile_filters(FILTERS, ARC28_GROUPS) for _ in range(iterations)],
+        repeat=repeat,
+    )
+
+
+def find_regressions(
+    results: list[StageResult], baseline: list[StageResult], max_regression: float
+) -> list[str]:
+    """Describe each stage whose throughput dropped by more than `max_regression`."""
+    baseline_by_stage = {(r.scenario, r.stage): r for r in baseline}
+    regressions = list[str]()
+    for result in results:
+        previous = baseline_by_stage.get((result.scenario, result.stage))
+        if previous is None:
+            continue
+        change = result.items_per_second / previous.items_per_second - 1
+        if change < -max_regression:
+            regressions.append(
+                f"{result.scenario} / {result.stage}: {previous.items_per_second:,.0f}/s -> "
+                f"{result.items_per_second:,.0f}/s ({change:+.0%})"
+            )
+    return regressions
+
+
+def _format_table(results: list[StageResult]) -> str:
+    header = f"{'scenario':<24} {'stage':<22} {'items':>8} {'items/s':>12} {'peak MiB':>9}"
+    rows = [
+        f"{r.scenario:<24} {r.stage:<22} {r.items:>8} {r.items_per_second:>12,.0f} "
+        f"{r.peak_memory_bytes / 2**20:>9.1f}"
+        for r in results
+    ]
+    return "\n".join([header, "-" * len(header), *rows])
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument(
+        "--scenario", choices=sorted(SCENARIOS), action="append", help="default: all"
+    )
+    parser.add_argument("--rounds", type=int, default=3, help="blocks per scenario")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per stage")
+    parser.add_argument("--output", type=Path, help="write the results to a JSON file")
+    parser.add_argument("--baseline", type=Path, help="a JSON file of results to compare with")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.2,
+        help="fail if a stage's throughput is down by more than this fraction of the baseline",
+    )
+    args = parser.parse_args(argv)
+    # Don't log each block retrieval of the end-to-end runs
+    logging.getLogger("algokit_subscriber").setLevel(logging.WARNING)
+
+    results = [run_compile_filters(repeat=args.repeat)]
+    for scenario in args.scenario or SCENARIOS:
+        results.extend(run_scenario(scenario, args.rounds, repeat=args.repeat))
+    print(_format_table(results))
+
+    if args.output:
+        args.output.write_text(json.dumps([dataclasses.asdict(r) for r in results], indent=2))
+    if args.baseline:
+        baseline = [StageResult(**r) for r in json.loads(args.baseline.read_text())]
+        regressions = find_regressions(results, baseline, args.max_regression)
+        for regression in regressions:
+            print(f"Regression: {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
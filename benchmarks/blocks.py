@@ -0,0 +1,40 @@
+"""The benchmark scenarios, each a kind of synthetic block (see `synthetic.blocks`)."""
+
+from collections.abc import Callable
+
+from algokit_algod_client import models as algod
+
+from algokit_subscriber._transform import count_all_transactions
+from synthetic.blocks import (
+    dense_payment_block,
+    heartbeat_block,
+    inner_transaction_tree_block,
+    log_heavy_app_call_block,
+    state_proof_block,
+)
+
+BlockFactory = Callable[[int], algod.BlockResponse]
+
+
+SCENARIOS: dict[str, BlockFactory] = {
+    "dense-payments": dense_payment_block,
+    "inner-transaction-trees": inner_transaction_tree_block,
+    "log-heavy-app-calls": log_heavy_app_call_block,
+    "state-proofs": state_proof_block,
+    "heartbeats": heartbeat_block,
+}
+"""The block factory for each benchmark scenario, by name."""
+
+
+def make_blocks(scenario: str, rounds: int, first_round: int = 1) -> list[algod.BlockResponse]:
+    """Build the given number of consecutive blocks for a scenario."""
+    factory = SCENARIOS[scenario]
+    return [factory(round_) for round_ in range(first_round, first_round + rounds)]
+
+
+def count_transactions(blocks: list[algod.BlockResponse]) -> int:
+    """The number of transactions in the given blocks, including inner transactions."""
+    return sum(
+        count_all_transactions([t.signed_transaction for t in b.block.payset or []])
+        for b in blocks
+    )
@@ -1,5 +1,17 @@
+from algokit_subscriber._async_algod import AsyncAlgodClientAdapter, AsyncAlgodSource
+from algokit_subscriber._async_subscriber import AsyncAlgorandSubscriber
+from algokit_subscriber._block_cache import file_block_cache
+from algokit_subscriber._hub import AlgorandSubscriberHub
+from algokit_subscriber._indexer_checkpoint import file_indexer_checkpoint_store
+from algokit_subscriber._replay import record_api_calls, replay_api_calls
 from algokit_subscriber._subscriber import AlgorandSubscriber
-from algokit_subscriber._subscription import compile_filters, get_subscribed_transactions
+from algokit_subscriber._subscription import (
+    compile_filters,
+    get_subscribed_transactions,
+    get_subscribed_transactions_async,
+    iter_subscribed_transactions,
+    iter_subscribed_transactions_async,
+)
 from algokit_subscriber._watermark import in_memory_watermark
 from algokit_subscriber.types.arc28 import (
     Arc28Event,
@@ -14,17 +26,22 @@ from algokit_subscriber.types.subscription import (
     BalanceChangeFilter,
     BalanceChangeRole,
     BeforePollMetadata,
+    BlockCache,
     BlockMetadata,
     BlockRewards,
     BlockStateProofTracking,
     BlockUpgradeState,
     BlockUpgradeVote,
     CoreTransactionSubscriptionParams,
+    IndexerCheckpointStore,
+    IndexerPage,
     NamedTransactionFilter,
     ParticipationUpdates,
     SubscribedTransaction,
     SubscriberConfigFilter,
+    SubscriptionPollStats,
     SyncBehaviour,
+    TransactionFieldGroup,
     TransactionFilter,
     TransactionSubscriptionParams,
     TransactionSubscriptionResult,
@@ -34,14 +51,19 @@ from algokit_subscriber.types.subscription import (
 __all__ = [
     "AlgorandSubscriber",
     "AlgorandSubscriberConfig",
+    "AlgorandSubscriberHub",
     "Arc28Event",
     "Arc28EventArg",
     "Arc28EventFilter",
     "Arc28EventGroup",
+    "AsyncAlgodClientAdapter",
+    "AsyncAlgodSource",
+    "AsyncAlgorandSubscriber",
     "BalanceChange",
     "BalanceChangeFilter",
     "BalanceChangeRole",
     "BeforePollMetadata",
+    "BlockCache",
     "BlockMetadata",
     "BlockRewards",
     "BlockStateProofTracking",
@@ -49,16 +71,27 @@ __all__ = [
     "BlockUpgradeVote",
     "CoreTransactionSubscriptionParams",
     "EmittedArc28Event",
+    "IndexerCheckpointStore",
+    "IndexerPage",
     "NamedTransactionFilter",
     "ParticipationUpdates",
     "SubscribedTransaction",
     "SubscriberConfigFilter",
+    "SubscriptionPollStats",
     "SyncBehaviour",
+    "TransactionFieldGroup",
     "TransactionFilter",
     "TransactionSubscriptionParams",
     "TransactionSubscriptionResult",
     "WatermarkPersistence",
     "compile_filters",
+    "file_block_cache",
+    "file_indexer_checkpoint_store",
     "get_subscribed_transactions",
+    "get_subscribed_transactions_async",
     "in_memory_watermark",
+    "iter_subscribed_transactions",
+    "iter_subscribed_transactions_async",
+    "record_api_calls",
+    "replay_api_calls",
 ]
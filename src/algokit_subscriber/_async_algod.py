@@ -0,0 +1,47 @@
+import asyncio
+import typing
+
+from algokit_algod_client import AlgodClient
+from algokit_algod_client.models import BlockResponse, NodeStatusResponse
+
+
+class AsyncAlgodSource(typing.Protocol):
+    """
+    The algod operations used by `AsyncAlgorandSubscriber`, exposed as awaitables.
+
+    Implement this on top of an asyncio HTTP client to subscribe without any
+    threads, or use `AsyncAlgodClientAdapter` to wrap a blocking `AlgodClient`.
+    """
+
+    async def block(self, round_: int, /) -> BlockResponse:
+        """Get the block for the given round."""
+        ...
+
+    async def status(self) -> NodeStatusResponse:
+        """Get the current node status."""
+        ...
+
+    async def status_after_block(self, round_: int, /) -> NodeStatusResponse:
+        """Get the node status after waiting for a round after the given round."""
+        ...
+
+
+class AsyncAlgodClientAdapter:
+    """
+    Exposes a blocking `AlgodClient` as an `AsyncAlgodSource` by running each
+    request in the event loop's default executor.
+
+    :param client: The algod client to wrap
+    """
+
+    def __init__(self, client: AlgodClient):
+        self.client = client
+
+    async def block(self, round_: int, /) -> BlockResponse:
+        return await asyncio.to_thread(self.client.block, round_)
+
+    async def status(self) -> NodeStatusResponse:
+        return await asyncio.to_thread(self.client.status)
+
+    async def status_after_block(self, round_: int, /) -> NodeStatusResponse:
+        return await asyncio.to_thread(self.client.status_after_block, round_)
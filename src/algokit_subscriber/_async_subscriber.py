@@ -0,0 +1,246 @@
+import asyncio
+import inspect as inspect_
+import logging
+import time
+import typing
+from collections.abc import Awaitable, Callable
+
+from algokit_indexer_client import IndexerClient
+
+from algokit_subscriber._async_algod import AsyncAlgodSource
+from algokit_subscriber._subscriber import (
+    group_events_by_key,
+    group_filters_by_name,
+    log_poll_result,
+    poll_events,
+    subscription_params,
+    waits_for_next_block,
+)
+from algokit_subscriber._subscription import compile_filters, get_subscribed_transactions_async
+from algokit_subscriber.types.event_emitter import AsyncEventEmitter, AsyncEventListener
+from algokit_subscriber.types.subscription import (
+    AlgorandSubscriberConfig,
+    BeforePollMetadata,
+    TransactionSubscriptionResult,
+)
+
+logger = logging.getLogger(__package__)
+
+
+class AsyncAlgorandSubscriber:
+    """
+    An asyncio-native subscriber for Algorand transactions.
+
+    Behaves like `AlgorandSubscriber`, but polls without blocking the event loop so many
+    subscribers can share a single loop. Listeners can be plain functions or coroutine
+    functions; coroutines are awaited in registration order.
+
+    :param config: The subscriber configuration
+    :param algod: An async algod source e.g. `AsyncAlgodClientAdapter(algod_client)`
+    :param indexer_client: An (optional) indexer client; only needed if
+        `subscription.syncBehaviour` is `catchup-with-indexer`. Indexer catchup is run in
+        the event loop's default executor.
+    :raises ValueError: If `sync_behaviour` is ``"catchup-with-indexer"`` but no
+        `indexer_client` is provided.
+    """
+
+    def __init__(
+        self,
+        config: AlgorandSubscriberConfig,
+        algod: AsyncAlgodSource,
+        indexer_client: IndexerClient | None = None,
+    ):
+        self.algod = algod
+        self.indexer = indexer_client
+        self.config = config
+        self.event_emitter = AsyncEventEmitter().on("error", self.default_error_handler)
+        self.started = False
+        self.stop_requested = False
+        self._compiled_filters = compile_filters(config.filters, config.arc28_events)
+        self._filters_by_name = group_filters_by_name(config.filters)
+        if config.sync_behaviour == "catchup-with-indexer" and not indexer_client:
+            raise ValueError(
+                "Received sync behaviour of catchup-with-indexer, "
+                "but didn't receive an indexer instance."
+            )
+
+    def default_error_handler(
+        self,
+        error: typing.Any,  # noqa: ANN401
+        _str: str | None = None,
+    ) -> None:
+        raise error
+
+    async def poll_once(self) -> TransactionSubscriptionResult:
+        """
+        Execute a single subscription poll.
+        """
+        watermark = self.config.watermark_persistence.get() or 0
+        current_round = (await self.algod.status()).last_round
+
+        await self.event_emitter.emit(
+            "before:poll", BeforePollMetadata(watermark=watermark, current_round=current_round)
+        )
+
+        poll_result = await get_subscribed_transactions_async(
+            subscription=subscription_params(self.config, watermark, current_round),
+            algod=self.algod,
+            indexer=self.indexer,
+            compiled_filters=self._compiled_filters,
+        )
+
+        handler_start = time.time()
+        try:
+            if self.config.max_concurrent_handlers > 1:
+                await self._emit_concurrently(poll_result)
+            else:
+                for event_name, event in poll_events(self._filters_by_name, poll_result):
+                    await self.event_emitter.emit(event_name, event)
+
+            poll_result.stats.handler_seconds = time.time() - handler_start
+            await self.event_emitter.emit("poll", poll_result)
+        except Exception as e:
+            logger.info(f"Error processing event emittance: {e}")
+            raise e
+
+        self.config.watermark_persistence.set(poll_result.new_watermark)
+        return poll_result
+
+    async def _emit_concurrently(self, poll_result: TransactionSubscriptionResult) -> None:
+        """
+        Emit the events for a poll as concurrent tasks, one ordering key at a time per
+        task, and wait for them all to be handled.
+        """
+        semaphore = asyncio.Semaphore(self.config.max_concurrent_handlers)
+
+        async def emit_in_order(events: list[tuple[str, typing.Any]]) -> None:
+            async with semaphore:
+                for event_name, event in events:
+                    await self.event_emitter.emit(event_name, event)
+
+        # Each key's events are run in order, and a failure stops the rest of them
+        results = await asyncio.gather(
+            *(
+                emit_in_order(events)
+                for events in group_events_by_key(
+                    self._filters_by_name, poll_result, self.config.handler_ordering_key
+                )
+            ),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    async def start(  # noqa: C901, PLR0912
+        self,
+        inspect: Callable[[TransactionSubscriptionResult], Awaitable[None] | None] | None = None,
+        *,
+        suppress_log: bool = False,
+    ) -> None:
+        """
+        Start the subscriber in a loop until `stop` is called or the task is cancelled.
+
+        This is useful when running in the context of a long-running asyncio service.
+
+        If you want to inspect or log what happens under the covers you can
+        pass in an `inspect` callable (or coroutine function) that will be called
+        for each poll.
+        """
+        if self.started:
+            return
+        self.started = True
+        self.stop_requested = False
+
+        try:
+            while not self.stop_requested:
+                start_time = time.time()
+                try:
+                    result = await self.poll_once()
+                    duration_in_seconds = time.time() - start_time
+
+                    if not suppress_log:
+                        log_poll_result(result, duration_in_seconds)
+
+                    if inspect:
+                        inspected = inspect(result)
+                        if inspect_.isawaitable(inspected):
+                            await inspected
+
+                    # Check if there was a stop requested during one of the event handlers
+                    # or inspect
+                    if self.stop_requested:
+                        break  # type: ignore[unreachable]
+
+                    if waits_for_next_block(self.config, result):
+                        if not suppress_log:
+                            logger.info(f"Waiting for round {result.current_round + 1}")
+                        wait_start = time.time()
+                        await self.algod.status_after_block(result.current_round)
+                        if not suppress_log:
+                            logger.info(
+                                f"Waited for {time.time() - wait_start:.2f}s until next block"
+                            )
+                    else:
+                        sleep_time = self.config.frequency_in_seconds or 1
+                        if not suppress_log:
+                            logger.info(f"Sleeping for {sleep_time}s")
+                        await asyncio.sleep(sleep_time)
+                except Exception as e:
+                    await self.event_emitter.emit("error", e)
+        finally:
+            self.started = False
+
+    def stop(self, reason: str | None = None) -> None:
+        if not self.started:
+            return
+        self.stop_requested = True
+        logger.info(f"Stopping subscriber: {reason}")
+
+    def on(
+        self, filter_name: str, listener: AsyncEventListener[typing.Any]
+    ) -> "AsyncAlgorandSubscriber":
+        """
+        Register an event handler to run on every subscribed transaction
+        matching the given filter name.
+        """
+        if filter_name == "error":
+            raise ValueError("'error' is reserved, please supply a different filter_name.")
+        self.event_emitter.on(filter_name, listener)
+        return self
+
+    def on_batch(
+        self, filter_name: str, listener: AsyncEventListener[list[typing.Any]]
+    ) -> "AsyncAlgorandSubscriber":
+        """
+        Register an event handler to run on all subscribed transactions
+        matching the given filter name for each subscription poll.
+        """
+        self.event_emitter.on(f"batch:{filter_name}", listener)
+        return self
+
+    def on_before_poll(
+        self, listener: AsyncEventListener[BeforePollMetadata]
+    ) -> "AsyncAlgorandSubscriber":
+        """
+        Register an event handler to run before each subscription poll.
+        """
+        self.event_emitter.on("before:poll", listener)
+        return self
+
+    def on_poll(
+        self, listener: AsyncEventListener[TransactionSubscriptionResult]
+    ) -> "AsyncAlgorandSubscriber":
+        """
+        Register an event handler to run after each subscription poll.
+        """
+        self.event_emitter.on("poll", listener)
+        return self
+
+    def on_error(self, listener: AsyncEventListener[Exception]) -> "AsyncAlgorandSubscriber":
+        """
+        Register an event handler to run when an error occurs.
+        """
+        self.event_emitter.off("error", self.default_error_handler)
+        self.event_emitter.on("error", listener)
+        return self
@@ -1,34 +1,241 @@
+import asyncio
 import itertools
 import logging
 import time
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from algokit_algod_client import AlgodClient
 from algokit_algod_client.models import BlockResponse
 
+from algokit_subscriber._async_algod import AsyncAlgodSource
+from algokit_subscriber.types.subscription import BlockCache
+
 logger = logging.getLogger(__package__)
 
 
-def get_blocks_bulk(start_round: int, max_round: int, client: AlgodClient) -> list[BlockResponse]:
+def get_blocks_bulk(
+    start_round: int,
+    max_round: int,
+    client: AlgodClient,
+    *,
+    max_concurrent_requests: int = 1,
+    cache: BlockCache | None = None,
+) -> list[BlockResponse]:
     """
     Retrieves blocks in bulk (30 at a time) between the given round numbers.
     :param start_round: Starting round to fetch
     :param max_round: Max round to fetch (inclusive)
     :param client: The algod client
+    :param max_concurrent_requests: The maximum number of block requests to have in flight
+        at once; blocks are always returned in round order
+    :param cache: An optional block cache; cached rounds aren't requested from algod and
+        retrieved rounds are added to it
     :return: The blocks
     """
-    # Grab 30 at a time to not overload the node
-    blocks = []
-    for chunk in itertools.batched(range(start_round, max_round + 1), 30):
-        logger.info(f"Retrieving {len(chunk)} blocks from round {chunk[0]} via algod")
+    return [
+        block
+        for chunk in iter_blocks_bulk(
+            start_round,
+            max_round,
+            client,
+            max_concurrent_requests=max_concurrent_requests,
+            cache=cache,
+        )
+        for block in chunk
+    ]
+
+
+def iter_blocks_bulk(  # noqa: PLR0913
+    start_round: int,
+    max_round: int,
+    client: AlgodClient,
+    *,
+    max_concurrent_requests: int = 1,
+    prefetch: bool = False,
+    cache: BlockCache | None = None,
+) -> Iterator[list[BlockResponse]]:
+    """
+    Retrieves blocks in bulk between the given round numbers, yielding them
+    30 at a time in round order.
+    :param start_round: Starting round to fetch
+    :param max_round: Max round to fetch (inclusive)
+    :param client: The algod client
+    :param max_concurrent_requests: The maximum number of block requests to have in flight
+        at once; blocks are always returned in round order
+    :param prefetch: Whether to retrieve the next 30 blocks in the background while the
+        caller is processing the current ones
+    :param cache: An optional block cache; cached rounds aren't requested from algod and
+        retrieved rounds are added to it
+    :yields: Chunks of (up to 30) blocks, in round order
+    :ytype: list[BlockResponse]
+    """
+    block_executor = (
+        ThreadPoolExecutor(max_workers=max_concurrent_requests, thread_name_prefix="algod-block")
+        if max_concurrent_requests > 1
+        else None
+    )
+    prefetch_executor = (
+        ThreadPoolExecutor(max_workers=1, thread_name_prefix="algod-prefetch")
+        if prefetch
+        else None
+    )
+
+    def fetch(chunk: tuple[int, ...]) -> list[BlockResponse]:
+        cached = _get_cached_blocks(cache, chunk)
+        missing = [
+            round_num for round_num, block in zip(chunk, cached, strict=True) if block is None
+        ]
+        if not missing:
+            return [block for block in cached if block is not None]
+
+        logger.info(f"Retrieving {len(missing)} blocks from round {missing[0]} via algod")
         start_time = time.time()
 
-        for round_num in chunk:
-            response = client.block(round_num)
-            blocks.append(response)
+        if block_executor is None:
+            retrieved = [client.block(round_num) for round_num in missing]
+        else:
+            # map yields in submission order and re-raises the first failure
+            retrieved = list(block_executor.map(client.block, missing))
 
         elapsed_time = time.time() - start_time
         logger.debug(
-            f"Retrieved {len(chunk)} blocks from round {chunk[0]} via algod in {elapsed_time:.2f}s"
+            f"Retrieved {len(missing)} blocks from round {missing[0]} via algod "
+            f"in {elapsed_time:.2f}s"
         )
+        return _merge_retrieved_blocks(cache, missing, cached, retrieved)
+
+    # Grab 30 at a time to not overload the node
+    chunks = itertools.batched(range(start_round, max_round + 1), 30)
+    try:
+        if prefetch_executor is None:
+            for chunk in chunks:
+                yield fetch(chunk)
+        else:
+
+            def submit_next() -> Future[list[BlockResponse]] | None:
+                next_chunk = next(chunks, None)
+                return prefetch_executor.submit(fetch, next_chunk) if next_chunk else None
+
+            pending = submit_next()
+            while pending is not None:
+                blocks = pending.result()
+                pending = submit_next()
+                yield blocks
+    finally:
+        # don't block the caller on a prefetch it no longer needs (e.g. after an error)
+        if prefetch_executor is not None:
+            prefetch_executor.shutdown(wait=False, cancel_futures=True)
+        if block_executor is not None:
+            block_executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def iter_blocks_bulk_async(  # noqa: PLR0913
+    start_round: int,
+    max_round: int,
+    client: AsyncAlgodSource,
+    *,
+    max_concurrent_requests: int = 1,
+    prefetch: bool = False,
+    cache: BlockCache | None = None,
+) -> AsyncIterator[list[BlockResponse]]:
+    """
+    Retrieves blocks in bulk between the given round numbers, yielding them
+    30 at a time in round order.
+    :param start_round: Starting round to fetch
+    :param max_round: Max round to fetch (inclusive)
+    :param client: The async algod source
+    :param max_concurrent_requests: The maximum number of block requests to have in flight
+        at once; blocks are always returned in round order
+    :param prefetch: Whether to start retrieving the next 30 blocks while the caller
+        is processing the current ones
+    :param cache: An optional block cache; cached rounds aren't requested from algod and
+        retrieved rounds are added to it
+    :yields: Chunks of (up to 30) blocks, in round order
+    :ytype: list[BlockResponse]
+    """
+    semaphore = asyncio.Semaphore(max(max_concurrent_requests, 1))
+
+    # Grab 30 at a time to not overload the node
+    chunks = itertools.batched(range(start_round, max_round + 1), 30)
+
+    def submit_next() -> asyncio.Task[list[BlockResponse]] | None:
+        next_chunk = next(chunks, None)
+        if not next_chunk:
+            return None
+        return asyncio.ensure_future(_fetch_chunk_async(client, next_chunk, semaphore, cache))
+
+    if not prefetch:
+        for chunk in chunks:
+            yield await _fetch_chunk_async(client, chunk, semaphore, cache)
+    else:
+        pending = submit_next()
+        try:
+            while pending is not None:
+                blocks = await pending
+                pending = submit_next()
+                yield blocks
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+
+async def _fetch_chunk_async(
+    client: AsyncAlgodSource,
+    chunk: tuple[int, ...],
+    semaphore: asyncio.Semaphore,
+    cache: BlockCache | None,
+) -> list[BlockResponse]:
+    cached = _get_cached_blocks(cache, chunk)
+    missing = [round_num for round_num, block in zip(chunk, cached, strict=True) if block is None]
+    if not missing:
+        return [block for block in cached if block is not None]
+
+    logger.info(f"Retrieving {len(missing)} blocks from round {missing[0]} via algod")
+    start_time = time.time()
+
+    async def fetch_block(round_num: int) -> BlockResponse:
+        async with semaphore:
+            return await client.block(round_num)
+
+    tasks = [asyncio.ensure_future(fetch_block(round_num)) for round_num in missing]
+    try:
+        # await in round order so the first failing round is the one re-raised
+        retrieved = [await task for task in tasks]
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+            elif not task.cancelled():
+                task.exception()  # mark any other failures as retrieved
+
+    elapsed_time = time.time() - start_time
+    logger.debug(
+        f"Retrieved {len(missing)} blocks from round {missing[0]} via algod in {elapsed_time:.2f}s"
+    )
+    return _merge_retrieved_blocks(cache, missing, cached, retrieved)
+
+
+def _get_cached_blocks(
+    cache: BlockCache | None, chunk: tuple[int, ...]
+) -> list[BlockResponse | None]:
+    if cache is None:
+        return [None] * len(chunk)
+    cached = [cache.get(round_num) for round_num in chunk]
+    hits = sum(1 for block in cached if block is not None)
+    if hits:
+        logger.debug(f"Retrieved {hits} blocks from round {chunk[0]} via the block cache")
+    return cached
+
 
-    return blocks
+def _merge_retrieved_blocks(
+    cache: BlockCache | None,
+    missing: list[int],
+    cached: list[BlockResponse | None],
+    retrieved: list[BlockResponse],
+) -> list[BlockResponse]:
+    if cache is not None:
+        for round_num, block in zip(missing, retrieved, strict=True):
+            cache.put(round_num, block)
+    retrieved_blocks = iter(retrieved)
+    return [next(retrieved_blocks) if block is None else block for block in cached]
@@ -0,0 +1,195 @@
+import logging
+import mmap
+import re
+import struct
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+import msgpack
+from algokit_algod_client.models import BlockResponse
+from algokit_common import from_wire, to_wire
+
+import algokit_subscriber.types.subscription as sub
+
+logger = logging.getLogger(__package__)
+
+# Each record in a segment is a fixed header followed by the msgpack encoded block
+_RECORD_HEADER = struct.Struct("<QI")  # round, payload length
+# Each segment has a sidecar index of fixed size entries so it can be loaded without
+# scanning the (much larger) segment itself
+_INDEX_ENTRY = struct.Struct("<QQI")  # round, record offset, payload length
+_SEGMENT_NAME = re.compile(r"^(\d{8})\.seg$")
+
+
+@dataclass(slots=True)
+class _Segment:
+    number: int
+    data_path: Path
+    index_path: Path
+    size: int
+    rounds: list[int]
+    map: mmap.mmap | None = None
+
+    def close(self) -> None:
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+
+
+@dataclass(frozen=True, slots=True)
+class _Location:
+    segment: int
+    offset: int
+    length: int
+
+
+class _FileBlockCache:
+    def __init__(self, directory: Path, max_size_bytes: int, segment_size_bytes: int):
+        if segment_size_bytes > max_size_bytes:
+            raise ValueError("segment_size_bytes must not be larger than max_size_bytes")
+        self._directory = directory
+        self._max_size_bytes = max_size_bytes
+        self._segment_size_bytes = segment_size_bytes
+        self._lock = threading.Lock()
+        self._segments: dict[int, _Segment] = {}
+        self._index: dict[int, _Location] = {}
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._load()
+
+    def _load(self) -> None:
+        numbers = sorted(
+            int(match.group(1))
+            for path in self._directory.iterdir()
+            if (match := _SEGMENT_NAME.match(path.name))
+        )
+        for number in numbers:
+            segment = self._new_segment(number)
+            data_size = segment.data_path.stat().st_size
+            index_bytes = segment.index_path.read_bytes() if segment.index_path.exists() else b""
+            # Ignore a trailing partial index entry or a record that never fully reached
+            # the segment, e.g. after a crash mid-write
+            whole_entries = len(index_bytes) - len(index_bytes) % _INDEX_ENTRY.size
+            for round_, offset, length in _INDEX_ENTRY.iter_unpack(index_bytes[:whole_entries]):
+                end = offset + _RECORD_HEADER.size + length
+                if end > data_size:
+                    break
+                self._index[round_] = _Location(number, offset, length)
+                segment.rounds.append(round_)
+                segment.size = end
+            # Drop anything after the last complete record so new records are appended
+            # where the index expects them
+            if data_size > segment.size:
+                with segment.data_path.open("r+b") as f:
+                    f.truncate(segment.size)
+            if len(index_bytes) > len(segment.rounds) * _INDEX_ENTRY.size:
+                with segment.index_path.open("r+b") as f:
+                    f.truncate(len(segment.rounds) * _INDEX_ENTRY.size)
+            self._segments[number] = segment
+        logger.debug(
+            f"Loaded {len(self._index)} cached blocks from {len(self._segments)} segments "
+            f"in {self._directory}"
+        )
+
+    def _new_segment(self, number: int) -> _Segment:
+        return _Segment(
+            number=number,
+            data_path=self._directory / f"{number:08d}.seg",
+            index_path=self._directory / f"{number:08d}.idx",
+            size=0,
+            rounds=[],
+        )
+
+    def get(self, round_: int) -> BlockResponse | None:
+        with self._lock:
+            location = self._index.get(round_)
+            if location is None:
+                return None
+            payload = self._read(location, round_)
+        if payload is None:
+            return None
+        return from_wire(BlockResponse, msgpack.unpackb(payload, raw=False, strict_map_key=False))
+
+    def _read(self, location: _Location, round_: int) -> bytes | None:
+        segment = self._segments[location.segment]
+        end = location.offset + _RECORD_HEADER.size + location.length
+        if segment.map is None or len(segment.map) < end:
+            # The active segment grows after it's mapped, so remap it to cover new records
+            segment.close()
+            with segment.data_path.open("rb") as f:
+                segment.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        stored_round, length = _RECORD_HEADER.unpack_from(segment.map, location.offset)
+        if stored_round != round_ or length != location.length:
+            logger.warning(f"Ignoring corrupt cache entry for round {round_} in {self._directory}")
+            del self._index[round_]
+            return None
+        start = location.offset + _RECORD_HEADER.size
+        return segment.map[start:end]
+
+    def put(self, round_: int, block: BlockResponse) -> None:
+        payload = msgpack.packb(to_wire(block), use_bin_type=True)
+        with self._lock:
+            if round_ in self._index:
+                return
+            segment = self._active_segment(_RECORD_HEADER.size + len(payload))
+            offset = segment.size
+            with segment.data_path.open("ab") as f:
+                f.write(_RECORD_HEADER.pack(round_, len(payload)))
+                f.write(payload)
+            # Only index the record once it's fully written
+            with segment.index_path.open("ab") as f:
+                f.write(_INDEX_ENTRY.pack(round_, offset, len(payload)))
+            segment.size = offset + _RECORD_HEADER.size + len(payload)
+            segment.rounds.append(round_)
+            self._index[round_] = _Location(segment.number, offset, len(payload))
+            self._evict()
+
+    def _active_segment(self, record_size: int) -> _Segment:
+        number = max(self._segments, default=0)
+        segment = self._segments.get(number)
+        if segment is None or (
+            segment.size > 0 and segment.size + record_size > self._segment_size_bytes
+        ):
+            segment = self._new_segment(number + 1)
+            self._segments[segment.number] = segment
+        return segment
+
+    def _evict(self) -> None:
+        # Segments are evicted whole, oldest first; the active segment is always kept
+        total_size = sum(segment.size for segment in self._segments.values())
+        for number in sorted(self._segments)[:-1]:
+            if total_size <= self._max_size_bytes:
+                break
+            segment = self._segments.pop(number)
+            for round_ in segment.rounds:
+                if (location := self._index.get(round_)) and location.segment == number:
+                    del self._index[round_]
+            segment.close()
+            segment.data_path.unlink(missing_ok=True)
+            segment.index_path.unlink(missing_ok=True)
+            total_size -= segment.size
+            logger.debug(f"Evicted {len(segment.rounds)} cached blocks from {segment.data_path}")
+
+
+def file_block_cache(
+    directory: str | Path,
+    *,
+    max_size_bytes: int = 10 * 1024**3,
+    segment_size_bytes: int = 64 * 1024**2,
+) -> sub.BlockCache:
+    """
+    A persistent on-disk block cache.
+
+    Blocks are appended to segment files alongside a round index and read back via
+    memory-mapped files. Once the cache exceeds `max_size_bytes` the oldest segments are
+    deleted. The cache can be shared across subscribers in the same process, but not
+    across processes.
+
+    :param directory: The directory to store the cache in; it's created if it doesn't exist
+    :param max_size_bytes: The maximum total size of the cache; defaults to 10 GiB
+    :param segment_size_bytes: The size at which a new segment is started; this is also
+        the granularity of eviction; defaults to 64 MiB
+    :return: The block cache
+    """
+    cache = _FileBlockCache(Path(directory), max_size_bytes, segment_size_bytes)
+    return sub.BlockCache(get=cache.get, put=cache.put)
@@ -0,0 +1,200 @@
+import contextlib
+import logging
+import threading
+import time
+import typing
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future
+
+from algokit_algod_client import AlgodClient
+from algokit_algod_client.models import BlockResponse
+from algokit_indexer_client import IndexerClient
+
+from algokit_subscriber._subscriber import AlgorandSubscriber
+from algokit_subscriber.types.subscription import (
+    AlgorandSubscriberConfig,
+    TransactionSubscriptionResult,
+)
+
+logger = logging.getLogger(__package__)
+
+
+class _SharedAlgod:
+    """
+    Wraps an algod client so the subscribers of a hub share its requests: each block
+    is retrieved once (concurrent requests for the same round wait on the same
+    request) and kept for other subscribers, and the status can be pinned for the
+    duration of a hub poll.
+    """
+
+    def __init__(self, algod: AlgodClient, max_cached_blocks: int):
+        self._algod = algod
+        self._max_cached_blocks = max_cached_blocks
+        self._lock = threading.Lock()
+        self._blocks = OrderedDict[int, BlockResponse]()
+        self._in_flight: dict[int, Future[BlockResponse]] = {}
+        self._status: typing.Any = None
+
+    @contextlib.contextmanager
+    def pinned_status(self) -> Iterator[typing.Any]:
+        """Retrieve the status once and serve it to every subscriber in this context."""
+        self._status = self._algod.status()
+        try:
+            yield self._status
+        finally:
+            self._status = None
+
+    def status(self) -> typing.Any:  # noqa: ANN401
+        return self._status if self._status is not None else self._algod.status()
+
+    def status_after_block(self, round_: int) -> typing.Any:  # noqa: ANN401
+        return self._algod.status_after_block(round_)
+
+    def block(self, round_: int) -> BlockResponse:
+        with self._lock:
+            block = self._blocks.get(round_)
+            if block is not None:
+                self._blocks.move_to_end(round_)
+                return block
+            future = self._in_flight.get(round_)
+            is_owner = future is None
+            if future is None:
+                future = self._in_flight[round_] = Future()
+        if not is_owner:
+            return future.result()
+
+        try:
+            block = self._algod.block(round_)
+        except BaseException as e:
+            with self._lock:
+                del self._in_flight[round_]
+            future.set_exception(e)
+            raise
+        with self._lock:
+            # Cached in the same step as the request finishes, so there's no moment a
+            # caller would find neither and retrieve the block again
+            del self._in_flight[round_]
+            self._blocks[round_] = block
+            # Keep the most recently used blocks, which are the ones lagging
+            # subscribers are about to catch up through
+            while len(self._blocks) > self._max_cached_blocks:
+                self._blocks.popitem(last=False)
+        future.set_result(block)
+        return block
+
+
+class AlgorandSubscriberHub:
+    """
+    Runs many subscriber configurations against one algod client, retrieving each
+    round from algod once for all of them.
+
+    Each subscription is a regular `AlgorandSubscriber` with its own filters, mappers,
+    handlers and watermark persistence. The hub polls them in turn against a single
+    algod status, and blocks retrieved for one subscriber are served from a shared
+    in-memory cache to the others, including any that have fallen behind.
+
+    :param algod_client: An algod client
+    :param indexer_client: An (optional) indexer client; only needed if a subscription's
+        `sync_behaviour` is `catchup-with-indexer`
+    :param max_cached_blocks: The maximum number of blocks to keep in memory for other
+        subscribers; defaults to 1000
+    :param frequency_in_seconds: The frequency to poll for new blocks in seconds;
+        defaults to 1s
+    :param wait_for_block_when_at_tip: Whether to wait via algod
+        `/status/wait-for-block-after` endpoint when every subscription is at the tip
+        of the chain
+    """
+
+    def __init__(
+        self,
+        algod_client: AlgodClient,
+        indexer_client: IndexerClient | None = None,
+        *,
+        max_cached_blocks: int = 1000,
+        frequency_in_seconds: float | None = None,
+        wait_for_block_when_at_tip: bool | None = None,
+    ):
+        self._algod = _SharedAlgod(algod_client, max_cached_blocks)
+        self.indexer = indexer_client
+        self.frequency_in_seconds = frequency_in_seconds
+        self.wait_for_block_when_at_tip = wait_for_block_when_at_tip
+        self.subscribers = list[AlgorandSubscriber]()
+        self.started = False
+        self.stop_requested = False
+
+    def subscribe(self, config: AlgorandSubscriberConfig) -> AlgorandSubscriber:
+        """
+        Register a subscription with the hub.
+
+        :param config: The subscriber configuration
+        :return: The subscriber to register handlers on; it's polled by the hub
+        """
+        # The shared algod serves the subset of the algod client the subscriber uses
+        subscriber = AlgorandSubscriber(
+            config, typing.cast("AlgodClient", self._algod), self.indexer
+        )
+        self.subscribers.append(subscriber)
+        return subscriber
+
+    def poll_once(self) -> list[TransactionSubscriptionResult]:
+        """
+        Execute a single subscription poll for each subscription, in registration order.
+
+        :return: The result of each subscription's poll
+        """
+        with self._algod.pinned_status():
+            return [subscriber.poll_once() for subscriber in self.subscribers]
+
+    def start(
+        self,
+        inspect: Callable[[list[TransactionSubscriptionResult]], None] | None = None,
+        *,
+        suppress_log: bool = False,
+    ) -> None:
+        """
+        Start polling every subscription in a loop until `stop` is called.
+
+        An error in one subscription's poll is emitted to that subscriber's error
+        handlers; by default it's re-raised, which stops the hub.
+        """
+        if self.started:
+            return
+        self.started = True
+        self.stop_requested = False
+
+        while not self.stop_requested:
+            start_time = time.time()
+            results = list[TransactionSubscriptionResult]()
+            with self._algod.pinned_status() as status:
+                for subscriber in self.subscribers:
+                    try:
+                        results.append(subscriber.poll_once())
+                    except Exception as e:
+                        subscriber.event_emitter.emit("error", e)
+            if not suppress_log:
+                logger.info(
+                    f"Polled {len(self.subscribers)} subscriptions in "
+                    f"{time.time() - start_time:.2f}s"
+                )
+            if inspect:
+                inspect(results)
+
+            # Check if there was a stop requested during one of the event handlers or inspect
+            if self.stop_requested:
+                break  # type: ignore[unreachable]
+
+            at_tip = len(results) == len(self.subscribers) and all(
+                result.new_watermark >= status.last_round for result in results
+            )
+            if at_tip and self.wait_for_block_when_at_tip:
+                self._algod.status_after_block(status.last_round)
+            else:
+                time.sleep(self.frequency_in_seconds or 1)
+        self.started = False
+
+    def stop(self, reason: str | None = None) -> None:
+        if not self.started:
+            return
+        self.stop_requested = True
+        logger.info(f"Stopping subscriber hub: {reason}")
@@ -0,0 +1,83 @@
+import hashlib
+import logging
+import pickle
+import struct
+import threading
+from pathlib import Path
+
+import algokit_subscriber.types.subscription as sub
+
+logger = logging.getLogger(__package__)
+
+# Each record in a checkpoint file is a fixed header followed by the encoded page
+_RECORD_HEADER = struct.Struct("<I")  # payload length
+
+
+class _FileIndexerCheckpointStore:
+    def __init__(self, directory: Path):
+        self._directory = directory
+        self._lock = threading.Lock()
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        # Keys contain filter names so they're hashed to get a safe file name
+        return self._directory / f"{hashlib.sha256(key.encode()).hexdigest()}.ckpt"
+
+    def load(self, key: str) -> list[sub.IndexerPage]:
+        path = self._path(key)
+        with self._lock:
+            data = path.read_bytes() if path.exists() else b""
+            pages = list[sub.IndexerPage]()
+            offset = 0
+            while offset + _RECORD_HEADER.size <= len(data):
+                (length,) = _RECORD_HEADER.unpack_from(data, offset)
+                end = offset + _RECORD_HEADER.size + length
+                if end > len(data):
+                    break
+                pages.append(_decode_page(data[offset + _RECORD_HEADER.size : end]))
+                offset = end
+            # Drop a page that never fully reached the file, e.g. after a crash mid-write,
+            # so new pages are appended after the last complete one
+            if offset < len(data):
+                logger.warning(f"Ignoring a partially written indexer checkpoint in {path}")
+                with path.open("r+b") as f:
+                    f.truncate(offset)
+        return pages
+
+    def append(self, key: str, page: sub.IndexerPage) -> None:
+        payload = _encode_page(page)
+        with self._lock, self._path(key).open("ab") as f:
+            f.write(_RECORD_HEADER.pack(len(payload)))
+            f.write(payload)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._path(key).unlink(missing_ok=True)
+
+
+def _encode_page(page: sub.IndexerPage) -> bytes:
+    # Pages are pickled rather than wire encoded since the wire encoding omits zero
+    # values that indexer does return (e.g. an intra round offset of 0)
+    return pickle.dumps(page, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _decode_page(payload: bytes) -> sub.IndexerPage:
+    page = pickle.loads(payload)
+    assert isinstance(page, sub.IndexerPage)
+    return page
+
+
+def file_indexer_checkpoint_store(directory: str | Path) -> sub.IndexerCheckpointStore:
+    """
+    A persistent on-disk store for indexer catchup checkpoints.
+
+    Each search's pages are appended to their own file as they're consumed, and the
+    file is deleted once the catchup completes. The store can be shared across
+    subscribers in the same process, but not across processes. Checkpoints are
+    pickled, so the directory should only be writable by the subscriber.
+
+    :param directory: The directory to store checkpoints in; it's created if it doesn't exist
+    :return: The checkpoint store
+    """
+    store = _FileIndexerCheckpointStore(Path(directory))
+    return sub.IndexerCheckpointStore(load=store.load, append=store.append, delete=store.delete)
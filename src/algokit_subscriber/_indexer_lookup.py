@@ -1,9 +1,15 @@
+import dataclasses
+import logging
 import typing
 from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
 
 from algokit_indexer_client import IndexerClient, models
 
 from algokit_subscriber._internal_types import IndexerTransactionFilter
+from algokit_subscriber.types.subscription import IndexerCheckpointStore, IndexerPage
+
+logger = logging.getLogger(__package__)
 
 DEFAULT_INDEXER_MAX_API_RESOURCES_PER_ACCOUNT = 1000
 _TItem = typing.TypeVar("_TItem")
@@ -65,30 +71,42 @@ def lookup_asset_holdings(  # noqa: PLR0913
     return execute_paginated_request(request)
 
 
-def search_transactions(
+def search_transactions(  # noqa: PLR0913
     indexer: IndexerClient,
     transaction_filter: IndexerTransactionFilter,
     *,
     min_round: int,
     max_round: int,
     pagination_limit: int = DEFAULT_INDEXER_MAX_API_RESOURCES_PER_ACCOUNT,
+    executor: Executor | None = None,
+    max_concurrent_requests: int = 1,
+    checkpoint_store: IndexerCheckpointStore | None = None,
+    checkpoint_key: str = "",
+    on_page: Callable[[], None] | None = None,
 ) -> list[models.Transaction]:
     """
     Allows transactions to be searched for the given criteria.
+
+    If a checkpoint store is given each page is recorded in it under the checkpoint key
+    as it's consumed, and a search that was interrupted continues from its last page
+    (see `execute_checkpointed_request`). Otherwise, if an executor is given the round
+    range is split into sub-ranges that are paginated concurrently (see
+    `execute_round_sharded_request`). The results are the same either way. `on_page`
+    is called after each page is received from indexer.
     """
 
-    def request(next_token: str | None = None) -> _TItemsAndPage:
+    def request(round_range: RoundRange) -> _TItemsAndPage:
         response = indexer.search_for_transactions(
             limit=pagination_limit,
-            next_=next_token,
+            next_=round_range.next_token,
             note_prefix=transaction_filter.note_prefix,
             tx_type=transaction_filter.tx_type,
             sig_type=transaction_filter.sig_type,
             group_id=transaction_filter.group_id,
             txid=transaction_filter.txid,
             round_=transaction_filter.round_,
-            min_round=min_round,
-            max_round=max_round,
+            min_round=round_range.min_round,
+            max_round=round_range.max_round,
             asset_id=transaction_filter.asset_id,
             before_time=transaction_filter.before_time,
             after_time=transaction_filter.after_time,
@@ -100,9 +118,190 @@ def search_transactions(
             rekey_to=transaction_filter.rekey_to,
             application_id=transaction_filter.application_id,
         )
+        if on_page is not None:
+            on_page()
         return response.transactions, response.next_token
 
-    return execute_paginated_request(request)
+    if checkpoint_store is not None:
+        return execute_checkpointed_request(
+            request, RoundRange(min_round, max_round), checkpoint_store, checkpoint_key
+        )
+    if executor is None or min_round >= max_round or transaction_filter.round_ is not None:
+        return execute_paginated_request(
+            lambda next_token: request(RoundRange(min_round, max_round, next_token))
+        )
+    return execute_round_sharded_request(
+        request,
+        RoundRange(min_round, max_round),
+        executor,
+        shards=max_concurrent_requests,
+        page_size=pagination_limit,
+        # indexer returns transactions newest to oldest when searching by address
+        descending=transaction_filter.address is not None,
+    )
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class RoundRange:
+    """An (inclusive) range of rounds to search, optionally continuing from a page."""
+
+    min_round: int
+    max_round: int
+    next_token: str | None = None
+    page: int = 0
+
+
+def execute_round_sharded_request(  # noqa: C901, PLR0912, PLR0913
+    request_callback: Callable[[RoundRange], tuple[list[models.Transaction], str | None]],
+    round_range: RoundRange,
+    executor: Executor,
+    *,
+    shards: int,
+    page_size: int,
+    descending: bool = False,
+) -> list[models.Transaction]:
+    """
+    Executes a paginated transaction request by splitting the round range into
+    sub-ranges that are requested concurrently, and returns all results in the order
+    they would have been returned by paginating through the whole range.
+
+    The split adapts to the density of results: a sub-range that returns a full page
+    keeps the rounds the page covers completely and subdivides the rest. A single round
+    that doesn't fit in a page is paginated through as normal.
+
+    :param request_callback: Requests a page of transactions for a round range
+    :param round_range: The round range to search
+    :param executor: The executor to make requests on
+    :param shards: The number of sub-ranges to initially split the round range into
+    :param page_size: The page size of requests i.e. the size of a full page
+    :param descending: Whether results are returned newest to oldest
+    :return: The transactions
+    """
+    # The results for each sub-range along with where they go in the result
+    pieces = list[tuple[int, int, list[models.Transaction]]]()
+    pending = dict[Future[tuple[list[models.Transaction], str | None]], RoundRange]()
+
+    def submit(sub_range: RoundRange) -> None:
+        pending[executor.submit(request_callback, sub_range)] = sub_range
+
+    def submit_split(min_round: int, max_round: int, parts: int) -> None:
+        if max_round < min_round:
+            return
+        parts = min(parts, max_round - min_round + 1)
+        size, remainder = divmod(max_round - min_round + 1, parts)
+        for part in range(parts):
+            start = min_round + part * size + min(part, remainder)
+            submit(RoundRange(start, start + size + (part < remainder) - 1))
+
+    submit_split(round_range.min_round, round_range.max_round, shards)
+    try:
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                sub_range = pending.pop(future)
+                items, next_token = future.result()
+                if not items:
+                    continue
+                if len(items) < page_size or not next_token:
+                    pieces.append((sub_range.min_round, sub_range.page, items))
+                    continue
+                if sub_range.min_round == sub_range.max_round:
+                    # A single busy round can only be paginated through
+                    pieces.append((sub_range.min_round, sub_range.page, items))
+                    submit(
+                        dataclasses.replace(
+                            sub_range, next_token=next_token, page=sub_range.page + 1
+                        )
+                    )
+                    continue
+
+                # The page may end part way through its last round, so only keep the
+                # rounds before it and search the rest again
+                boundary = items[-1].confirmed_round or 0
+                if descending:
+                    complete = [t for t in items if (t.confirmed_round or 0) > boundary]
+                    piece_min_round = boundary + 1
+                    rest_min_round, rest_max_round = sub_range.min_round, boundary
+                else:
+                    complete = [t for t in items if (t.confirmed_round or 0) < boundary]
+                    piece_min_round = sub_range.min_round
+                    rest_min_round, rest_max_round = boundary, sub_range.max_round
+                if complete:
+                    pieces.append((piece_min_round, 0, complete))
+                    submit_split(rest_min_round, rest_max_round, 2)
+                else:
+                    # The whole page is the boundary round, so it's the round's first
+                    # page and the round is paginated through on its own from there
+                    pieces.append((boundary, 0, items))
+                    submit(RoundRange(boundary, boundary, next_token=next_token, page=1))
+                    if descending:
+                        submit_split(rest_min_round, boundary - 1, 2)
+                    else:
+                        submit_split(boundary + 1, rest_max_round, 2)
+    finally:
+        for future in pending:
+            future.cancel()
+
+    pieces.sort(key=lambda piece: (-piece[0] if descending else piece[0], piece[1]))
+    return [t for *_, items in pieces for t in items]
+
+
+def execute_checkpointed_request(
+    request_callback: Callable[[RoundRange], tuple[list[models.Transaction], str | None]],
+    round_range: RoundRange,
+    checkpoint_store: IndexerCheckpointStore,
+    checkpoint_key: str,
+) -> list[models.Transaction]:
+    """
+    Executes a paginated transaction request, recording each page in the checkpoint
+    store as it's consumed and continuing from the last recorded page if there is one.
+
+    The round range can grow between attempts (e.g. as the chain advances); the
+    recorded pages are kept and the new rounds are searched afterwards. Recorded pages
+    beyond the round range are discarded.
+
+    :param request_callback: Requests a page of transactions for a round range
+    :param round_range: The round range to search
+    :param checkpoint_store: The store to record pages in
+    :param checkpoint_key: The key that identifies this search in the store
+    :return: The transactions
+    """
+    pages = checkpoint_store.load(checkpoint_key)
+    if pages and (
+        pages[0].min_round != round_range.min_round or pages[-1].max_round > round_range.max_round
+    ):
+        logger.debug(f"Discarding indexer checkpoint {checkpoint_key} for a different range")
+        checkpoint_store.delete(checkpoint_key)
+        pages = []
+    elif pages:
+        logger.debug(
+            f"Resuming indexer search {checkpoint_key} after {len(pages)} pages up to "
+            f"round {pages[-1].max_round}"
+        )
+
+    results = [t for page in pages for t in page.transactions]
+    last_page = pages[-1] if pages else None
+    while True:
+        if last_page is None:
+            next_range = RoundRange(round_range.min_round, round_range.max_round)
+        elif last_page.next_token is not None:
+            next_range = RoundRange(last_page.min_round, last_page.max_round, last_page.next_token)
+        elif last_page.max_round < round_range.max_round:
+            next_range = RoundRange(last_page.max_round + 1, round_range.max_round)
+        else:
+            break
+        items, next_token = request_callback(next_range)
+        last_page = IndexerPage(
+            min_round=next_range.min_round,
+            max_round=next_range.max_round,
+            # Like `execute_paginated_request`, an empty page is the last page
+            next_token=next_token if items else None,
+            transactions=items,
+        )
+        checkpoint_store.append(checkpoint_key, last_page)
+        results.extend(items)
+
+    return results
 
 
 def execute_paginated_request(
@@ -1,9 +1,13 @@
-from collections.abc import Callable
+from collections.abc import Callable, Hashable, Iterable
 from dataclasses import dataclass
 from datetime import datetime
 
+from algokit_abi.abi import ABIType
+from algokit_algod_client.models import SignedTxnWithAD
 from algokit_indexer_client.models import Transaction
 
+from algokit_subscriber.types.arc28 import Arc28Event, Arc28EventGroup
+
 
 @dataclass
 class IndexerTransactionFilter:
@@ -27,6 +31,17 @@ class IndexerTransactionFilter:
     max_amount: int | None = None
 
 
+TransactionFeatures = tuple[
+    str, str, str | None, int | None, int | None, int, str | None, bytes | None, bytes
+]
+"""
+The fields of a transaction that compiled filters check, extracted once per transaction
+and shared by all of the filters: the type, sender, receiver, app ID, asset ID, amount,
+on complete, method selector and note, in that order. A plain tuple, since it's created
+for every transaction and that's several times cheaper than a named tuple.
+"""
+
+
 @dataclass
 class CompiledFilter:
     """A pre-compiled filter for efficient transaction matching."""
@@ -39,3 +54,98 @@ class CompiledFilter:
 
     post_filter: Callable[[Transaction], bool]
     """The post-filter function for in-memory filtering."""
+
+    algod_pre_filter: Callable[[SignedTxnWithAD], bool] | None = None
+    """
+    A cheap check on a raw algod transaction that is `False` only if the post-filter
+    can't match it, so it can be skipped before being transformed; `None` if the
+    filter has no cheap check.
+    """
+
+    index_key: tuple[str, frozenset[Hashable]] | None = None
+    """
+    The name of an indexed transaction field along with the values of it that the
+    post-filter requires; `None` if the filter can't be indexed.
+    """
+
+    reads_transaction_id: bool = True
+    """
+    Whether the post-filter may read the transaction ID, so it must be computed before
+    filtering rather than only for matching transactions; only set it to `False` if the
+    post-filter is known not to read it.
+    """
+
+    predicate: Callable[[Transaction, TransactionFeatures], bool] | None = None
+    """
+    The post-filter as a check on a transaction along with its features, so when testing
+    several filters the features are only extracted once; `None` if there's only the
+    post-filter.
+    """
+
+    def matches(self, transaction: Transaction, features: TransactionFeatures) -> bool:
+        """Whether the post-filter matches the given transaction, which has the given features."""
+        if self.predicate is None:
+            return self.post_filter(transaction)
+        return self.predicate(transaction, features)
+
+
+@dataclass(frozen=True, slots=True)
+class Arc28EventHandler:
+    """An ARC-28 event definition to decode a log with, along with its group."""
+
+    group_position: int
+    """The position of the group in the ARC-28 event groups."""
+
+    group: Arc28EventGroup
+    """The group the event belongs to."""
+
+    event: Arc28Event
+    """The event definition."""
+
+    decoder: ABIType
+    """The ABI type to decode the event data with."""
+
+
+@dataclass(slots=True)
+class Arc28EventDispatch:
+    """ARC-28 event groups compiled into a lookup of event definitions by log prefix."""
+
+    groups: list[Arc28EventGroup]
+    """The ARC-28 event groups that were compiled."""
+
+    group_filters: list[Callable[[Transaction], bool]]
+    """Whether to process each group's events for a transaction, by group position."""
+
+    handlers_by_prefix: dict[bytes, list[Arc28EventHandler]]
+    """The event definitions for each 4-byte event prefix, in group and then event order."""
+
+
+class CompiledFilters(list[CompiledFilter]):
+    """
+    Compiled filters along with an inverted index of them by the transaction field
+    values they require, so each transaction only needs to be tested against the
+    filters that could match it.
+    """
+
+    def __init__(
+        self,
+        filters: Iterable[CompiledFilter] = (),
+        arc28_dispatch: Arc28EventDispatch | None = None,
+    ) -> None:
+        super().__init__(filters)
+        self.arc28_dispatch = arc28_dispatch
+        """The compiled ARC-28 event groups the filters were compiled with, if any."""
+        self.by_field = dict[str, dict[Hashable, list[int]]]()
+        """The positions of the indexed filters by field name and then field value."""
+        self.residual = list[int]()
+        """The positions of the filters that can't be indexed."""
+        self.reads_transaction_ids = any(f.reads_transaction_id for f in self)
+        """Whether any of the filters may read transaction IDs."""
+        for position, compiled_filter in enumerate(self):
+            if compiled_filter.index_key is None:
+                self.residual.append(position)
+                continue
+            field_name, values = compiled_filter.index_key
+            field_index = self.by_field.setdefault(field_name, {})
+            for value in values:
+                field_index.setdefault(value, []).append(position)
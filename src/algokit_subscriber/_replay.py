@@ -0,0 +1,201 @@
+import contextlib
+import gzip
+import logging
+import pickle
+import random
+import struct
+import threading
+import time
+import typing
+from collections.abc import Hashable, Iterator
+from pathlib import Path
+
+from algokit_algod_client import AlgodClient
+from algokit_algod_client.models import BlockResponse, NodeStatusResponse
+from algokit_indexer_client import IndexerClient
+from algokit_indexer_client.models import TransactionsResponse
+
+logger = logging.getLogger(__package__)
+
+# Each record in a recording is a fixed header followed by the encoded request and response
+_RECORD_HEADER = struct.Struct("<I")  # payload length
+
+_RequestKey = tuple[str, Hashable]
+
+
+def _search_key(kwargs: dict[str, typing.Any]) -> _RequestKey:
+    # Searches are identified by their arguments, in any order
+    return "search_for_transactions", tuple(sorted(kwargs.items()))
+
+
+class _Recorder:
+    def __init__(self, path: Path):
+        self._lock = threading.Lock()
+        self._file = gzip.open(path, "wb")  # noqa: SIM115
+        self.count = 0
+
+    def record(self, key: _RequestKey, response: object) -> None:
+        # Responses are pickled rather than wire encoded since the wire encoding omits
+        # zero values, and replays need to return exactly what was received
+        payload = pickle.dumps((key, response), protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._file.write(_RECORD_HEADER.pack(len(payload)))
+            self._file.write(payload)
+            self.count += 1
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+class _RecordingAlgod:
+    def __init__(self, algod: AlgodClient, recorder: _Recorder):
+        self._algod = algod
+        self._recorder = recorder
+
+    def block(self, round_: int) -> BlockResponse:
+        response = self._algod.block(round_)
+        self._recorder.record(("block", round_), response)
+        return response
+
+    def status(self) -> NodeStatusResponse:
+        response = self._algod.status()
+        self._recorder.record(("status", None), response)
+        return response
+
+    def status_after_block(self, round_: int) -> NodeStatusResponse:
+        response = self._algod.status_after_block(round_)
+        self._recorder.record(("status_after_block", round_), response)
+        return response
+
+
+class _RecordingIndexer:
+    def __init__(self, indexer: IndexerClient, recorder: _Recorder):
+        self._indexer = indexer
+        self._recorder = recorder
+
+    def search_for_transactions(self, **kwargs: typing.Any) -> TransactionsResponse:
+        response = self._indexer.search_for_transactions(**kwargs)
+        self._recorder.record(_search_key(kwargs), response)
+        return response
+
+
+@contextlib.contextmanager
+def record_api_calls(
+    path: str | Path, algod: AlgodClient, indexer: IndexerClient | None = None
+) -> Iterator[tuple[AlgodClient, IndexerClient | None]]:
+    """
+    Record the algod and indexer responses a subscription receives so they can be
+    replayed with `replay_api_calls`.
+
+    Every `block`, `status` and `status_after_block` response from algod, and every
+    `search_for_transactions` response from indexer, made via the clients this yields
+    is appended to a compressed recording file at the given path, which is replaced if
+    it exists. The recording is complete once the context exits. Responses are pickled,
+    so only replay recordings from a trusted source.
+
+    :param path: The file to record to
+    :param algod: The algod client to record
+    :param indexer: The (optional) indexer client to record
+    :yields: The algod and indexer clients to subscribe with
+    :ytype: tuple[AlgodClient, IndexerClient | None]
+    """
+    recorder = _Recorder(Path(path))
+    try:
+        yield (
+            typing.cast("AlgodClient", _RecordingAlgod(algod, recorder)),
+            typing.cast("IndexerClient", _RecordingIndexer(indexer, recorder))
+            if indexer is not None
+            else None,
+        )
+    finally:
+        recorder.close()
+        logger.debug(f"Recorded {recorder.count} responses to {path}")
+
+
+class _Replay:
+    def __init__(self, path: Path, latency: float, jitter: float, seed: int | None):
+        self._latency = latency
+        self._jitter = jitter
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._responses = dict[_RequestKey, list[object]]()
+        self._served = dict[_RequestKey, int]()
+        with gzip.open(path, "rb") as f:
+            data = f.read()
+        offset = 0
+        while offset < len(data):
+            (length,) = _RECORD_HEADER.unpack_from(data, offset)
+            start = offset + _RECORD_HEADER.size
+            key, response = pickle.loads(data[start : start + length])
+            self._responses.setdefault(key, []).append(response)
+            offset = start + length
+
+    def respond(self, key: _RequestKey) -> typing.Any:  # noqa: ANN401
+        """
+        Serve the responses recorded for a request in the order they were received, then
+        keep serving the last one (e.g. the status once the recording's tip is reached).
+        """
+        with self._lock:
+            responses = self._responses.get(key)
+            if not responses:
+                raise LookupError(f"No response was recorded for {key[0]} {key[1]!r}")
+            served = self._served.get(key, 0)
+            self._served[key] = served + 1
+            delay = self._latency + self._random.uniform(0, self._jitter)
+        if delay > 0:
+            time.sleep(delay)
+        return responses[min(served, len(responses) - 1)]
+
+
+class _ReplayAlgod:
+    def __init__(self, replay: _Replay):
+        self._replay = replay
+
+    def block(self, round_: int) -> BlockResponse:
+        return typing.cast("BlockResponse", self._replay.respond(("block", round_)))
+
+    def status(self) -> NodeStatusResponse:
+        return typing.cast("NodeStatusResponse", self._replay.respond(("status", None)))
+
+    def status_after_block(self, round_: int) -> NodeStatusResponse:
+        return typing.cast(
+            "NodeStatusResponse", self._replay.respond(("status_after_block", round_))
+        )
+
+
+class _ReplayIndexer:
+    def __init__(self, replay: _Replay):
+        self._replay = replay
+
+    def search_for_transactions(self, **kwargs: typing.Any) -> TransactionsResponse:
+        return typing.cast("TransactionsResponse", self._replay.respond(_search_key(kwargs)))
+
+
+def replay_api_calls(
+    path: str | Path,
+    *,
+    latency: float = 0.0,
+    jitter: float = 0.0,
+    seed: int | None = None,
+) -> tuple[AlgodClient, IndexerClient]:
+    """
+    Clients that serve the responses recorded by `record_api_calls` without a network,
+    e.g. for deterministic load tests and profiling.
+
+    Each request is answered with the responses recorded for it in the order they were
+    received, repeating the last one once they run out; a request that wasn't recorded
+    raises a `LookupError`.
+
+    :param path: The recording file
+    :param latency: The time to wait (in seconds) before each response
+    :param jitter: The maximum extra time to wait (in seconds), chosen at random for
+        each response
+    :param seed: The seed for the jitter, to make it repeatable
+    :return: The algod and indexer clients to subscribe with
+    """
+    replay = _Replay(Path(path), latency, jitter, seed)
+    return (
+        typing.cast("AlgodClient", _ReplayAlgod(replay)),
+        typing.cast("IndexerClient", _ReplayIndexer(replay)),
+    )
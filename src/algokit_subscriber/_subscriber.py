@@ -1,8 +1,10 @@
 import logging
+import threading
 import time
 import typing
 from collections import defaultdict
-from collections.abc import Callable
+from collections.abc import Callable, Hashable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor, wait
 
 from algokit_algod_client import AlgodClient
 from algokit_indexer_client import IndexerClient
@@ -45,10 +47,9 @@ class AlgorandSubscriber:
         self.started = False
         self.stop_requested = False
         self._compiled_filters = compile_filters(config.filters, config.arc28_events)
-        # Group filters by name to handle OR-style filters with same name
-        self._filters_by_name = defaultdict[str, list[SubscriberConfigFilter]](list)
-        for filter_ in self.config.filters:
-            self._filters_by_name[filter_.name].append(filter_)
+        self._filters_by_name = group_filters_by_name(config.filters)
+        self._handler_executor: ThreadPoolExecutor | None = None
+        self._handler_executor_lock = threading.Lock()
         if config.sync_behaviour == "catchup-with-indexer" and not indexer_client:
             raise ValueError(
                 "Received sync behaviour of catchup-with-indexer, "
@@ -74,37 +75,21 @@ class AlgorandSubscriber:
         )
 
         poll_result = get_subscribed_transactions(
-            subscription=TransactionSubscriptionParams(
-                watermark=watermark,
-                current_round=current_round,
-                filters=self.config.filters,
-                arc28_events=self.config.arc28_events,
-                max_rounds_to_sync=self.config.max_rounds_to_sync,
-                max_indexer_rounds_to_sync=self.config.max_indexer_rounds_to_sync,
-                sync_behaviour=self.config.sync_behaviour,
-            ),
+            subscription=subscription_params(self.config, watermark, current_round),
             algod=self.algod,
             indexer=self.indexer,
             compiled_filters=self._compiled_filters,
         )
 
+        handler_start = time.time()
         try:
-            for filter_name, filters in self._filters_by_name.items():
-                # Use mapper from first filter with this name
-                mapper = filters[0].mapper
-                matched_transactions = [
-                    t
-                    for t in poll_result.subscribed_transactions
-                    if filter_name in (t.filters_matched or [])
-                ]
-                mapped_transactions = (
-                    mapper(matched_transactions) if mapper else matched_transactions
-                )
-
-                self.event_emitter.emit(f"batch:{filter_name}", mapped_transactions)
-                for transaction in mapped_transactions:
-                    self.event_emitter.emit(filter_name, transaction)
+            if self.config.max_concurrent_handlers > 1:
+                self._emit_concurrently(poll_result)
+            else:
+                for event_name, event in poll_events(self._filters_by_name, poll_result):
+                    self.event_emitter.emit(event_name, event)
 
+            poll_result.stats.handler_seconds = time.time() - handler_start
             self.event_emitter.emit("poll", poll_result)
         except Exception as e:
             logger.info(f"Error processing event emittance: {e}")
@@ -113,6 +98,37 @@ class AlgorandSubscriber:
         self.config.watermark_persistence.set(poll_result.new_watermark)
         return poll_result
 
+    def _emit_concurrently(self, poll_result: TransactionSubscriptionResult) -> None:
+        """
+        Emit the events for a poll on the subscriber's thread pool, one ordering key at a
+        time per thread, and wait for them all to be handled.
+        """
+        event_groups = group_events_by_key(
+            self._filters_by_name, poll_result, self.config.handler_ordering_key
+        )
+        if not event_groups:
+            return
+
+        def emit_in_order(events: list[tuple[str, typing.Any]]) -> None:
+            for event_name, event in events:
+                self.event_emitter.emit(event_name, event)
+
+        # The pool is kept for the subscriber's lifetime, until `stop` shuts it down
+        with self._handler_executor_lock:
+            if self._handler_executor is None:
+                self._handler_executor = ThreadPoolExecutor(
+                    max_workers=self.config.max_concurrent_handlers,
+                    thread_name_prefix="subscriber-handler",
+                )
+            # Each key's events are run in order, and a failure stops the rest of them
+            futures = [
+                self._handler_executor.submit(emit_in_order, events) for events in event_groups
+            ]
+        wait(futures)
+        for future in futures:
+            if (error := future.exception()) is not None:
+                raise error
+
     def start(  # noqa: C901
         self,
         inspect: Callable[[TransactionSubscriptionResult], None] | None = None,
@@ -140,12 +156,7 @@ class AlgorandSubscriber:
                 duration_in_seconds = time.time() - start_time
 
                 if not suppress_log:
-                    logger.info(f"Subscription poll completed in {duration_in_seconds:.2f}s")
-                    logger.info(f"Current round: {result.current_round}")
-                    logger.info(f"Starting watermark: {result.starting_watermark}")
-                    logger.info(f"New watermark: {result.new_watermark}")
-                    logger.info(f"Synced round range: {result.synced_round_range}")
-                    logger.info(f"Subscribed transactions: {len(result.subscribed_transactions)}")
+                    log_poll_result(result, duration_in_seconds)
 
                 if inspect:
                     inspect(result)
@@ -154,26 +165,32 @@ class AlgorandSubscriber:
                 if self.stop_requested:
                     break  # type: ignore[unreachable]
 
-                if result.current_round > result.new_watermark or not (
-                    self.config.wait_for_block_when_at_tip or False
-                ):
-                    sleep_time = self.config.frequency_in_seconds or 1
+                if waits_for_next_block(self.config, result):
                     if not suppress_log:
-                        logger.info(f"Sleeping for {sleep_time}s")
-                    time.sleep(sleep_time)
-                else:
-                    next_round = result.current_round + 1
-                    if not suppress_log:
-                        logger.info(f"Waiting for round {next_round}")
+                        logger.info(f"Waiting for round {result.current_round + 1}")
                     wait_start = time.time()
                     self.algod.status_after_block(result.current_round)
                     if not suppress_log:
                         logger.info(f"Waited for {time.time() - wait_start:.2f}s until next block")
+                else:
+                    sleep_time = self.config.frequency_in_seconds or 1
+                    if not suppress_log:
+                        logger.info(f"Sleeping for {sleep_time}s")
+                    time.sleep(sleep_time)
             except Exception as e:
                 self.event_emitter.emit("error", e)
         self.started = False
 
     def stop(self, reason: str | None = None) -> None:
+        """
+        Stop the subscriber after the current poll, and shut down the thread pool that
+        handlers are run on when `max_concurrent_handlers` is more than 1.
+        """
+        with self._handler_executor_lock:
+            executor, self._handler_executor = self._handler_executor, None
+        if executor is not None:
+            # Don't wait for it, as this may be called from one of its handlers
+            executor.shutdown(wait=False)
         if not self.started:
             return
         self.stop_requested = True
@@ -222,3 +239,106 @@ class AlgorandSubscriber:
         self.event_emitter.off("error", self.default_error_handler)
         self.event_emitter.on("error", listener)
         return self
+
+
+def group_filters_by_name(
+    filters: Sequence[SubscriberConfigFilter],
+) -> dict[str, list[SubscriberConfigFilter]]:
+    """Group filters by name to handle OR-style filters with same name."""
+    filters_by_name = defaultdict[str, list[SubscriberConfigFilter]](list)
+    for filter_ in filters:
+        filters_by_name[filter_.name].append(filter_)
+    return filters_by_name
+
+
+def subscription_params(
+    config: AlgorandSubscriberConfig, watermark: int, current_round: int
+) -> TransactionSubscriptionParams:
+    """Create the parameters for a single subscription poll from the subscriber config."""
+    return TransactionSubscriptionParams(
+        watermark=watermark,
+        current_round=current_round,
+        filters=config.filters,
+        arc28_events=config.arc28_events,
+        transaction_fields=config.transaction_fields,
+        max_rounds_to_sync=config.max_rounds_to_sync,
+        max_indexer_rounds_to_sync=config.max_indexer_rounds_to_sync,
+        max_concurrent_indexer_requests=config.max_concurrent_indexer_requests,
+        split_indexer_round_ranges=config.split_indexer_round_ranges,
+        indexer_checkpoint_store=config.indexer_checkpoint_store,
+        max_concurrent_block_requests=config.max_concurrent_block_requests,
+        prefetch_blocks=config.prefetch_blocks,
+        block_cache=config.block_cache,
+        sync_behaviour=config.sync_behaviour,
+    )
+
+
+def group_events_by_key(
+    filters_by_name: dict[str, list[SubscriberConfigFilter]],
+    poll_result: TransactionSubscriptionResult,
+    ordering_key: Callable[[str, typing.Any], Hashable] | None,
+) -> list[list[tuple[str, typing.Any]]]:
+    """
+    Group the (event name, event) pairs to emit for a poll by their ordering key,
+    keeping the order they're emitted in within each group.
+    """
+    events_by_key = defaultdict[Hashable, list[tuple[str, typing.Any]]](list)
+    for filter_name, mapped_transactions in map_transactions_by_filter_name(
+        filters_by_name, poll_result
+    ):
+        events_by_key[filter_name].append((f"batch:{filter_name}", mapped_transactions))
+        for transaction in mapped_transactions:
+            key = ordering_key(filter_name, transaction) if ordering_key else filter_name
+            events_by_key[key].append((filter_name, transaction))
+    return list(events_by_key.values())
+
+
+def poll_events(
+    filters_by_name: dict[str, list[SubscriberConfigFilter]],
+    poll_result: TransactionSubscriptionResult,
+) -> Iterator[tuple[str, typing.Any]]:
+    """
+    Yield the (event name, event) pairs to emit for a poll, in the order they're emitted
+    when handlers aren't run concurrently: each filter name's batch and then each of
+    its transactions.
+    """
+    for filter_name, mapped_transactions in map_transactions_by_filter_name(
+        filters_by_name, poll_result
+    ):
+        yield f"batch:{filter_name}", mapped_transactions
+        for transaction in mapped_transactions:
+            yield filter_name, transaction
+
+
+def log_poll_result(result: TransactionSubscriptionResult, duration_in_seconds: float) -> None:
+    """Log the outcome of a subscription poll."""
+    logger.info(f"Subscription poll completed in {duration_in_seconds:.2f}s")
+    logger.info(f"Current round: {result.current_round}")
+    logger.info(f"Starting watermark: {result.starting_watermark}")
+    logger.info(f"New watermark: {result.new_watermark}")
+    logger.info(f"Synced round range: {result.synced_round_range}")
+    logger.info(f"Subscribed transactions: {len(result.subscribed_transactions)}")
+
+
+def waits_for_next_block(
+    config: AlgorandSubscriberConfig, result: TransactionSubscriptionResult
+) -> bool:
+    """
+    Whether a subscriber should wait for the next block after a poll, rather than sleep
+    for `frequency_in_seconds`: only when it's caught up and configured to.
+    """
+    return result.current_round <= result.new_watermark and bool(config.wait_for_block_when_at_tip)
+
+
+def map_transactions_by_filter_name(
+    filters_by_name: dict[str, list[SubscriberConfigFilter]],
+    poll_result: TransactionSubscriptionResult,
+) -> Iterator[tuple[str, list[typing.Any]]]:
+    """
+    Yield the (mapped) transactions matched by each filter name in the given poll result.
+    """
+    for filter_name, filters in filters_by_name.items():
+        # Use mapper from first filter with this name
+        mapper = filters[0].mapper
+        matched_transactions = list(poll_result.transactions_by_filter.get(filter_name, ()))
+        yield filter_name, mapper(matched_transactions) if mapper else matched_transactions
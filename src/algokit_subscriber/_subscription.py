@@ -1,23 +1,50 @@
+import asyncio
 import base64
+import contextlib
+import contextvars
 import dataclasses
+import hashlib
 import itertools
 import logging
+import math
+import operator
+import threading
 import time
 import typing
 from collections import defaultdict
-from collections.abc import Callable, Iterable, Iterator, Sequence
+from collections.abc import (
+    AsyncIterator,
+    Callable,
+    Hashable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from algokit_algod_client import AlgodClient
+from algokit_algod_client.models import BlockResponse, SignedTxnWithAD
 from algokit_indexer_client import IndexerClient
 from algokit_indexer_client.models import Transaction
+from algokit_transact import Transaction as AlgodTransaction
 
-from algokit_subscriber._block import get_blocks_bulk
+from algokit_subscriber._async_algod import AsyncAlgodSource
+from algokit_subscriber._block import iter_blocks_bulk, iter_blocks_bulk_async
 from algokit_subscriber._indexer_lookup import search_transactions
-from algokit_subscriber._internal_types import CompiledFilter, IndexerTransactionFilter
+from algokit_subscriber._internal_types import (
+    Arc28EventDispatch,
+    Arc28EventHandler,
+    CompiledFilter,
+    CompiledFilters,
+    IndexerTransactionFilter,
+    TransactionFeatures,
+)
 from algokit_subscriber._transform import (
     block_data_to_block_metadata,
-    get_block_transactions,
+    iter_block_transactions,
+    project_transaction,
 )
 from algokit_subscriber._utils import method_selector_bytes
 from algokit_subscriber.types.arc28 import (
@@ -31,8 +58,11 @@ from algokit_subscriber.types.subscription import (
     BalanceChangeFilter,
     BalanceChangeRole,
     BlockMetadata,
+    IndexerCheckpointStore,
     NamedTransactionFilter,
     SubscribedTransaction,
+    SubscriptionPollStats,
+    TransactionFieldGroup,
     TransactionFilter,
     TransactionSubscriptionParams,
     TransactionSubscriptionResult,
@@ -44,29 +74,89 @@ logger = logging.getLogger(__package__)
 
 
 _Filter = Callable[[Transaction], bool]
+_FeatureFilter = Callable[[Transaction, TransactionFeatures], bool]
+_AlgodFilter = Callable[[SignedTxnWithAD], bool]
 
 
 def compile_filters(
     filters: Sequence[NamedTransactionFilter],
     arc28_events: list[Arc28EventGroup] | None = None,
-) -> list[CompiledFilter]:
+    *,
+    generate_code: bool = False,
+    reorder_after: int | None = None,
+) -> CompiledFilters:
     """
     Pre-compile transaction filters for efficient reuse across multiple subscription polls.
     Can be optionally provided to get_subscribed_transactions.
 
     :param filters: The transaction filters to compile
     :param arc28_events: Optional ARC-28 event group definitions
-    :return: A list of compiled filters
+    :param generate_code: Whether to generate (and compile) the source of a single
+        function with all of the checks of each filter inlined, which is faster to apply,
+        rather than combining a function per check; filters match the same transactions
+        either way
+    :param reorder_after: When generating code, optionally the number of transactions to
+        measure how long each check of a filter's transaction fields takes and how often it
+        passes against, before generating the filter again with the cheapest and most
+        selective checks first; by default the checks are kept in order. Checks that call
+        functions from the filter (e.g. `custom_filter`) always run last, in order
+    :return: A list of compiled filters, indexed by the transaction fields they require
     """
     arc28_groups = arc28_events or []
-    compiled = []
-    for named_filter in filters:
-        pre_filter = _create_indexer_pre_filter(named_filter.filter)
-        post_filter = _create_transaction_filter(named_filter.filter, arc28_groups)
-        compiled.append(
-            CompiledFilter(name=named_filter.name, pre_filter=pre_filter, post_filter=post_filter)
+    return CompiledFilters(
+        [
+            _compile_filter(
+                named_filter,
+                arc28_groups,
+                generate_code=generate_code,
+                reorder_after=reorder_after,
+            )
+            for named_filter in filters
+        ],
+        _compile_arc28_event_dispatch(arc28_groups),
+    )
+
+
+def _compile_filter(
+    named_filter: NamedTransactionFilter,
+    arc28_groups: list[Arc28EventGroup],
+    *,
+    generate_code: bool,
+    reorder_after: int | None,
+) -> CompiledFilter:
+    def use_reordered(predicate: _FeatureFilter) -> None:
+        compiled_filter.predicate = predicate
+
+    if generate_code:
+        predicate = _generate_transaction_filter(
+            named_filter.filter,
+            arc28_groups,
+            reorder_after=reorder_after,
+            on_reordered=use_reordered,
         )
-    return compiled
+    else:
+        predicate = _create_transaction_filter(named_filter.filter, arc28_groups)
+    compiled_filter = CompiledFilter(
+        name=named_filter.name,
+        pre_filter=_create_indexer_pre_filter(named_filter.filter),
+        post_filter=_with_txn_features(predicate),
+        algod_pre_filter=_create_algod_pre_filter(named_filter.filter),
+        index_key=_get_filter_index_key(named_filter.filter),
+        reads_transaction_id=_reads_transaction_id(named_filter.filter, arc28_groups),
+        predicate=predicate,
+    )
+    return compiled_filter
+
+
+def _resolve_compiled_filters(
+    subscription: TransactionSubscriptionParams,
+    compiled_filters: list[CompiledFilter] | None,
+) -> CompiledFilters:
+    if not compiled_filters:
+        return compile_filters(subscription.filters, subscription.arc28_events)
+    if isinstance(compiled_filters, CompiledFilters):
+        return compiled_filters
+    return CompiledFilters(compiled_filters)
 
 
 _MAX_SAFE_JSON_INTEGER = 2**53 - 1
@@ -131,7 +221,7 @@ def _create_indexer_pre_filter(
     return args
 
 
-def get_subscribed_transactions(  # noqa: C901, PLR0912, PLR0915
+def get_subscribed_transactions(
     subscription: TransactionSubscriptionParams,
     algod: AlgodClient,
     indexer: IndexerClient | None = None,
@@ -142,42 +232,235 @@ def get_subscribed_transactions(  # noqa: C901, PLR0912, PLR0915
     Executes a single pull/poll to subscribe to transactions on the configured Algorand
     blockchain for the given subscription context.
 
+    A `ValueError` is raised if `sync_behaviour` is ``"fail"`` and the watermark is more
+    than `max_rounds_to_sync` behind the current round, or if it's
+    ``"catchup-with-indexer"`` and no indexer is given.
+
     :param subscription: The subscription parameters
     :param algod: The Algod client
     :param indexer: The Indexer client (optional)
     :param compiled_filters: Pre-compiled filters to use. If not provided, filters will be
         compiled from subscription.filters. For repeated polling, pre-compile once using
         compile_filters() and pass here for better performance.
-    :raises ValueError: If `sync_behaviour` is ``"fail"`` and the watermark is more
-        than `max_rounds_to_sync` behind the current round.
     :return: The transaction subscription result
     """
-    watermark = subscription.watermark
-    max_rounds_to_sync = subscription.max_rounds_to_sync
-    sync_behaviour = subscription.sync_behaviour
     current_round = subscription.current_round or algod.status().last_round
-    block_metadata: list[BlockMetadata] | None = None
 
     # Nothing to sync we at the tip of the chain already
-    if current_round <= watermark:
-        return TransactionSubscriptionResult(
-            current_round=current_round,
-            starting_watermark=watermark,
-            new_watermark=watermark,
-            subscribed_transactions=[],
-            synced_round_range=(current_round, current_round),
-            block_metadata=[],
+    if current_round <= subscription.watermark:
+        return _empty_result(subscription.watermark, current_round)
+
+    batches = list(
+        iter_subscribed_transactions(
+            dataclasses.replace(subscription, current_round=current_round),
+            algod,
+            indexer,
+            compiled_filters=compiled_filters,
         )
+    )
+    return _merge_results(subscription.watermark, current_round, batches)
 
-    algod_sync_from_round_number = watermark + 1
-    start_round = algod_sync_from_round_number
-    end_round = current_round
-    catchup_transactions = list[SubscribedTransaction]()
-    start = time.time()
-    skip_algod_sync = False
 
-    arc28_groups = subscription.arc28_events or []
-    filters = compiled_filters or compile_filters(subscription.filters, subscription.arc28_events)
+def iter_subscribed_transactions(
+    subscription: TransactionSubscriptionParams,
+    algod: AlgodClient,
+    indexer: IndexerClient | None = None,
+    *,
+    compiled_filters: list[CompiledFilter] | None = None,
+) -> Iterator[TransactionSubscriptionResult]:
+    """
+    Executes a single pull/poll like `get_subscribed_transactions`, but yields the
+    result in batches as it goes: one for the rounds caught up via indexer (if any),
+    then one for each chunk of (up to 30) rounds synced from algod.
+
+    Each batch's `new_watermark` is the last round it covers, so it can be persisted as
+    soon as the batch has been processed, and the blocks of a chunk aren't kept once
+    it's been yielded. Together the batches contain the same transactions and block
+    metadata, in the same order, as the result of `get_subscribed_transactions`.
+    Nothing is yielded if the watermark is already at the tip of the chain. Any
+    `ValueError` from planning the poll is raised when iteration starts.
+
+    :param subscription: The subscription parameters
+    :param algod: The Algod client
+    :param indexer: The Indexer client (optional)
+    :param compiled_filters: Pre-compiled filters to use. If not provided, filters will be
+        compiled from subscription.filters.
+    :yields: Results, each covering the rounds after the previous one
+    :ytype: TransactionSubscriptionResult
+    """
+    current_round = subscription.current_round or algod.status().last_round
+
+    # Nothing to sync if we're at the tip of the chain already
+    if current_round > subscription.watermark:
+        poll = _Poll(
+            subscription, current_round, compiled_filters, has_indexer=indexer is not None
+        )
+        if indexer and poll.catches_up_with_indexer:
+            yield poll.catch_up_with_indexer(indexer)
+
+        if poll.syncs_with_algod():
+            stage_end = time.time()
+            # Blocks are processed 30 at a time so that, when prefetching, the next
+            # chunk is retrieved from algod while the current one is transformed
+            for blocks in iter_blocks_bulk(
+                poll.plan.algod_sync_from_round,
+                poll.plan.end_round,
+                algod,
+                max_concurrent_requests=subscription.max_concurrent_block_requests,
+                prefetch=subscription.prefetch_blocks,
+                cache=subscription.block_cache,
+            ):
+                batch = poll.algod_batch(blocks, fetch_seconds=time.time() - stage_end)
+                # don't hold on to the blocks while the batch is being processed
+                del blocks
+                yield batch
+                stage_end = time.time()
+            poll.log_algod_sync()
+
+
+async def get_subscribed_transactions_async(
+    subscription: TransactionSubscriptionParams,
+    algod: AsyncAlgodSource,
+    indexer: IndexerClient | None = None,
+    *,
+    compiled_filters: list[CompiledFilter] | None = None,
+) -> TransactionSubscriptionResult:
+    """
+    Executes a single pull/poll to subscribe to transactions on the configured Algorand
+    blockchain for the given subscription context, without blocking the event loop.
+
+    Behaves identically to `get_subscribed_transactions`. Blocks are retrieved via the
+    given async algod source; as the indexer client is blocking, any indexer catchup
+    is run in the event loop's default executor.
+
+    A `ValueError` is raised if `sync_behaviour` is ``"fail"`` and the watermark is more
+    than `max_rounds_to_sync` behind the current round, or if it's
+    ``"catchup-with-indexer"`` and no indexer is given.
+
+    :param subscription: The subscription parameters
+    :param algod: The async algod source
+    :param indexer: The Indexer client (optional)
+    :param compiled_filters: Pre-compiled filters to use. If not provided, filters will be
+        compiled from subscription.filters. For repeated polling, pre-compile once using
+        compile_filters() and pass here for better performance.
+    :return: The transaction subscription result
+    """
+    current_round = subscription.current_round or (await algod.status()).last_round
+
+    # Nothing to sync we at the tip of the chain already
+    if current_round <= subscription.watermark:
+        return _empty_result(subscription.watermark, current_round)
+
+    batches = [
+        batch
+        async for batch in iter_subscribed_transactions_async(
+            dataclasses.replace(subscription, current_round=current_round),
+            algod,
+            indexer,
+            compiled_filters=compiled_filters,
+        )
+    ]
+    return _merge_results(subscription.watermark, current_round, batches)
+
+
+async def iter_subscribed_transactions_async(
+    subscription: TransactionSubscriptionParams,
+    algod: AsyncAlgodSource,
+    indexer: IndexerClient | None = None,
+    *,
+    compiled_filters: list[CompiledFilter] | None = None,
+) -> AsyncIterator[TransactionSubscriptionResult]:
+    """
+    Executes a single pull/poll like `iter_subscribed_transactions`, yielding the result
+    in batches as it goes, without blocking the event loop.
+
+    :param subscription: The subscription parameters
+    :param algod: The async algod source
+    :param indexer: The Indexer client (optional)
+    :param compiled_filters: Pre-compiled filters to use. If not provided, filters will be
+        compiled from subscription.filters.
+    :yields: Results, each covering the rounds after the previous one
+    :ytype: TransactionSubscriptionResult
+    """
+    current_round = subscription.current_round or (await algod.status()).last_round
+
+    # Nothing to sync if we're at the tip of the chain already
+    if current_round > subscription.watermark:
+        poll = _Poll(
+            subscription, current_round, compiled_filters, has_indexer=indexer is not None
+        )
+        if indexer and poll.catches_up_with_indexer:
+            yield await asyncio.to_thread(poll.catch_up_with_indexer, indexer)
+
+        if poll.syncs_with_algod():
+            stage_end = time.time()
+            async for blocks in iter_blocks_bulk_async(
+                poll.plan.algod_sync_from_round,
+                poll.plan.end_round,
+                algod,
+                max_concurrent_requests=subscription.max_concurrent_block_requests,
+                prefetch=subscription.prefetch_blocks,
+                cache=subscription.block_cache,
+            ):
+                batch = poll.algod_batch(blocks, fetch_seconds=time.time() - stage_end)
+                # don't hold on to the blocks while the batch is being processed
+                del blocks
+                yield batch
+                # let other tasks on the loop run between chunks
+                await asyncio.sleep(0)
+                stage_end = time.time()
+            poll.log_algod_sync()
+
+
+@dataclasses.dataclass(kw_only=True, slots=True)
+class _SyncPlan:
+    """The round ranges a single subscription poll will sync and where from."""
+
+    start_round: int
+    end_round: int
+    algod_sync_from_round: int
+    indexer_sync_to_round: int | None = None
+    """Set when rounds from `start_round` need to be caught up via indexer."""
+    skip_algod_sync: bool = False
+
+
+def _empty_result(watermark: int, current_round: int) -> TransactionSubscriptionResult:
+    return TransactionSubscriptionResult(
+        current_round=current_round,
+        starting_watermark=watermark,
+        new_watermark=watermark,
+        subscribed_transactions=[],
+        synced_round_range=(current_round, current_round),
+        block_metadata=[],
+    )
+
+
+def _plan_sync(
+    subscription: TransactionSubscriptionParams,
+    current_round: int,
+    *,
+    has_indexer: bool,
+) -> _SyncPlan:
+    """
+    Work out which rounds to sync, and whether via algod or indexer, based on the
+    watermark, the current round and the configured `sync_behaviour`.
+
+    :param subscription: The subscription parameters
+    :param current_round: The current round; must be greater than the watermark
+    :param has_indexer: Whether an indexer client is available for catchup
+    :raises ValueError: If `sync_behaviour` is ``"fail"`` and the watermark is more
+        than `max_rounds_to_sync` behind the current round.
+    :return: The sync plan
+    """
+    watermark = subscription.watermark
+    max_rounds_to_sync = subscription.max_rounds_to_sync
+    sync_behaviour = subscription.sync_behaviour
+    algod_sync_from_round_number = watermark + 1
+    plan = _SyncPlan(
+        start_round=algod_sync_from_round_number,
+        end_round=current_round,
+        algod_sync_from_round=algod_sync_from_round_number,
+    )
 
     # If we are less than `max_rounds_to_sync` from the tip of the chain then
     # we consult the `sync_behaviour` to determine what to do
@@ -188,20 +471,20 @@ def get_subscribed_transactions(  # noqa: C901, PLR0912, PLR0915
                 f"{algod_sync_from_round_number}; current round number is {current_round}"
             )
         elif sync_behaviour == "skip-sync-newest":  # noqa: RET506
-            algod_sync_from_round_number = current_round - max_rounds_to_sync + 1
-            start_round = algod_sync_from_round_number
+            plan.algod_sync_from_round = current_round - max_rounds_to_sync + 1
+            plan.start_round = plan.algod_sync_from_round
         elif sync_behaviour == "sync-oldest":
-            end_round = algod_sync_from_round_number + max_rounds_to_sync - 1
+            plan.end_round = algod_sync_from_round_number + max_rounds_to_sync - 1
         elif sync_behaviour == "sync-oldest-start-now":
             # When watermark is 0 same behaviour as skip-sync-newest
             if watermark == 0:
-                algod_sync_from_round_number = current_round - max_rounds_to_sync + 1
-                start_round = algod_sync_from_round_number
+                plan.algod_sync_from_round = current_round - max_rounds_to_sync + 1
+                plan.start_round = plan.algod_sync_from_round
             else:
                 # Otherwise same behaviour as sync-oldest
-                end_round = algod_sync_from_round_number + max_rounds_to_sync - 1
+                plan.end_round = algod_sync_from_round_number + max_rounds_to_sync - 1
         elif sync_behaviour == "catchup-with-indexer":
-            if not indexer:
+            if not has_indexer:
                 raise ValueError("Can't catch up using indexer since it's not provided")
 
             # If we have more than `max_indexer_rounds_to_sync` rounds to sync
@@ -210,109 +493,448 @@ def get_subscribed_transactions(  # noqa: C901, PLR0912, PLR0915
             indexer_sync_to_round_number = current_round - max_rounds_to_sync
             if (
                 subscription.max_indexer_rounds_to_sync
-                and indexer_sync_to_round_number - start_round + 1
+                and indexer_sync_to_round_number - plan.start_round + 1
                 > subscription.max_indexer_rounds_to_sync
             ):
                 indexer_sync_to_round_number = (
-                    start_round + subscription.max_indexer_rounds_to_sync - 1
+                    plan.start_round + subscription.max_indexer_rounds_to_sync - 1
                 )
-                end_round = indexer_sync_to_round_number
-                skip_algod_sync = True
+                plan.end_round = indexer_sync_to_round_number
+                plan.skip_algod_sync = True
             else:
-                algod_sync_from_round_number = indexer_sync_to_round_number + 1
+                plan.algod_sync_from_round = indexer_sync_to_round_number + 1
+            plan.indexer_sync_to_round = indexer_sync_to_round_number
+        else:
+            typing.assert_never(sync_behaviour)
 
-            logger.debug(
-                f"Catching up from round {start_round} to round "
-                f"{indexer_sync_to_round_number} via indexer; this may take a few seconds"
-            )
+    return plan
 
-            catchup_transactions = []
-
-            # Process transactions in chunks of 30
-            for chunked_filters in itertools.batched(filters, 30):
-                for f in chunked_filters:
-                    # Retrieve all pre-filtered transactions from the indexer
-                    transactions = search_transactions(
-                        indexer,
-                        f.pre_filter,
-                        min_round=start_round,
-                        max_round=indexer_sync_to_round_number,
-                    )
-                    subscribed_txns = _map_txn_and_inner_txns_to_subscribed_txn(transactions)
 
-                    # Run the post-filter to get the final list of matching transactions
-                    for t in subscribed_txns:
-                        if f.post_filter(t):
-                            t.filters_matched.append(f.name)
-                    catchup_transactions.extend(t for t in subscribed_txns if t.filters_matched)
+class _Poll:
+    """
+    The state of a single subscription poll as its batches are built.
 
-            # Sort by transaction order
-            catchup_transactions.sort(key=lambda x: (x.confirmed_round, x.intra_round_offset))
+    `iter_subscribed_transactions` and `iter_subscribed_transactions_async` only differ
+    in how they retrieve blocks, so the planning and building of each batch is done
+    here for both of them.
+    """
 
-            # Collapse duplicate transactions
-            catchup_transactions = _deduplicate_subscribed_transactions(catchup_transactions)
+    def __init__(
+        self,
+        subscription: TransactionSubscriptionParams,
+        current_round: int,
+        compiled_filters: list[CompiledFilter] | None,
+        *,
+        has_indexer: bool,
+    ) -> None:
+        self.subscription = subscription
+        self.current_round = current_round
+        self.plan = _plan_sync(subscription, current_round, has_indexer=has_indexer)
+        self.filters = _resolve_compiled_filters(subscription, compiled_filters)
+        self.arc28_dispatch = _resolve_arc28_dispatch(subscription, self.filters)
+        self.watermark = subscription.watermark
+        """The last round covered by the batches built so far."""
+        self.algod_totals = SubscriptionPollStats()
+
+    @property
+    def catches_up_with_indexer(self) -> bool:
+        return self.plan.indexer_sync_to_round is not None
+
+    def catch_up_with_indexer(self, indexer: IndexerClient) -> TransactionSubscriptionResult:
+        """
+        Catch up via indexer, blocking until it's done, and build the batch for the
+        rounds caught up.
+        """
+        assert self.plan.indexer_sync_to_round is not None
+        # Balance changes are computed at most once per transaction for all filters
+        # and the result, so they are shared for the duration of each batch
+        with _share_balance_changes():
+            stats = SubscriptionPollStats()
+            catchup_transactions = _catchup_with_indexer(
+                indexer,
+                self.filters,
+                self.plan,
+                stats,
+                max_concurrent_requests=self.subscription.max_concurrent_indexer_requests,
+                split_round_ranges=self.subscription.split_indexer_round_ranges,
+                checkpoint_store=self.subscription.indexer_checkpoint_store,
+                transaction_fields=self.subscription.transaction_fields,
+            )
+            batch = _build_result(
+                self.current_round,
+                (self.plan.start_round, self.plan.indexer_sync_to_round),
+                self.watermark,
+                catchup_transactions,
+                [],
+                stats=stats,
+                arc28_dispatch=self.arc28_dispatch,
+            )
+        self.watermark = batch.new_watermark
+        return batch
 
+    def syncs_with_algod(self) -> bool:
+        if self.plan.skip_algod_sync:
             logger.debug(
-                f"Retrieved {len(catchup_transactions)} transactions from round "
-                f"{start_round} to round {algod_sync_from_round_number - 1} "
-                f"via indexer in {(time.time() - start):.3f}s"
+                f"Skipping algod sync since we have more than "
+                f"{self.subscription.max_indexer_rounds_to_sync} rounds to sync from indexer."
             )
-        else:
-            typing.assert_never(sync_behaviour)
+        return not self.plan.skip_algod_sync
+
+    def algod_batch(
+        self, blocks: Sequence[BlockResponse], *, fetch_seconds: float
+    ) -> TransactionSubscriptionResult:
+        """Build the batch for a chunk of blocks retrieved from algod."""
+        batch = _build_algod_batch(
+            blocks,
+            self.filters,
+            SubscriptionPollStats(fetch_seconds=fetch_seconds, blocks_fetched=len(blocks)),
+            current_round=self.current_round,
+            watermark=self.watermark,
+            arc28_dispatch=self.arc28_dispatch,
+            transaction_fields=self.subscription.transaction_fields,
+        )
+        _add_stats(self.algod_totals, batch.stats)
+        self.watermark = batch.new_watermark
+        return batch
+
+    def log_algod_sync(self) -> None:
+        _log_algod_sync(self.plan, self.algod_totals)
+
+
+def _catchup_with_indexer(  # noqa: C901, PLR0913
+    indexer: IndexerClient,
+    filters: list[CompiledFilter],
+    plan: _SyncPlan,
+    stats: SubscriptionPollStats,
+    *,
+    max_concurrent_requests: int = 1,
+    split_round_ranges: bool = False,
+    checkpoint_store: IndexerCheckpointStore | None = None,
+    transaction_fields: Sequence[TransactionFieldGroup] | None = None,
+) -> list[SubscribedTransaction]:
+    """
+    Retrieve the transactions matching the given filters between the start of the
+    plan and the indexer sync round via indexer.
+
+    :param indexer: The Indexer client
+    :param filters: The compiled filters
+    :param plan: The sync plan
+    :param stats: The stats to record the time spent and pages requested in
+    :param max_concurrent_requests: The maximum number of indexer requests to have in
+        flight at once; results are always processed in filter order
+    :param split_round_ranges: Whether to also split the round range of each search into
+        sub-ranges that are paginated concurrently
+    :param checkpoint_store: An optional store to record each search's pages in as they
+        are consumed so an interrupted catchup can be resumed; round ranges aren't split
+        when checkpointing
+    :param transaction_fields: The groups of optional fields to keep on the transactions;
+        defaults to all of them
+    :return: The matching transactions in transaction order
+    """
+    assert plan.indexer_sync_to_round is not None
+    indexer_sync_to_round = plan.indexer_sync_to_round
+    start = time.time()
+    logger.debug(
+        f"Catching up from round {plan.start_round} to round "
+        f"{indexer_sync_to_round} via indexer; this may take a few seconds"
+    )
+
+    # When splitting round ranges each search waits on its requests, which are made on
+    # a separate executor so there are never more than the maximum in flight
+    request_executor = (
+        ThreadPoolExecutor(
+            max_workers=max_concurrent_requests, thread_name_prefix="indexer-request"
+        )
+        if max_concurrent_requests > 1 and split_round_ranges and checkpoint_store is None
+        else None
+    )
 
-    # Retrieve and process blocks from algod
-    algod_transactions = list[SubscribedTransaction]()
-    if not skip_algod_sync:
-        start = time.time()
-        blocks = get_blocks_bulk(algod_sync_from_round_number, end_round, algod)
-        fetch_end = time.time()
-        block_transactions = [t for b in blocks for t in get_block_transactions(b.block)]
-        subscribed_txns = _map_txn_and_inner_txns_to_subscribed_txn(block_transactions)
-        mapping_end = time.time()
-        for f in filters:
-            # Process each transaction
+    checkpoint_keys = [
+        _indexer_checkpoint_key(position, f, plan.start_round)
+        for position, f in enumerate(filters)
+    ]
+
+    # Pages are requested from several threads when searching concurrently
+    page_lock = threading.Lock()
+
+    def count_page() -> None:
+        with page_lock:
+            stats.indexer_pages_fetched += 1
+
+    def search(position: int) -> list[Transaction]:
+        # Retrieve all pre-filtered transactions from the indexer
+        transactions = search_transactions(
+            indexer,
+            filters[position].pre_filter,
+            min_round=plan.start_round,
+            max_round=indexer_sync_to_round,
+            executor=request_executor,
+            max_concurrent_requests=max_concurrent_requests,
+            checkpoint_store=checkpoint_store,
+            checkpoint_key=checkpoint_keys[position],
+            on_page=count_page,
+        )
+        if transaction_fields is not None:
+            return [project_transaction(t, transaction_fields) for t in transactions]
+        return transactions
+
+    search_executor = (
+        ThreadPoolExecutor(
+            max_workers=max_concurrent_requests, thread_name_prefix="indexer-search"
+        )
+        if max_concurrent_requests > 1 and len(filters) > 1
+        else None
+    )
+    catchup_transactions = list[SubscribedTransaction]()
+    try:
+        # map yields in submission order and re-raises the first failure, so the
+        # results are the same as searching one filter at a time
+        filter_transactions = (
+            map(search, range(len(filters)))
+            if search_executor is None
+            else search_executor.map(search, range(len(filters)))
+        )
+        for f, transactions in zip(filters, filter_transactions, strict=True):
+            subscribed_txns = _map_txn_and_inner_txns_to_subscribed_txn(transactions)
+
+            # Run the post-filter to get the final list of matching transactions
             for t in subscribed_txns:
                 if f.post_filter(t):
                     t.filters_matched.append(f.name)
+            catchup_transactions.extend(t for t in subscribed_txns if t.filters_matched)
+    finally:
+        # don't wait for searches that are no longer needed (e.g. after an error)
+        if search_executor is not None:
+            search_executor.shutdown(wait=False, cancel_futures=True)
+        if request_executor is not None:
+            request_executor.shutdown(wait=False, cancel_futures=True)
+
+    # Sort by transaction order
+    catchup_transactions.sort(key=lambda x: (x.confirmed_round, x.intra_round_offset))
+
+    # Collapse duplicate transactions
+    catchup_transactions = _deduplicate_subscribed_transactions(catchup_transactions)
+
+    # The searches are complete so they won't need to be resumed
+    if checkpoint_store is not None:
+        for key in checkpoint_keys:
+            checkpoint_store.delete(key)
+
+    stats.indexer_seconds = time.time() - start
+    logger.debug(
+        f"Retrieved {len(catchup_transactions)} transactions from round "
+        f"{plan.start_round} to round {plan.algod_sync_from_round - 1} "
+        f"via indexer in {stats.indexer_seconds:.3f}s"
+    )
+    return catchup_transactions
+
+
+def _indexer_checkpoint_key(position: int, f: CompiledFilter, start_round: int) -> str:
+    """
+    The key to checkpoint the indexer search for a filter under; it changes whenever
+    the filter's search or the round the poll starts from does.
+    """
+    search_hash = hashlib.sha256(repr(f.pre_filter).encode()).hexdigest()[:16]
+    return f"{start_round}/{position}/{f.name}/{search_hash}"
+
+
+def _process_blocks(
+    blocks: Sequence[BlockResponse],
+    filters: CompiledFilters,
+    stats: SubscriptionPollStats,
+    *,
+    transaction_fields: Sequence[TransactionFieldGroup] | None = None,
+) -> tuple[list[SubscribedTransaction], list[BlockMetadata]]:
+    """
+    Transform and filter the transactions in the given blocks and extract the block metadata.
+
+    :param blocks: The blocks retrieved from algod, in round order
+    :param filters: The compiled filters
+    :param stats: The stats to add the stage timings and transaction counts to
+    :param transaction_fields: The groups of optional fields to convert; defaults to all
+    :return: The matching transactions and the metadata of each block
+    """
+    start = time.time()
+    is_candidate = _create_algod_candidate_filter(filters)
+    # Each top-level transaction along with its inner transactions
+    transaction_trees = list[tuple[list[SubscribedTransaction], AlgodTransaction]]()
+    for b in blocks:
+        for transaction, algod_transaction in iter_block_transactions(
+            b.block, is_candidate, transaction_fields
+        ):
+            tree = _map_txn_and_inner_txns_to_subscribed_txn([transaction])
+            if filters.reads_transaction_ids:
+                _assign_transaction_ids(tree[0], algod_transaction.tx_id())
+            transaction_trees.append((tree, algod_transaction))
+    mapping_end = time.time()
+
+    matched_transactions = list[SubscribedTransaction]()
+    for tree, algod_transaction in transaction_trees:
+        for t in tree:
+            # The fields the filters check are extracted once for all of them
+            features = _get_txn_features(t)
+            # Only test the filters that could match, in filter order
+            for position in sorted(_get_candidate_filters(filters, features, _INDEXED_TXN_FIELDS)):
+                f = filters[position]
+                if f.matches(t, features):
+                    t.filters_matched.append(f.name)
+        matched = [t for t in tree if t.filters_matched]
+        if matched:
+            # IDs are only computed for the transactions that matched
+            if not tree[0].id_:
+                _assign_transaction_ids(tree[0], algod_transaction.tx_id())
+            matched_transactions.extend(matched)
+    filtering_end = time.time()
+    block_metadata = [block_data_to_block_metadata(b) for b in blocks]
+    stats.block_metadata_seconds += time.time() - filtering_end
+    stats.filtering_seconds += filtering_end - mapping_end
+    stats.mapping_seconds += mapping_end - start
+    stats.transactions_retrieved += sum(len(b.block.payset or []) for b in blocks)
+    stats.transactions_transformed += len(transaction_trees)
+    return matched_transactions, block_metadata
+
+
+def _log_algod_sync(plan: _SyncPlan, stats: SubscriptionPollStats) -> None:
+    fetch, mapping, filtering, block_meta = (
+        stats.fetch_seconds,
+        stats.mapping_seconds,
+        stats.filtering_seconds,
+        stats.block_metadata_seconds,
+    )
+    logger.debug(
+        f"Retrieved {stats.transactions_retrieved} transactions from algod via "
+        f"round(s) {plan.algod_sync_from_round}-{plan.end_round} "
+        f"in {(fetch + mapping + filtering + block_meta):.3f}s"
+        f" {fetch=}, {mapping=}, {filtering=}, {block_meta=}"
+    )
+
+
+def _resolve_arc28_dispatch(
+    subscription: TransactionSubscriptionParams, filters: CompiledFilters
+) -> Arc28EventDispatch:
+    """Reuse the ARC-28 event groups compiled with the filters if they're the same ones."""
+    arc28_groups = subscription.arc28_events or []
+    arc28_dispatch = filters.arc28_dispatch
+    if arc28_dispatch is None or arc28_dispatch.groups != arc28_groups:
+        arc28_dispatch = _compile_arc28_event_dispatch(arc28_groups)
+    return arc28_dispatch
 
-        algod_transactions = [t for t in subscribed_txns if t.filters_matched]
-        filtering_end = time.time()
-        block_metadata = [block_data_to_block_metadata(b) for b in blocks]
-        block_meta = time.time() - filtering_end
-        filtering = filtering_end - mapping_end
-        mapping = mapping_end - fetch_end
-        fetch = fetch_end - start
-
-        logger.debug(
-            f"Retrieved {len(block_transactions)} transactions from algod via "
-            f"round(s) {algod_sync_from_round_number}-{end_round} "
-            f"in {(time.time() - start):.3f}s"
-            f" {fetch=}, {mapping=}, {filtering=}, {block_meta=}"
+
+def _build_algod_batch(  # noqa: PLR0913
+    blocks: Sequence[BlockResponse],
+    filters: CompiledFilters,
+    stats: SubscriptionPollStats,
+    *,
+    current_round: int,
+    watermark: int,
+    arc28_dispatch: Arc28EventDispatch,
+    transaction_fields: Sequence[TransactionFieldGroup] | None = None,
+) -> TransactionSubscriptionResult:
+    """
+    Transform and filter a chunk of blocks retrieved from algod into the result for
+    the rounds they cover.
+    """
+    with _share_balance_changes():
+        transactions, block_metadata = _process_blocks(
+            blocks, filters, stats, transaction_fields=transaction_fields
         )
-    else:
-        logger.debug(
-            f"Skipping algod sync since we have more than "
-            f"{subscription.max_indexer_rounds_to_sync} rounds to sync from indexer."
+        return _build_result(
+            current_round,
+            (blocks[0].block.header.round, blocks[-1].block.header.round),
+            watermark,
+            transactions,
+            block_metadata,
+            stats=stats,
+            arc28_dispatch=arc28_dispatch,
         )
 
+
+def _build_result(  # noqa: PLR0913
+    current_round: int,
+    synced_round_range: tuple[int, int],
+    starting_watermark: int,
+    transactions: list[SubscribedTransaction],
+    block_metadata: list[BlockMetadata],
+    *,
+    stats: SubscriptionPollStats,
+    arc28_dispatch: Arc28EventDispatch,
+) -> TransactionSubscriptionResult:
+    start = time.time()
+    _process_extra_fields(transactions, arc28_dispatch)
+    transactions_by_filter = _group_by_filter_name(transactions)
+    stats.enrichment_seconds += time.time() - start
+    stats.transactions_matched = {
+        filter_name: len(matched) for filter_name, matched in transactions_by_filter.items()
+    }
+    return TransactionSubscriptionResult(
+        synced_round_range=synced_round_range,
+        starting_watermark=starting_watermark,
+        new_watermark=synced_round_range[1],
+        current_round=current_round,
+        block_metadata=block_metadata,
+        subscribed_transactions=transactions,
+        transactions_by_filter=transactions_by_filter,
+        stats=stats,
+    )
+
+
+def _group_by_filter_name(
+    transactions: Iterable[SubscribedTransaction],
+) -> dict[str, list[SubscribedTransaction]]:
+    """Group transactions by the name of each filter they matched, in a single pass."""
+    transactions_by_filter = defaultdict[str, list[SubscribedTransaction]](list)
+    for t in transactions:
+        # A name can be matched more than once by filters that share it
+        for filter_name in dict.fromkeys(t.filters_matched):
+            transactions_by_filter[filter_name].append(t)
+    return dict(transactions_by_filter)
+
+
+def _merge_results(
+    watermark: int, current_round: int, batches: list[TransactionSubscriptionResult]
+) -> TransactionSubscriptionResult:
+    """Merge the consecutive batches of a poll into a single result."""
+    transactions_by_filter = defaultdict[str, list[SubscribedTransaction]](list)
+    stats = SubscriptionPollStats()
+    for batch in batches:
+        for filter_name, transactions in batch.transactions_by_filter.items():
+            transactions_by_filter[filter_name].extend(transactions)
+        _add_stats(stats, batch.stats)
     return TransactionSubscriptionResult(
-        synced_round_range=(start_round, end_round),
+        synced_round_range=(batches[0].synced_round_range[0], batches[-1].synced_round_range[1]),
         starting_watermark=watermark,
-        new_watermark=end_round,
+        new_watermark=batches[-1].new_watermark,
         current_round=current_round,
-        block_metadata=block_metadata or [],
-        subscribed_transactions=[
-            _process_extra_fields(t, arc28_groups)
-            for t in catchup_transactions + algod_transactions
-        ],
+        block_metadata=[m for batch in batches for m in batch.block_metadata or []],
+        subscribed_transactions=[t for batch in batches for t in batch.subscribed_transactions],
+        transactions_by_filter=dict(transactions_by_filter),
+        stats=stats,
     )
 
 
+def _add_stats(total: SubscriptionPollStats, stats: SubscriptionPollStats) -> None:
+    """Add the stats of a batch to the running total for a poll."""
+    for f in dataclasses.fields(stats):
+        if f.name == "transactions_matched":
+            for filter_name, count in stats.transactions_matched.items():
+                total.transactions_matched[filter_name] = (
+                    total.transactions_matched.get(filter_name, 0) + count
+                )
+        else:
+            setattr(total, f.name, getattr(total, f.name) + getattr(stats, f.name))
+
+
 def _deduplicate_subscribed_transactions(
     txns: list[SubscribedTransaction],
 ) -> list[SubscribedTransaction]:
     """
-    Deduplicate subscribed transactions based on their ID.
+    Deduplicate subscribed transactions based on their ID, keeping the first of each
+    and adding the filters matched by the others to it (in place).
+
+    Transactions found by different searches are separate objects, so the inner
+    transactions of each one kept are then replaced by the one kept with the same ID (if
+    any), so that each transaction exists once whether it's in the list or in its
+    parent's inner transactions, as it does for transactions from algod.
 
     :param txns: List of subscribed transactions
     :return: Deduplicated list of subscribed transactions
@@ -320,77 +942,113 @@ def _deduplicate_subscribed_transactions(
     result_dict = dict[str, SubscribedTransaction]()
 
     for txn in txns:
-        try:
-            existing_txn = result_dict[txn.id_]
-        except KeyError:
-            result_dict[txn.id_] = dataclasses.replace(
-                txn, filters_matched=txn.filters_matched.copy()
-            )
-        else:
+        existing_txn = result_dict.setdefault(txn.id_, txn)
+        if existing_txn is not txn:
             existing_txn.filters_matched.extend(txn.filters_matched)
+
+    shared = set[int]()
+
+    def share_inner_txns(txn: SubscribedTransaction) -> None:
+        if id(txn) in shared:
+            return
+        shared.add(id(txn))
+        txn.inner_txns = [result_dict.get(inner.id_, inner) for inner in txn.inner_txns]
+        for inner_txn in txn.inner_txns:
+            share_inner_txns(inner_txn)
+
+    for txn in result_dict.values():
+        share_inner_txns(txn)
     return list(result_dict.values())
 
 
 def _process_extra_fields(
-    transaction: SubscribedTransaction,
-    arc28_groups: list[Arc28EventGroup],
-) -> SubscribedTransaction:
+    transactions: Iterable[SubscribedTransaction],
+    arc28_dispatch: Arc28EventDispatch,
+) -> None:
     """
-    Process extra fields for a transaction, including ARC-28 events and balance changes.
+    Process extra fields for transactions and their inner transactions, including ARC-28
+    events and balance changes, in place.
+
+    An inner transaction that matched is also in its parent's inner transactions (when the
+    parent matched too), so each transaction is only processed once.
 
-    :param transaction: The transaction to process
-    :param arc28_groups: The ARC-28 event groups
-    :return: The processed transaction with extra fields
+    :param transactions: The transactions to process
+    :param arc28_dispatch: The compiled ARC-28 event groups
     """
-    arc28_events = _extract_arc28_events(transaction, arc28_groups)
-    balance_changes = _extract_balance_changes_from_indexer_transaction(transaction)
-    inner_txns = [_process_extra_fields(inner, arc28_groups) for inner in transaction.inner_txns]
+    processed = set[int]()
+
+    def process(transaction: SubscribedTransaction) -> None:
+        if id(transaction) in processed:
+            return
+        processed.add(id(transaction))
+        transaction.arc28_events = _extract_arc28_events(transaction, arc28_dispatch)
+        transaction.balance_changes = _get_balance_changes(transaction)
+        for inner_txn in transaction.inner_txns:
+            process(inner_txn)
 
-    return dataclasses.replace(
-        transaction,
-        arc28_events=arc28_events,
-        balance_changes=balance_changes,
-        inner_txns=inner_txns,
+    for transaction in transactions:
+        process(transaction)
+
+
+def _compile_arc28_event_dispatch(groups: list[Arc28EventGroup]) -> Arc28EventDispatch:
+    """
+    Compile ARC-28 event groups into a lookup of event definitions by event prefix.
+
+    :param groups: The ARC-28 event groups
+    :return: The compiled event groups
+    """
+    group_filters = list[_Filter]()
+    handlers_by_prefix = defaultdict[bytes, list[Arc28EventHandler]](list)
+    for group_position, group in enumerate(groups):
+        group_filters.append(_all_filters(_create_arc28_group_filter(group)))
+        for event in group.events:
+            handlers_by_prefix[event.prefix].append(
+                Arc28EventHandler(
+                    group_position=group_position,
+                    group=group,
+                    event=event,
+                    decoder=event.abi_type,
+                )
+            )
+    return Arc28EventDispatch(
+        groups=groups, group_filters=group_filters, handlers_by_prefix=dict(handlers_by_prefix)
     )
 
 
 def _extract_arc28_events(
-    transaction: SubscribedTransaction, groups: list[Arc28EventGroup]
+    transaction: SubscribedTransaction, arc28_dispatch: Arc28EventDispatch
 ) -> list[EmittedArc28Event]:
     arc28_events = list[EmittedArc28Event]()
     logs = transaction.logs or []
-    if not logs:
+    if not logs or not arc28_dispatch.handlers_by_prefix:
         return arc28_events
 
-    potential_groups = []
-    for group in groups:
-        group_filter = _create_arc28_group_filter(group)
-        if all(f(transaction) for f in group_filter):
-            potential_groups.append(group)
-
+    # Only check whether to process a group once the transaction emits one of its events
+    processed_groups = dict[int, bool]()
     for log in logs:
-        for group in potential_groups:
-            for event in group.events:
-                if not log.startswith(event.prefix):
-                    continue
-                event_bytes = log[4:]
-                arc28_event = _extract_arc28_event(
-                    transaction.id_, event_bytes, group.group_name, group, event
-                )
-                if arc28_event is not None:
-                    arc28_events.append(arc28_event)
+        for handler in arc28_dispatch.handlers_by_prefix.get(log[:4], ()):
+            try:
+                process_group = processed_groups[handler.group_position]
+            except KeyError:
+                process_group = arc28_dispatch.group_filters[handler.group_position](transaction)
+                processed_groups[handler.group_position] = process_group
+            if not process_group:
+                continue
+            arc28_event = _extract_arc28_event(transaction.id_, log[4:], handler)
+            if arc28_event is not None:
+                arc28_events.append(arc28_event)
     return arc28_events
 
 
 def _extract_arc28_event(
     transaction_id: str,
     event_bytes: bytes,
-    group_name: str,
-    group: Arc28EventGroup,
-    event: Arc28Event,
+    handler: Arc28EventHandler,
 ) -> EmittedArc28Event | None:
+    group, event = handler.group, handler.event
+    group_name = group.group_name
     try:
-        value = event.abi_type.decode(event_bytes)
+        value = handler.decoder.decode(event_bytes)
     except (ValueError, TypeError) as ex:
         if group.continue_on_error:
             logger.warning(
@@ -419,6 +1077,43 @@ def _extract_arc28_event(
     )
 
 
+_shared_balance_changes = contextvars.ContextVar[
+    dict[tuple[int, int], list[BalanceChange]] | None
+]("_shared_balance_changes", default=None)
+
+
+@contextlib.contextmanager
+def _share_balance_changes() -> Iterator[None]:
+    """Share the balance changes of each transaction (by position) within this context."""
+    token = _shared_balance_changes.set({})
+    try:
+        yield
+    finally:
+        _shared_balance_changes.reset(token)
+
+
+def _get_balance_changes(transaction: Transaction) -> list[BalanceChange]:
+    """
+    Get the balance changes of a transaction, reusing the previously extracted balance
+    changes when called within `_share_balance_changes`.
+
+    :param transaction: The indexer transaction
+    :return: A list of balance changes
+    """
+    shared = _shared_balance_changes.get()
+    round_, offset = transaction.confirmed_round, transaction.intra_round_offset
+    # Transactions are identified by their position in the chain rather than their ID,
+    # which isn't computed until a transaction from algod has matched a filter
+    if shared is None or round_ is None or offset is None:
+        return _extract_balance_changes_from_indexer_transaction(transaction)
+    try:
+        return shared[round_, offset]
+    except KeyError:
+        balance_changes = _extract_balance_changes_from_indexer_transaction(transaction)
+        shared[round_, offset] = balance_changes
+        return balance_changes
+
+
 def _extract_balance_changes_from_indexer_transaction(  # noqa: PLR0912, C901
     transaction: Transaction,
 ) -> list[BalanceChange]:
@@ -572,7 +1267,9 @@ def _map_txn_and_inner_txns_to_subscribed_txn(
     """
     Process an indexer transaction and return that transaction or any of its
     inner transactions that meet the indexer pre-filter requirements; patching
-    up transaction ID and intra-round-offset on the way through.
+    up transaction ID and intra-round-offset on the way through. Transactions without
+    an ID (see `iter_block_transactions`) are given an empty one, as are their inner
+    transactions, until `_assign_transaction_ids` is called.
 
     :param transactions: The indexer transactions to process
     :return: A list of filtered subscribed transactions
@@ -582,6 +1279,7 @@ def _map_txn_and_inner_txns_to_subscribed_txn(
         root_offset = itertools.count(1)
         root_txn = _txn_to_subscribed_txn(
             transaction,
+            id_=transaction.id_ or "",
             filters_matched=[],
             inner_txns=_map_inner_txns(transaction, transaction, root_offset),
             parent_intra_round_offset=transaction.intra_round_offset,
@@ -591,6 +1289,17 @@ def _map_txn_and_inner_txns_to_subscribed_txn(
     return result
 
 
+def _assign_transaction_ids(root: SubscribedTransaction, transaction_id: str) -> None:
+    """Set the ID of a top-level transaction and the IDs derived from it of its inner ones."""
+    root.id_ = transaction_id
+    root_offset = root.intra_round_offset or 0
+    for inner_txn in _expand_inner_txns(root):
+        inner_txn.id_ = (
+            f"{transaction_id}/inner/{(inner_txn.intra_round_offset or 0) - root_offset}"
+        )
+        inner_txn.parent_transaction_id = transaction_id
+
+
 def _expand_inner_txns(txn: SubscribedTransaction) -> Iterable[SubscribedTransaction]:
     for inner_txn in txn.inner_txns:
         yield inner_txn
@@ -616,7 +1325,7 @@ def _map_inner_txns(
         result.append(
             _txn_to_subscribed_txn(
                 inner_txn,
-                id_=f"{root.id_}/inner/{root_offset}",
+                id_=f"{root.id_}/inner/{root_offset}" if root.id_ else "",
                 parent_transaction_id=root.id_,
                 intra_round_offset=(root.intra_round_offset or 0) + root_offset,
                 parent_intra_round_offset=root.intra_round_offset,
@@ -626,15 +1335,6 @@ def _map_inner_txns(
     return result
 
 
-def _get_txn_receiver(txn: Transaction) -> str | None:
-    if txn.payment_transaction:
-        return txn.payment_transaction.receiver
-    elif txn.asset_transfer_transaction:
-        return txn.asset_transfer_transaction.receiver
-    else:
-        return None
-
-
 def _get_txn_app_id(txn: Transaction) -> int | None:
     if txn.application_transaction:
         return txn.created_app_id or txn.application_transaction.application_id
@@ -655,32 +1355,86 @@ def _get_txn_asset_id(txn: Transaction) -> int | None:
         return None
 
 
-def _get_txn_amount(txn: Transaction) -> int:
-    if txn.asset_transfer_transaction:
-        return txn.asset_transfer_transaction.amount
-    elif txn.payment_transaction:
-        return txn.payment_transaction.amount
+def _get_txn_app_args(txn: Transaction) -> list[bytes] | None:
+    if txn.application_transaction:
+        return txn.application_transaction.application_args
     else:
-        return 0
+        return None
 
 
-def _get_txn_on_complete(txn: Transaction) -> str | None:
-    if txn.application_transaction:
-        return txn.application_transaction.on_completion.value
+def _get_algod_txn_receiver(txn: SignedTxnWithAD) -> str | None:
+    fields = txn.signed_transaction.txn
+    if fields.payment:
+        return fields.payment.receiver
+    elif fields.asset_transfer:
+        return fields.asset_transfer.receiver
     else:
         return None
 
 
-def _get_txn_app_args(txn: Transaction) -> list[bytes] | None:
-    if txn.application_transaction:
-        return txn.application_transaction.application_args
+def _get_algod_txn_app_id(txn: SignedTxnWithAD) -> int | None:
+    fields = txn.signed_transaction.txn
+    if fields.application_call:
+        created_app_id = txn.apply_data.application_id if txn.apply_data else None
+        return created_app_id or fields.application_call.app_id
     else:
         return None
 
 
-def _get_txn_method_selector(txn: Transaction) -> bytes | None:
-    args = _get_txn_app_args(txn)
-    return args[0] if args else None
+def _get_algod_txn_asset_id(txn: SignedTxnWithAD) -> int | None:
+    fields = txn.signed_transaction.txn
+    if txn.apply_data and txn.apply_data.config_asset:
+        return txn.apply_data.config_asset
+    elif fields.asset_transfer:
+        return fields.asset_transfer.asset_id
+    elif fields.asset_config:
+        return fields.asset_config.asset_id
+    elif fields.asset_freeze:
+        return fields.asset_freeze.asset_id
+    else:
+        return None
+
+
+# The position of each field in `TransactionFeatures`
+_TYPE: typing.Final = 0
+_SENDER: typing.Final = 1
+_RECEIVER: typing.Final = 2
+_APP_ID: typing.Final = 3
+_ASSET_ID: typing.Final = 4
+_AMOUNT: typing.Final = 5
+_ON_COMPLETE: typing.Final = 6
+_METHOD_SELECTOR: typing.Final = 7
+_NOTE: typing.Final = 8
+
+
+def _get_txn_features(txn: Transaction) -> TransactionFeatures:
+    # Reads each field once; the app and asset IDs are the same as `_get_txn_app_id` and
+    # `_get_txn_asset_id` return, and the method selector is the first app argument
+    receiver, amount = None, 0
+    if payment := txn.payment_transaction:
+        receiver, amount = payment.receiver, payment.amount
+    elif asset_transfer := txn.asset_transfer_transaction:
+        receiver, amount = asset_transfer.receiver, asset_transfer.amount
+    app_id = on_complete = method_selector = None
+    if app := txn.application_transaction:
+        app_id = txn.created_app_id or app.application_id
+        on_complete = app.on_completion.value
+        method_selector = app.application_args[0] if app.application_args else None
+    return (
+        txn.tx_type,
+        txn.sender,
+        receiver,
+        app_id,
+        _get_txn_asset_id(txn),
+        amount,
+        on_complete,
+        method_selector,
+        txn.note or b"",
+    )
+
+
+def _with_txn_features(predicate: _FeatureFilter) -> _Filter:
+    return lambda t: predicate(t, _get_txn_features(t))
 
 
 def _make_set[T](maybe_seq: T | list[T]) -> set[T]:
@@ -690,96 +1444,470 @@ def _make_set[T](maybe_seq: T | list[T]) -> set[T]:
         return {maybe_seq}
 
 
-def _create_transaction_filter(  # noqa: C901, PLR0912, PLR0915
+_CheckKind = typing.Literal[
+    "one of", "at least", "at most", "starts with", "is set", "is not set", "calls"
+]
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _Check:
+    """
+    One of the checks of a filter, described as data so that the function for it and its
+    source in a generated filter are both derived from the same description.
+    """
+
+    name: str
+    """The name of the value in generated source."""
+    kind: _CheckKind
+    value: Any
+    """What the transaction is checked against, or the function a `calls` check calls."""
+    feature: int = -1
+    """The position in `TransactionFeatures` of the field that's checked, if any."""
+    attribute: str = ""
+    """The transaction attribute an `is set` or `is not set` check checks."""
+
+
+def _get_filter_checks(  # noqa: C901, PLR0912
     transaction_filter: TransactionFilter,
     arc28_groups: list[Arc28EventGroup],
-) -> Callable[[Transaction], bool]:
+) -> list[_Check]:
     """
-    Create a filter function for transactions based on the subscription parameters.
+    Get the checks a transaction must pass to match a filter, in the order to check them.
+
+    The checks that call functions (e.g. `custom_filter`) come last, and are the only ones
+    that may have side effects.
 
     :param transaction_filter: The transaction filter parameters
     :param arc28_groups: The ARC-28 group definitions
-    :return: A function that applies the filter to a transaction in a block
+    :return: The checks
     """
-    filters = list[_Filter]()
+    checks = list[_Check]()
+
+    def one_of(name: str, feature: int, allowed: set[Any]) -> None:
+        checks.append(_Check(name, "one of", frozenset(allowed), feature=feature))
+
     if transaction_filter.sender:
-        senders = _make_set(transaction_filter.sender)
-        filters.append(lambda t: t.sender in senders)
+        one_of("senders", _SENDER, _make_set(transaction_filter.sender))
 
     if transaction_filter.receiver:
-        receivers = _make_set(transaction_filter.receiver)
-        filters.append(lambda t: _get_txn_receiver(t) in receivers)
+        one_of("receivers", _RECEIVER, _make_set(transaction_filter.receiver))
 
     if transaction_filter.type:
-        txn_types = _make_set(transaction_filter.type)  # type: ignore[arg-type]
-        filters.append(lambda t: t.tx_type in txn_types)
+        one_of("txn_types", _TYPE, _make_set(transaction_filter.type))
 
     if transaction_filter.note_prefix:
         if isinstance(transaction_filter.note_prefix, bytes):
             note_prefix_bytes = transaction_filter.note_prefix
         else:
             note_prefix_bytes = transaction_filter.note_prefix.encode("utf-8")
-        filters.append(lambda t: (t.note or b"").startswith(note_prefix_bytes))
+        checks.append(_Check("note_prefix", "starts with", note_prefix_bytes, feature=_NOTE))
 
     if transaction_filter.app_id:
-        app_ids = _make_set(transaction_filter.app_id)
-        filters.append(lambda t: _get_txn_app_id(t) in app_ids)
+        one_of("app_ids", _APP_ID, _make_set(transaction_filter.app_id))
 
     if transaction_filter.asset_id:
-        asset_ids = _make_set(transaction_filter.asset_id)
-        filters.append(lambda t: _get_txn_asset_id(t) in asset_ids)
+        one_of("asset_ids", _ASSET_ID, _make_set(transaction_filter.asset_id))
 
     if transaction_filter.min_amount:
-        min_amount = transaction_filter.min_amount
-        filters.append(lambda t: _get_txn_amount(t) >= min_amount)
+        checks.append(
+            _Check("min_amount", "at least", transaction_filter.min_amount, feature=_AMOUNT)
+        )
 
     if transaction_filter.max_amount:
-        max_amount = transaction_filter.max_amount
-        filters.append(lambda t: _get_txn_amount(t) <= max_amount)
+        checks.append(
+            _Check("max_amount", "at most", transaction_filter.max_amount, feature=_AMOUNT)
+        )
 
-    if transaction_filter.asset_create is True:
-        filters.append(lambda t: bool(t.created_asset_id))
-    elif transaction_filter.asset_create is False:
-        filters.append(lambda t: not t.created_asset_id)
+    if transaction_filter.asset_create is not None:
+        kind: _CheckKind = "is set" if transaction_filter.asset_create else "is not set"
+        checks.append(_Check("asset_create", kind, None, attribute="created_asset_id"))
 
-    if transaction_filter.app_create is True:
-        filters.append(lambda t: bool(t.created_app_id))
-    elif transaction_filter.app_create is False:
-        filters.append(lambda t: not t.created_app_id)
+    if transaction_filter.app_create is not None:
+        kind = "is set" if transaction_filter.app_create else "is not set"
+        checks.append(_Check("app_create", kind, None, attribute="created_app_id"))
 
     if transaction_filter.app_on_complete:
-        app_on_complete = _make_set(transaction_filter.app_on_complete)
-        filters.append(lambda t: _get_txn_on_complete(t) in app_on_complete)
+        one_of("app_on_complete", _ON_COMPLETE, _make_set(transaction_filter.app_on_complete))
 
     if transaction_filter.method_signature:
-        method_signatures = {
-            method_selector_bytes(sig) for sig in _make_set(transaction_filter.method_signature)
-        }
-        filters.append(lambda t: _get_txn_method_selector(t) in method_signatures)
+        one_of(
+            "method_selectors",
+            _METHOD_SELECTOR,
+            {method_selector_bytes(sig) for sig in _make_set(transaction_filter.method_signature)},
+        )
 
     if transaction_filter.arc28_events:
-        filter_ = _create_arc28_filter(arc28_groups, transaction_filter.arc28_events)
-        filters.append(filter_)
+        arc28_filter = _create_arc28_filter(arc28_groups, transaction_filter.arc28_events)
+        checks.append(_Check("arc28_filter", "calls", arc28_filter))
 
     if transaction_filter.app_call_arguments_match:
         app_args_match = transaction_filter.app_call_arguments_match
-        filters.append(lambda t: app_args_match(_get_txn_app_args(t)))
+        checks.append(
+            _Check("app_args_filter", "calls", lambda t: app_args_match(_get_txn_app_args(t)))
+        )
 
     if transaction_filter.balance_changes:
         balance_filter = _create_balance_changes_filter(transaction_filter.balance_changes)
-        filters.append(balance_filter)
+        checks.append(_Check("balance_filter", "calls", balance_filter))
 
     if transaction_filter.custom_filter:
-        filters.append(transaction_filter.custom_filter)
+        checks.append(_Check("custom_filter", "calls", transaction_filter.custom_filter))
 
+    return checks
+
+
+def _create_check_function(check: _Check) -> _FeatureFilter:  # noqa: PLR0911
+    """
+    Create a function for a check of a transaction and its features.
+
+    :param check: The check
+    :return: The function
+    """
+    feature, value = check.feature, check.value
+    if check.kind == "one of":
+        return lambda _, f: f[feature] in value
+    if check.kind == "at least":
+        return lambda _, f: f[feature] >= value
+    if check.kind == "at most":
+        return lambda _, f: f[feature] <= value
+    if check.kind == "starts with":
+
+        def starts_with(_: Transaction, f: Sequence[Any]) -> bool:
+            return f[feature].startswith(value)  # type: ignore[no-any-return]
+
+        return starts_with
+    if check.kind == "is set":
+        get_attribute = operator.attrgetter(check.attribute)
+        return lambda t, _: bool(get_attribute(t))
+    if check.kind == "is not set":
+        get_attribute = operator.attrgetter(check.attribute)
+        return lambda t, _: not get_attribute(t)
+    return lambda t, _: bool(value(t))
+
+
+def _get_check_source(check: _Check) -> tuple[str, Any]:  # noqa: PLR0911
+    """
+    Get the source of a check, as an expression of a transaction `t`, its features `f` and
+    the check's value by its name.
+
+    :param check: The check
+    :return: The source, and the value to give the check's name
+    """
+    name, feature = check.name, check.feature
+    if check.kind == "one of":
+        if len(check.value) == 1:
+            (value,) = check.value
+            return f"f[{feature}] == {name}", value
+        return f"f[{feature}] in {name}", check.value
+    if check.kind == "at least":
+        return f"f[{feature}] >= {name}", check.value
+    if check.kind == "at most":
+        return f"f[{feature}] <= {name}", check.value
+    if check.kind == "starts with":
+        return f"f[{feature}].startswith({name})", check.value
+    if check.kind == "is set":
+        return f"t.{check.attribute}", None
+    if check.kind == "is not set":
+        return f"not t.{check.attribute}", None
+    return f"{name}(t)", check.value
+
+
+def _create_transaction_filter(
+    transaction_filter: TransactionFilter,
+    arc28_groups: list[Arc28EventGroup],
+) -> _FeatureFilter:
+    """
+    Create a filter function for transactions based on the subscription parameters.
+
+    The checks of the transaction fields that are common to filters read them from the
+    transaction's features (see `_get_txn_features`), which are extracted once for
+    all of the filters.
+
+    :param transaction_filter: The transaction filter parameters
+    :param arc28_groups: The ARC-28 group definitions
+    :return: A function that applies the filter to a transaction in a block, along with
+        its features
+    """
+    filters = [
+        _create_check_function(check)
+        for check in _get_filter_checks(transaction_filter, arc28_groups)
+    ]
     if len(filters) == 0:
-        return lambda _: True
+        return lambda _t, _f: True
+    elif len(filters) == 1:
+        return filters[0]
+    else:
+        return lambda t, f: all(txn_filter(t, f) for txn_filter in filters)
+
+
+def _generate_transaction_filter(
+    transaction_filter: TransactionFilter,
+    arc28_groups: list[Arc28EventGroup],
+    *,
+    reorder_after: int | None = None,
+    on_reordered: Callable[[_FeatureFilter], None] | None = None,
+) -> _FeatureFilter:
+    """
+    Generate the source of a single function that applies a filter to a transaction and
+    its features, with each check inlined, and compile it; so applying the filter is one
+    function call rather than one for each check plus the `all` that combines them.
+
+    :param transaction_filter: The transaction filter parameters
+    :param arc28_groups: The ARC-28 group definitions
+    :param reorder_after: If set, the number of transactions to measure the checks of the
+        transaction fields against before generating the function again with them in the
+        order that's expected to be cheapest (see `_create_reordering_filter`)
+    :param on_reordered: Called with the reordered function once it's generated
+    :return: A function equivalent to the one `_create_transaction_filter` creates
+    """
+    checks = _get_filter_checks(transaction_filter, arc28_groups)
+    if reorder_after and sum(check.kind != "calls" for check in checks) > 1:
+        return _create_reordering_filter(checks, reorder_after, on_reordered)
+    return _compile_checks(checks)
+
+
+def _compile_checks(checks: list[_Check]) -> _FeatureFilter:
+    """
+    Compile a function of a transaction `t` and its features `f` that is `True` if all of
+    the given checks are, checking them in the given order.
+
+    :param checks: The checks
+    :return: The function
+    """
+    conditions = list[str]()
+    namespace = dict[str, Any]()
+    for check in checks:
+        condition, namespace[check.name] = _get_check_source(check)
+        conditions.append(f"({condition})")
+    condition = " and ".join(conditions) or "True"
+    source = f"def predicate(t, f):\n    return True if {condition} else False\n"
+    exec(compile(source, "<transaction filter>", "exec"), namespace)
+    return typing.cast("_FeatureFilter", namespace["predicate"])
+
+
+def _create_reordering_filter(
+    checks: list[_Check],
+    reorder_after: int,
+    on_reordered: Callable[[_FeatureFilter], None] | None,
+) -> _FeatureFilter:
+    """
+    Create a filter that measures how long each check of the transaction fields takes and
+    how often it passes for the first transactions it's applied to, then generates the
+    filter again with the checks that are cheapest for how often they fail first.
+
+    Since the field checks have no side effects, the order they're checked in doesn't
+    change what the filter matches; the checks that call functions still run last, in
+    order, and only if all of the field checks pass.
+
+    :param checks: The filter's checks
+    :param reorder_after: The number of transactions to measure the field checks against
+    :param on_reordered: Called with the reordered filter once it's generated
+    :return: The filter
+    """
+    field_checks = [check for check in checks if check.kind != "calls"]
+    user_checks = [check for check in checks if check.kind == "calls"]
+    measured_checks = [_create_check_function(check) for check in field_checks]
+    check_user = _compile_checks(user_checks)
+    # Concurrent polls may apply the filter at the same time, so the measurements and
+    # reordering are guarded (until the filter is reordered)
+    lock = threading.Lock()
+    nanoseconds = [0] * len(field_checks)
+    passes = [0] * len(field_checks)
+    transactions = 0
+    reordered: _FeatureFilter | None = None
+
+    def expected_cost(position: int) -> float:
+        # Checking independent checks in ascending order of their cost over their chance of
+        # failing minimises the expected cost of a filter, and checks that never fail go last
+        fails = transactions - passes[position]
+        return nanoseconds[position] / fails if fails else math.inf
+
+    def predicate(t: Transaction, f: TransactionFeatures) -> bool:
+        nonlocal transactions, reordered
+        if reordered is not None:
+            return reordered(t, f)
+
+        # Every field check is tried to measure it, which is safe as they have no side effects
+        measurements = list[tuple[int, bool]]()
+        for check in measured_checks:
+            start = time.perf_counter_ns()
+            result = check(t, f)
+            measurements.append((time.perf_counter_ns() - start, result))
+
+        with lock:
+            # Measurements that finish after the filter is reordered aren't needed
+            if reordered is None:
+                for position, (elapsed, result) in enumerate(measurements):
+                    nanoseconds[position] += elapsed
+                    passes[position] += result
+                transactions += 1
+                if transactions == reorder_after:
+                    order = sorted(range(len(field_checks)), key=expected_cost)
+                    reordered = _compile_checks(
+                        [*(field_checks[position] for position in order), *user_checks]
+                    )
+                    logger.debug(f"Reordered transaction filter checks to {order}")
+                    if on_reordered is not None:
+                        on_reordered(reordered)
+        return all(result for _, result in measurements) and check_user(t, f)
+
+    return predicate
+
+
+def _reads_transaction_id(
+    transaction_filter: TransactionFilter, arc28_groups: list[Arc28EventGroup]
+) -> bool:
+    """Whether a filter passes transactions to user code, which may read their ID."""
+    return transaction_filter.custom_filter is not None or bool(
+        transaction_filter.arc28_events and any(g.process_transaction for g in arc28_groups)
+    )
+
+
+def _create_algod_pre_filter(transaction_filter: TransactionFilter) -> _AlgodFilter | None:
+    """
+    Create a cheap check on raw algod transactions from the subset of the subscription
+    parameters that can be read straight off the algod model, so transactions that can't
+    match don't need to be transformed.
+
+    :param transaction_filter: The transaction filter parameters
+    :return: A function that is `False` only for transactions the filter can't match, or
+        `None` if none of the parameters can be checked on the algod model
+    """
+    # NOTE: every check here must be mirrored in (and no stricter than) the
+    # corresponding check in `_create_transaction_filter` above
+    filters = list[_AlgodFilter]()
+    if transaction_filter.sender:
+        senders = _make_set(transaction_filter.sender)
+        filters.append(lambda t: t.signed_transaction.txn.sender in senders)
+
+    if transaction_filter.receiver:
+        receivers = _make_set(transaction_filter.receiver)
+        filters.append(lambda t: _get_algod_txn_receiver(t) in receivers)
+
+    if transaction_filter.type:
+        txn_types = _make_set(transaction_filter.type)  # type: ignore[arg-type]
+        filters.append(lambda t: t.signed_transaction.txn.transaction_type.value in txn_types)
+
+    if transaction_filter.note_prefix:
+        if isinstance(transaction_filter.note_prefix, bytes):
+            note_prefix_bytes = transaction_filter.note_prefix
+        else:
+            note_prefix_bytes = transaction_filter.note_prefix.encode("utf-8")
+        filters.append(
+            lambda t: (t.signed_transaction.txn.note or b"").startswith(note_prefix_bytes)
+        )
+
+    if transaction_filter.app_id:
+        app_ids = _make_set(transaction_filter.app_id)
+        filters.append(lambda t: _get_algod_txn_app_id(t) in app_ids)
+
+    if transaction_filter.asset_id:
+        asset_ids = _make_set(transaction_filter.asset_id)
+        filters.append(lambda t: _get_algod_txn_asset_id(t) in asset_ids)
+
+    if len(filters) == 0:
+        return None
     elif len(filters) == 1:
         return filters[0]
     else:
         return lambda t: all(txn_filter(t) for txn_filter in filters)
 
 
+def _create_algod_candidate_filter(filters: CompiledFilters) -> _AlgodFilter | None:
+    """
+    Combine the algod pre-filters of the given filters into a single check that a raw
+    algod transaction may match at least one of them.
+
+    :param filters: The compiled filters
+    :return: The combined check, or `None` if an unindexed filter has no algod pre-filter
+    """
+    if any(filters[position].algod_pre_filter is None for position in filters.residual):
+        return None
+
+    def is_candidate(t: SignedTxnWithAD) -> bool:
+        for position in _get_candidate_filters(filters, t, _INDEXED_ALGOD_TXN_FIELDS):
+            algod_pre_filter = filters[position].algod_pre_filter
+            # an indexed filter without a pre-filter was matched via the index alone
+            if algod_pre_filter is None or algod_pre_filter(t):
+                return True
+        return False
+
+    return is_candidate
+
+
+def _get_filter_index_key(
+    transaction_filter: TransactionFilter,
+) -> tuple[str, frozenset[Hashable]] | None:
+    """
+    Pick the field to index a filter by; the first field, in rough order of how selective
+    it is, that the post-filter requires to be one of a set of values.
+
+    :param transaction_filter: The transaction filter parameters
+    :return: The field name and values, or `None` if the filter can't be indexed
+    """
+    # NOTE: every field here must be checked for membership of the same set of values
+    # in `_create_transaction_filter` above
+    method_selectors = (
+        [method_selector_bytes(sig) for sig in _make_set(transaction_filter.method_signature)]
+        if transaction_filter.method_signature
+        else None
+    )
+    fields: list[tuple[str, Any]] = [
+        ("sender", transaction_filter.sender),
+        ("receiver", transaction_filter.receiver),
+        ("app_id", transaction_filter.app_id),
+        ("asset_id", transaction_filter.asset_id),
+        ("method_selector", method_selectors),
+        ("type", transaction_filter.type),
+    ]
+    for field_name, values in fields:
+        if values:
+            return field_name, frozenset(_make_set(values))
+    return None
+
+
+def _get_algod_txn_method_selector(txn: SignedTxnWithAD) -> bytes | None:
+    app_call = txn.signed_transaction.txn.application_call
+    return app_call.args[0] if app_call and app_call.args else None
+
+
+_INDEXED_TXN_FIELDS: dict[str, Callable[[TransactionFeatures], Hashable]] = {
+    "sender": operator.itemgetter(_SENDER),
+    "receiver": operator.itemgetter(_RECEIVER),
+    "app_id": operator.itemgetter(_APP_ID),
+    "asset_id": operator.itemgetter(_ASSET_ID),
+    "method_selector": operator.itemgetter(_METHOD_SELECTOR),
+    "type": operator.itemgetter(_TYPE),
+}
+
+_INDEXED_ALGOD_TXN_FIELDS: dict[str, Callable[[SignedTxnWithAD], Hashable]] = {
+    "sender": lambda t: t.signed_transaction.txn.sender,
+    "receiver": _get_algod_txn_receiver,
+    "app_id": _get_algod_txn_app_id,
+    "asset_id": _get_algod_txn_asset_id,
+    "method_selector": _get_algod_txn_method_selector,
+    "type": lambda t: t.signed_transaction.txn.transaction_type.value,
+}
+
+
+def _get_candidate_filters[T](
+    filters: CompiledFilters, txn: T, field_getters: Mapping[str, Callable[[T], Hashable]]
+) -> list[int]:
+    """
+    Get the positions of the filters that could match the given transaction.
+
+    :param filters: The compiled filters
+    :param txn: The transaction
+    :param field_getters: How to get the value of each indexed field from the transaction
+    :return: The positions of the unindexed filters and the indexed filters matching the
+        transaction's field values; not in any particular order
+    """
+    positions = filters.residual.copy()
+    for field_name, field_index in filters.by_field.items():
+        positions.extend(field_index.get(field_getters[field_name](txn), ()))
+    return positions
+
+
 def _create_arc28_filter(
     groups: list[Arc28EventGroup], event_filters: list[Arc28EventFilter]
 ) -> _Filter:
@@ -807,14 +1935,18 @@ def _create_arc28_group_filter(self: Arc28EventGroup) -> list[_Filter]:
     return filters
 
 
+def _all_filters(filters: list[_Filter]) -> _Filter:
+    return lambda t: all(f(t) for f in filters)
+
+
 def _create_arc28_group_event_filter(group: Arc28EventGroup, events: list[Arc28Event]) -> _Filter:
     filters = _create_arc28_group_filter(group)
 
-    event_prefixes = tuple(e.prefix for e in events)
+    event_prefixes = {e.prefix for e in events}
 
     def log_filter(txn: Transaction) -> bool:
         logs = txn.logs or []
-        return any(log.startswith(event_prefixes) for log in logs)
+        return any(log[:4] in event_prefixes for log in logs)
 
     filters.append(log_filter)
 
@@ -836,7 +1968,7 @@ def _create_balance_changes_filter(
             filter_sets.append(filter_set)
 
     def txn_filter(txn: Transaction) -> bool:
-        balance_changes = _extract_balance_changes_from_indexer_transaction(txn)
+        balance_changes = _get_balance_changes(txn)
         for balance_change in balance_changes:
             for filter_set in filter_sets:
                 if all(filter_(balance_change) for filter_ in filter_set):
@@ -3,7 +3,7 @@ import dataclasses
 import itertools
 import logging
 import typing
-from collections.abc import Iterator, Sequence
+from collections.abc import Callable, Collection, Iterator, Sequence
 
 from algokit_algod_client import models as algod
 from algokit_indexer_client import models as indexer
@@ -27,6 +27,7 @@ from .types.subscription import (
     BlockMetadata,
     BlockRewards,
     BlockUpgradeState,
+    TransactionFieldGroup,
 )
 
 logger = logging.getLogger(__package__)
@@ -42,26 +43,84 @@ _ON_COMPLETE = {
     OnApplicationComplete.DeleteApplication: indexer.OnCompletion.DELETE,
 }
 
+ALL_TRANSACTION_FIELDS = frozenset(typing.get_args(TransactionFieldGroup))
 
-def get_block_transactions(block: algod.Block) -> list[indexer.Transaction]:
+
+def get_block_transactions(
+    block: algod.Block,
+    is_candidate: Callable[[algod.SignedTxnWithAD], bool] | None = None,
+    fields: Collection[TransactionFieldGroup] | None = None,
+) -> list[indexer.Transaction]:
+    """
+    Transform the transactions in a block into indexer transactions.
+
+    :param block: The block
+    :param is_candidate: An optional check on each raw transaction; top-level transactions
+        are skipped (i.e. not transformed) unless it or one of its inner transactions passes
+    :param fields: The groups of optional fields to convert; defaults to all of them
+    :return: The transformed transactions, plus the block payout transaction if there is one
+    """
+    txns = list[indexer.Transaction]()
+    for txn, algod_txn in iter_block_transactions(block, is_candidate, fields):
+        txn.id_ = algod_txn.tx_id()
+        txns.append(txn)
+    return txns
+
+
+def iter_block_transactions(
+    block: algod.Block,
+    is_candidate: Callable[[algod.SignedTxnWithAD], bool] | None = None,
+    fields: Collection[TransactionFieldGroup] | None = None,
+) -> Iterator[tuple[indexer.Transaction, AlgodTransaction]]:
+    """
+    Transform the transactions in a block into indexer transactions like
+    `get_block_transactions`, but without their transaction IDs.
+
+    Computing an ID means encoding and hashing the transaction, so it's left until the
+    ID is needed: each top-level transaction is yielded along with the algod
+    transaction to compute it from (via `tx_id()`).
+
+    :param block: The block
+    :param is_candidate: An optional check on each raw transaction; top-level transactions
+        are skipped (i.e. not transformed) unless it or one of its inner transactions passes
+    :param fields: The groups of optional fields to convert; defaults to all of them
+    :yields: The transformed transactions, plus the block payout transaction if there is
+        one, each with the algod transaction to compute its ID from
+    :ytype: tuple[indexer.Transaction, AlgodTransaction]
+    """
+    included_fields = ALL_TRANSACTION_FIELDS if fields is None else frozenset(fields)
     intra_round_offset = itertools.count()
-    txns = [
-        _get_indexer_transaction_from_algod_transaction(
-            block,
-            _get_normalized_txn(block.header, txn),
-            intra_round_offset_iter=intra_round_offset,
+    for txn in block.payset or []:
+        if is_candidate is not None and not _is_candidate(txn.signed_transaction, is_candidate):
+            # Keep the offsets of subsequent transactions the same as if it were transformed
+            for _ in range(count_all_transactions([txn.signed_transaction])):
+                next(intra_round_offset)
+            continue
+        normalized_txn = _get_normalized_txn(block.header, txn)
+        yield (
+            _get_indexer_transaction_from_algod_transaction(
+                block,
+                normalized_txn,
+                intra_round_offset_iter=intra_round_offset,
+                fields=included_fields,
+            ),
+            normalized_txn.signed_transaction.txn,
         )
-        for offset, txn in enumerate(block.payset or [])
-    ]
 
     if block.header.proposer_payout and block.header.proposer:
-        payout_txn = _get_synthetic_block_payout_transaction(
-            block,
-            intra_round_offset,
-        )
-        txns.append(payout_txn)
+        yield _get_synthetic_block_payout_transaction(block, intra_round_offset, included_fields)
 
-    return txns
+
+def _is_candidate(
+    txn: algod.SignedTxnWithAD, is_candidate: Callable[[algod.SignedTxnWithAD], bool]
+) -> bool:
+    if is_candidate(txn):
+        return True
+    eval_delta = txn.apply_data.eval_delta if txn.apply_data else None
+    return any(
+        _is_candidate(inner_txn, is_candidate)
+        for inner_txn in (eval_delta.inner_txns if eval_delta else None) or []
+    )
 
 
 def _get_indexer_transaction_from_algod_transaction(
@@ -69,7 +128,7 @@ def _get_indexer_transaction_from_algod_transaction(
     signed_txn_with_ad: algod.SignedTxnWithAD,
     *,
     intra_round_offset_iter: Iterator[int],
-    parent: algod.SignedTxnWithAD | None = None,
+    fields: frozenset[TransactionFieldGroup],
 ) -> indexer.Transaction:
     # Extract from nested structure
     apply_data = signed_txn_with_ad.apply_data
@@ -97,13 +156,14 @@ def _get_indexer_transaction_from_algod_transaction(
                             block,
                             itxn,
                             intra_round_offset_iter=intra_round_offset_iter,
-                            parent=signed_txn_with_ad,
+                            fields=fields,
                         )
                     )
             if eval_delta.shared_accounts:
                 account_references.extend(eval_delta.shared_accounts)
         return indexer.Transaction(
-            id_=transaction.tx_id() if parent is None else None,
+            # The (top-level) transaction ID is computed when it's needed
+            id_=None,
             fee=transaction.fee or 0,
             first_valid=transaction.first_valid,
             last_valid=transaction.last_valid,
@@ -120,8 +180,12 @@ def _get_indexer_transaction_from_algod_transaction(
             closing_amount=(apply_data.closing_amount or 0) if apply_data else 0,
             receiver_rewards=(apply_data.receiver_rewards or 0) if apply_data else 0,
             sender_rewards=(apply_data.sender_rewards or 0) if apply_data else 0,
-            global_state_delta=_convert_global_state_delta(eval_delta),
-            local_state_delta=_convert_local_state_delta(eval_delta, account_references),
+            global_state_delta=_convert_global_state_delta(eval_delta)
+            if "state-deltas" in fields
+            else None,
+            local_state_delta=_convert_local_state_delta(eval_delta, account_references)
+            if "state-deltas" in fields
+            else None,
             logs=logs,
             auth_addr=signed_txn.auth_address,
             note=transaction.note,
@@ -133,13 +197,21 @@ def _get_indexer_transaction_from_algod_transaction(
             asset_config_transaction=_convert_asset_config_transaction(signed_txn_with_ad),
             asset_transfer_transaction=_convert_asset_transfer_transaction(signed_txn_with_ad),
             asset_freeze_transaction=_convert_asset_freeze_transaction(signed_txn_with_ad),
-            application_transaction=_convert_application_transaction(signed_txn_with_ad),
+            application_transaction=_convert_application_transaction(
+                signed_txn_with_ad, include_references="app-references" in fields
+            ),
             keyreg_transaction=_convert_keyreg_transaction(signed_txn_with_ad),
-            state_proof_transaction=_convert_state_proof_transaction(signed_txn_with_ad),
-            heartbeat_transaction=_convert_heartbeat_transaction(signed_txn_with_ad),
+            state_proof_transaction=_convert_state_proof_transaction(
+                signed_txn_with_ad, include_proof="state-proof" in fields
+            ),
+            heartbeat_transaction=_convert_heartbeat_transaction(
+                signed_txn_with_ad, include_proof="heartbeat-proof" in fields
+            ),
             signature=_convert_signature(
                 signed_txn_with_ad.signed_transaction, transaction.transaction_type
-            ),
+            )
+            if "signature" in fields
+            else None,
         )
 
     except Exception as e:
@@ -357,7 +429,7 @@ def _convert_asset_freeze_transaction(
 
 
 def _convert_application_transaction(
-    txn_with_apply_data: algod.SignedTxnWithAD,
+    txn_with_apply_data: algod.SignedTxnWithAD, *, include_references: bool = True
 ) -> indexer.TransactionApplication | None:
     txn = txn_with_apply_data.signed_transaction.txn
     app = txn.application_call
@@ -378,8 +450,12 @@ def _convert_application_transaction(
         accounts=app.account_references or [],
         global_state_schema=_convert_schema(app.global_state_schema),
         local_state_schema=_convert_schema(app.local_state_schema),
-        box_references=[_convert_box_ref(app_id, ref) for ref in app.box_references or []] or None,
-        access=[_convert_access_ref(app_id, ref) for ref in app.access_references or []] or None,
+        box_references=[_convert_box_ref(app_id, ref) for ref in app.box_references or []] or None
+        if include_references
+        else None,
+        access=[_convert_access_ref(app_id, ref) for ref in app.access_references or []] or None
+        if include_references
+        else None,
         reject_version=app.reject_version,
     )
 
@@ -438,7 +514,7 @@ def _convert_keyreg_transaction(
 
 
 def _convert_state_proof_transaction(
-    txn_with_apply_data: algod.SignedTxnWithAD,
+    txn_with_apply_data: algod.SignedTxnWithAD, *, include_proof: bool = True
 ) -> indexer.TransactionStateProof | None:
     txn = txn_with_apply_data.signed_transaction.txn
     state_proof_fields = txn.state_proof
@@ -449,7 +525,7 @@ def _convert_state_proof_transaction(
     state_proof_message = state_proof_fields.message
 
     return indexer.TransactionStateProof(
-        state_proof=_convert_state_proof(state_proof) if state_proof else None,
+        state_proof=_convert_state_proof(state_proof) if state_proof and include_proof else None,
         message=(
             indexer.IndexerStateProofMessage(
                 block_headers_commitment=state_proof_message.block_headers_commitment,
@@ -466,7 +542,7 @@ def _convert_state_proof_transaction(
 
 
 def _convert_heartbeat_transaction(
-    txn_with_apply_data: algod.SignedTxnWithAD,
+    txn_with_apply_data: algod.SignedTxnWithAD, *, include_proof: bool = True
 ) -> indexer.TransactionHeartbeat | None:
     txn = txn_with_apply_data.signed_transaction.txn
     heartbeat = txn.heartbeat
@@ -474,7 +550,7 @@ def _convert_heartbeat_transaction(
         return None
 
     proof = heartbeat.proof
-    if proof:
+    if proof and include_proof:
         hb_proof = indexer.HbProofFields(
             hb_pk=proof.public_key,
             hb_pk1sig=proof.public_key_1_signature,
@@ -569,8 +645,10 @@ def _convert_state_proof_participant(
 
 
 def _get_synthetic_block_payout_transaction(
-    block: algod.Block, intra_round_offset_iter: Iterator[int]
-) -> indexer.Transaction:
+    block: algod.Block,
+    intra_round_offset_iter: Iterator[int],
+    fields: frozenset[TransactionFieldGroup],
+) -> tuple[indexer.Transaction, AlgodTransaction]:
     """
     Gets the synthetic transaction for the block payout as defined in the indexer
 
@@ -599,10 +677,46 @@ def _get_synthetic_block_payout_transaction(
         apply_data=None,
     )
     indexer_txn = _get_indexer_transaction_from_algod_transaction(
-        block, algod_txn, intra_round_offset_iter=intra_round_offset_iter
+        block, algod_txn, intra_round_offset_iter=intra_round_offset_iter, fields=fields
     )
-    indexer_txn.signature = indexer.TransactionSignature()
-    return indexer_txn
+    if "signature" in fields:
+        indexer_txn.signature = indexer.TransactionSignature()
+    return indexer_txn, algod_txn.signed_transaction.txn
+
+
+def project_transaction(
+    transaction: indexer.Transaction, fields: Collection[TransactionFieldGroup]
+) -> indexer.Transaction:
+    """
+    Copy an indexer transaction (and its inner transactions) without the optional fields
+    that aren't in the given groups, so a transaction retrieved from indexer has the same
+    fields as one transformed from a block with the same `fields`.
+
+    :param transaction: The transaction
+    :param fields: The groups of optional fields to keep
+    :return: The projected transaction
+    """
+    changes = dict[str, typing.Any]()
+    if "signature" not in fields:
+        changes["signature"] = None
+    if "state-deltas" not in fields:
+        changes["global_state_delta"] = None
+        changes["local_state_delta"] = None
+    if "app-references" not in fields and transaction.application_transaction:
+        changes["application_transaction"] = dataclasses.replace(
+            transaction.application_transaction, box_references=None, access=None
+        )
+    if "state-proof" not in fields and transaction.state_proof_transaction:
+        changes["state_proof_transaction"] = dataclasses.replace(
+            transaction.state_proof_transaction, state_proof=None
+        )
+    if "heartbeat-proof" not in fields and transaction.heartbeat_transaction:
+        changes["heartbeat_transaction"] = dataclasses.replace(
+            transaction.heartbeat_transaction, hb_proof=indexer.HbProofFields()
+        )
+    if transaction.inner_txns:
+        changes["inner_txns"] = [project_transaction(t, fields) for t in transaction.inner_txns]
+    return dataclasses.replace(transaction, **changes)
 
 
 def block_data_to_block_metadata(block_data: algod.BlockResponse) -> BlockMetadata:
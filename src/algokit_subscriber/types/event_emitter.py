@@ -1,5 +1,7 @@
+import inspect
+import threading
 import typing
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 TEventType = typing.TypeVar("TEventType")
@@ -13,52 +15,115 @@ class EventEmitter:
     """
     A simple event emitter that allows for the registration of event listeners and the
     emission of events to those listeners.
+
+    Events can be emitted from several threads at once; each one-time listener is only
+    called by the first of them.
     """
 
     def __init__(self) -> None:
         self._listeners: dict[str, list[EventListener]] = {}
         self._one_time_listeners: dict[str, list[EventListener]] = {}
+        self._lock = threading.Lock()
 
     def emit(self, event_name: str, event: Any) -> None:  # noqa: ANN401
         """
         Emits an event to all listeners registered for the event name.
         """
-        if event_name in self._listeners:
-            for listener in self._listeners[event_name]:
-                listener(event, event_name)
-                if event_name in self._one_time_listeners:
-                    self._listeners[event_name].remove(listener)
-                    self._one_time_listeners[event_name].remove(listener)
+        with self._lock:
+            listeners = list(self._listeners.get(event_name, []))
+            for listener in listeners:
+                if listener in self._one_time_listeners.get(event_name, []):
+                    self._remove_listener(event_name, listener)
+        for listener in listeners:
+            listener(event, event_name)
 
     def on(self, event_name: str, listener: EventListener) -> "EventEmitter":
         """
         Registers a listener for the given event name.
         """
-        if event_name not in self._listeners:
-            self._listeners[event_name] = []
-
-        self._listeners[event_name].append(listener)
+        with self._lock:
+            self._listeners.setdefault(event_name, []).append(listener)
         return self
 
     def once(self, event_name: str, listener: EventListener) -> "EventEmitter":
         """
         Registers a listener for the given event name that will only be called once.
         """
-        if event_name not in self._one_time_listeners:
-            self._one_time_listeners[event_name] = []
+        with self._lock:
+            self._one_time_listeners.setdefault(event_name, []).append(listener)
+            self._listeners.setdefault(event_name, []).append(listener)
+        return self
+
+    def remove_listener(self, event_name: str, listener: EventListener) -> "EventEmitter":
+        """
+        Removes a listener for the given event name.
+        """
+        with self._lock:
+            self._remove_listener(event_name, listener)
+        return self
+
+    off = remove_listener
+
+    def _remove_listener(self, event_name: str, listener: EventListener) -> None:
+        if listener in self._listeners.get(event_name, []):
+            self._listeners[event_name].remove(listener)
+
+        if listener in self._one_time_listeners.get(event_name, []):
+            self._one_time_listeners[event_name].remove(listener)
+
+
+AsyncEventListener = Callable[[TEventType, str], Awaitable[None] | None]
+"""
+A function, or coroutine function, that takes an event and event name.
+"""
+
+
+class AsyncEventEmitter:
+    """
+    An event emitter for use with asyncio that awaits any coroutine listeners, in
+    registration order, when an event is emitted.
+    """
+
+    def __init__(self) -> None:
+        self._listeners: dict[str, list[AsyncEventListener]] = {}
+        self._one_time_listeners: dict[str, list[AsyncEventListener]] = {}
+
+    async def emit(self, event_name: str, event: Any) -> None:  # noqa: ANN401
+        """
+        Emits an event to all listeners registered for the event name, awaiting
+        each listener before calling the next.
+        """
+        for listener in list(self._listeners.get(event_name, [])):
+            if listener in self._one_time_listeners.get(event_name, []):
+                self.remove_listener(event_name, listener)
+            result = listener(event, event_name)
+            if inspect.isawaitable(result):
+                await result
 
-        self._one_time_listeners[event_name].append(listener)
+    def on(self, event_name: str, listener: AsyncEventListener) -> "AsyncEventEmitter":
+        """
+        Registers a listener for the given event name.
+        """
+        self._listeners.setdefault(event_name, []).append(listener)
+        return self
 
+    def once(self, event_name: str, listener: AsyncEventListener) -> "AsyncEventEmitter":
+        """
+        Registers a listener for the given event name that will only be called once.
+        """
+        self._one_time_listeners.setdefault(event_name, []).append(listener)
         return self.on(event_name, listener)
 
-    def remove_listener(self, event_name: str, listener: EventListener) -> "EventEmitter":
+    def remove_listener(
+        self, event_name: str, listener: AsyncEventListener
+    ) -> "AsyncEventEmitter":
         """
         Removes a listener for the given event name.
         """
-        if event_name in self._listeners:
+        if listener in self._listeners.get(event_name, []):
             self._listeners[event_name].remove(listener)
 
-        if event_name in self._one_time_listeners:
+        if listener in self._one_time_listeners.get(event_name, []):
             self._one_time_listeners[event_name].remove(listener)
 
         return self
@@ -1,8 +1,9 @@
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Hashable, Sequence
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Literal
 
+from algokit_algod_client.models import BlockResponse
 from algokit_indexer_client.models import Transaction
 
 from algokit_subscriber.types.arc28 import Arc28EventFilter, Arc28EventGroup, EmittedArc28Event
@@ -249,6 +250,53 @@ class SubscribedTransaction(Transaction):
     """The balance changes in the transaction."""
 
 
+@dataclass(kw_only=True, slots=True)
+class SubscriptionPollStats:
+    """Performance statistics for a subscription poll (or a batch of one)."""
+
+    fetch_seconds: float = 0.0
+    """The time spent retrieving blocks from algod (or the block cache)."""
+
+    mapping_seconds: float = 0.0
+    """The time spent transforming algod transactions into subscribed transactions."""
+
+    filtering_seconds: float = 0.0
+    """The time spent running the filters against the transformed transactions."""
+
+    block_metadata_seconds: float = 0.0
+    """The time spent extracting block metadata."""
+
+    enrichment_seconds: float = 0.0
+    """The time spent decoding ARC-28 events and balance changes of matched transactions."""
+
+    indexer_seconds: float = 0.0
+    """The time spent catching up via indexer, including post-filtering."""
+
+    handler_seconds: float = 0.0
+    """
+    The time spent mapping the matched transactions and running their event handlers;
+    only set for polls made by a subscriber.
+    """
+
+    blocks_fetched: int = 0
+    """The number of blocks retrieved from algod (or the block cache)."""
+
+    transactions_retrieved: int = 0
+    """The number of (top-level) transactions in the retrieved blocks."""
+
+    transactions_transformed: int = 0
+    """
+    The number of (top-level) algod transactions that were transformed, i.e. that
+    weren't skipped as not possibly matching any filter.
+    """
+
+    transactions_matched: dict[str, int] = field(default_factory=dict)
+    """The number of subscribed transactions matched by each filter name."""
+
+    indexer_pages_fetched: int = 0
+    """The number of pages requested from indexer."""
+
+
 @dataclass(kw_only=True, slots=True)
 class TransactionSubscriptionResult:
     """The result of a single subscription pull/poll."""
@@ -284,6 +332,16 @@ class TransactionSubscriptionResult:
     of the subscription poll.
     """
 
+    transactions_by_filter: dict[str, list[SubscribedTransaction]] = field(default_factory=dict)
+    """
+    The subscribed transactions grouped by the name of each filter they matched, in
+    the same order as `subscribed_transactions`. Filters that matched nothing are
+    omitted.
+    """
+
+    stats: SubscriptionPollStats = field(default_factory=SubscriptionPollStats)
+    """Performance statistics for the poll."""
+
 
 @dataclass(kw_only=True, slots=True)
 class BeforePollMetadata:
@@ -408,6 +466,10 @@ SyncBehaviour = Literal[
     "catchup-with-indexer", "fail", "skip-sync-newest", "sync-oldest", "sync-oldest-start-now"
 ]
 
+TransactionFieldGroup = Literal[
+    "app-references", "heartbeat-proof", "signature", "state-deltas", "state-proof"
+]
+
 
 @dataclass(kw_only=True, slots=True)
 class NamedTransactionFilter:
@@ -420,6 +482,44 @@ class NamedTransactionFilter:
     """The filter itself."""
 
 
+@dataclass(kw_only=True, slots=True)
+class BlockCache:
+    get: Callable[[int], BlockResponse | None]
+    """Method to retrieve the cached block for a round, or `None` if it isn't cached"""
+
+    put: Callable[[int, BlockResponse], None]
+    """Method to cache the block for a round"""
+
+
+@dataclass(kw_only=True, slots=True)
+class IndexerPage:
+    """A page of an indexer transaction search that has been consumed."""
+
+    min_round: int
+    """The first round of the range that was searched"""
+
+    max_round: int
+    """The last round of the range that was searched"""
+
+    next_token: str | None
+    """The token to retrieve the next page with, or `None` if this was the last page"""
+
+    transactions: list[Transaction]
+    """The transactions in the page"""
+
+
+@dataclass(kw_only=True, slots=True)
+class IndexerCheckpointStore:
+    load: Callable[[str], list[IndexerPage]]
+    """Method to retrieve the pages consumed so far for a search, in order"""
+
+    append: Callable[[str, IndexerPage], None]
+    """Method to record that a page of a search has been consumed"""
+
+    delete: Callable[[str], None]
+    """Method to discard the pages recorded for a search"""
+
+
 @dataclass(kw_only=True, slots=True)
 class CoreTransactionSubscriptionParams:
     filters: Sequence[NamedTransactionFilter]
@@ -428,6 +528,23 @@ class CoreTransactionSubscriptionParams:
     arc28_events: list[Arc28EventGroup] | None = None
     """Any ARC-28 event definitions to process from app call logs."""
 
+    transaction_fields: Sequence[TransactionFieldGroup] | None = None
+    """
+    The groups of (expensive to convert) transaction fields to include in subscribed
+    transactions; the fields of any other group are left unset, which saves the time
+    and memory it takes to convert them. Defaults to None i.e. all fields are included.
+
+    `signature`: `signature`, including multisig subsignatures and logicsig programs
+    `state-deltas`: `global_state_delta` and `local_state_delta`
+    `state-proof`: the `state_proof` (reveals and Merkle proofs) of
+        `state_proof_transaction`
+    `heartbeat-proof`: the `hb_proof` of `heartbeat_transaction`
+    `app-references`: the `box_references` and `access` of `application_transaction`
+
+    The other fields are always included. None of the built-in filters use these fields,
+    but note that a `custom_filter` only sees the ones that are included.
+    """
+
     max_rounds_to_sync: int = 500
     """
     The maximum number of rounds to sync from algod for each subscription pull/poll.
@@ -440,6 +557,50 @@ class CoreTransactionSubscriptionParams:
     `sync_behaviour: 'catchup-with-indexer'`.
     """
 
+    max_concurrent_indexer_requests: int = 1
+    """
+    The maximum number of filters to search indexer for at once when using
+    `sync_behaviour: 'catchup-with-indexer'`. Results are merged in filter order so
+    they are identical either way. Defaults to 1 i.e. one filter at a time.
+    """
+
+    split_indexer_round_ranges: bool = False
+    """
+    Whether to also split the round range of each indexer search into sub-ranges that
+    are paginated concurrently (up to `max_concurrent_indexer_requests` requests in
+    flight) and merged in order. Sub-ranges that return a full page are subdivided, so
+    the split adapts to the density of matching transactions.
+    """
+
+    max_concurrent_block_requests: int = 1
+    """
+    The maximum number of algod block requests to have in flight at once when
+    syncing rounds from algod. Blocks are still processed in round order.
+    Defaults to 1 i.e. blocks are retrieved one at a time.
+    """
+
+    prefetch_blocks: bool = False
+    """
+    Whether to retrieve the next batch of blocks from algod in the background
+    while the current batch is being transformed and filtered. Results and
+    watermarks are identical either way.
+    """
+
+    block_cache: BlockCache | None = None
+    """
+    An optional cache in front of algod block retrieval e.g. `file_block_cache(...)`.
+    Cached rounds are served without calling algod, which makes re-syncing
+    previously seen rounds (e.g. after adding a filter) much faster.
+    """
+
+    indexer_checkpoint_store: IndexerCheckpointStore | None = None
+    """
+    An optional store to checkpoint indexer pagination in when using
+    `sync_behaviour: 'catchup-with-indexer'` e.g. `file_indexer_checkpoint_store(...)`.
+    Each page is recorded as it's consumed so if the process stops part way through
+    catching up, the next poll continues from the last page rather than starting over.
+    """
+
     sync_behaviour: SyncBehaviour
     """
     If the current tip of the configured Algorand blockchain is more than
@@ -514,3 +675,18 @@ class AlgorandSubscriberConfig(CoreTransactionSubscriptionParams):
     Whether to wait via algod `/status/wait-for-block-after` endpoint when at
     the tip of the chain; reduces latency of subscription
     """
+
+    max_concurrent_handlers: int = 1
+    """
+    The maximum number of `on` / `on_batch` handlers to run at once for each poll.
+    Events with the same ordering key (see `handler_ordering_key`) are always handled
+    one at a time in order, and the watermark only advances once every handler for the
+    poll has completed. Defaults to 1 i.e. every handler runs in order.
+    """
+
+    handler_ordering_key: Callable[[str, Any], Hashable] | None = None
+    """
+    When running handlers concurrently, returns the key to order the event for a
+    filter name and (mapped) transaction by e.g. `lambda _, t: t.sender`. Defaults to
+    the filter name. Batch events are always ordered by their filter name.
+    """
@@ -0,0 +1,402 @@
+"""
+Synthetic algod blocks built in memory, and an algod client that serves them, so
+subscriptions can be tested and benchmarked without a node.
+
+There are builders for individual transactions and blocks, and for blocks that are
+(realistically shaped) worst cases for each stage of processing a subscription.
+"""
+
+import itertools
+from types import SimpleNamespace
+
+from algokit_algod_client import models as algod
+from algokit_common import address_from_public_key
+from algokit_transact import (
+    AppCallTransactionFields,
+    AssetTransferTransactionFields,
+    HeartbeatProof,
+    HeartbeatTransactionFields,
+    OnApplicationComplete,
+    PaymentTransactionFields,
+    StateProofTransactionFields,
+    Transaction,
+    TransactionType,
+)
+from algokit_transact.models import app_call
+from algokit_transact.models import state_proof as sp
+
+from algokit_subscriber import Arc28Event, Arc28EventArg
+
+GENESIS_ID = "dockernet-v1"
+GENESIS_HASH = bytes.fromhex("e062008fb39333426137530c54fb121e663ae2159155f1e73b37d555a74fef9d")
+ZERO_ADDRESS = "AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAY5HFKQ"
+SENDER = "RWJLJCMQAFZ2ATP2INM2GZTKNL6OULCCUBO5TQPXH3V2KR4AG7U5UA5JNM"
+RECEIVER = "PHWNJTJMA6E4RYZX4SN46QO3OYEXCB46ZIR7B7NJEN5R7PARRKZJBB4FUU"
+
+
+def make_block(
+    round_: int, payset: list[algod.SignedTxnInBlock] | None = None
+) -> algod.BlockResponse:
+    return algod.BlockResponse(
+        block=algod.Block(
+            header=algod.BlockHeader(
+                round=round_,
+                timestamp=1758701734 + round_,
+                genesis_id=GENESIS_ID,
+                genesis_hash=GENESIS_HASH,
+                previous_block_hash=bytes(32),
+                seed=bytes(32),
+                txn_commitments=algod.TxnCommitments(native_sha512_256_commitment=bytes(32)),
+                reward_state=algod.RewardState(
+                    fee_sink=ZERO_ADDRESS,
+                    rewards_pool=ZERO_ADDRESS,
+                    rewards_recalculation_round=500000,
+                ),
+                upgrade_state=algod.UpgradeState(current_protocol="future"),
+                participation_updates=algod.ParticipationUpdates(),
+                txn_counter=1000 + round_,
+            ),
+            payset=payset or [],
+        ),
+        cert={"rnd": round_},
+    )
+
+
+def in_block(
+    txn: Transaction, apply_data: algod.ApplyData | None = None
+) -> algod.SignedTxnInBlock:
+    return algod.SignedTxnInBlock(
+        signed_transaction=algod.SignedTxnWithAD(
+            signed_transaction=algod.SignedTransaction(txn=txn, sig=bytes(64)),
+            apply_data=apply_data or algod.ApplyData(),
+        ),
+        has_genesis_id=True,
+    )
+
+
+def make_payment(
+    round_: int,
+    *,
+    sender: str = SENDER,
+    receiver: str = RECEIVER,
+    amount: int = 1000,
+    note: bytes | None = None,
+) -> algod.SignedTxnInBlock:
+    return in_block(
+        Transaction(
+            transaction_type=TransactionType.Payment,
+            sender=sender,
+            fee=1000,
+            first_valid=round_,
+            last_valid=round_ + 1000,
+            genesis_id=GENESIS_ID,
+            genesis_hash=GENESIS_HASH,
+            note=note,
+            payment=PaymentTransactionFields(receiver=receiver, amount=amount),
+        )
+    )
+
+
+def make_asset_transfer(
+    round_: int,
+    *,
+    asset_id: int,
+    sender: str = SENDER,
+    receiver: str = RECEIVER,
+    amount: int = 1,
+) -> algod.SignedTxnInBlock:
+    return in_block(
+        Transaction(
+            transaction_type=TransactionType.AssetTransfer,
+            sender=sender,
+            fee=1000,
+            first_valid=round_,
+            last_valid=round_ + 1000,
+            genesis_id=GENESIS_ID,
+            genesis_hash=GENESIS_HASH,
+            asset_transfer=AssetTransferTransactionFields(
+                asset_id=asset_id, receiver=receiver, amount=amount
+            ),
+        )
+    )
+
+
+def make_app_call(  # noqa: PLR0913
+    round_: int,
+    *,
+    app_id: int,
+    sender: str = SENDER,
+    args: list[bytes] | None = None,
+    logs: list[bytes] | None = None,
+    inner_txns: list[algod.SignedTxnWithAD] | None = None,
+    box_references: list[app_call.BoxReference] | None = None,
+    global_delta: dict[bytes, algod.BlockEvalDelta] | None = None,
+    local_deltas: dict[int, dict[bytes, algod.BlockEvalDelta]] | None = None,
+) -> algod.SignedTxnInBlock:
+    return in_block(
+        Transaction(
+            transaction_type=TransactionType.AppCall,
+            sender=sender,
+            fee=1000,
+            first_valid=round_,
+            last_valid=round_ + 1000,
+            genesis_id=GENESIS_ID,
+            genesis_hash=GENESIS_HASH,
+            application_call=AppCallTransactionFields(
+                app_id=app_id,
+                on_complete=OnApplicationComplete.NoOp,
+                args=args,
+                box_references=box_references,
+            ),
+        ),
+        algod.ApplyData(
+            eval_delta=algod.BlockAppEvalDelta(
+                global_delta=global_delta,
+                local_deltas=local_deltas,
+                logs=logs,
+                inner_txns=inner_txns,
+            )
+            if logs or inner_txns or global_delta or local_deltas
+            else None
+        ),
+    )
+
+
+def as_inner(txn_in_block: algod.SignedTxnInBlock) -> algod.SignedTxnWithAD:
+    signed = txn_in_block.signed_transaction
+    return algod.SignedTxnWithAD(
+        signed_transaction=algod.SignedTransaction(txn=signed.signed_transaction.txn),
+        apply_data=signed.apply_data,
+    )
+
+
+class FakeAlgod:
+    """An in-memory stand-in for the algod client serving pre-built blocks."""
+
+    def __init__(self, blocks: list[algod.BlockResponse]) -> None:
+        self.blocks = {b.block.header.round: b for b in blocks}
+        self.requested_rounds = list[int]()
+        self.status_calls = 0
+
+    def block(self, round_: int) -> algod.BlockResponse:
+        self.requested_rounds.append(round_)
+        return self.blocks[round_]
+
+    def status(self) -> SimpleNamespace:
+        self.status_calls += 1
+        return SimpleNamespace(last_round=max(self.blocks))
+
+
+ACCOUNTS = [address_from_public_key(i.to_bytes(32, "big")) for i in range(1, 1001)]
+"""A pool of accounts to send transactions between."""
+
+SWAPPED = Arc28Event(
+    name="Swapped",
+    args=[
+        Arc28EventArg(name="asset_in", type="uint64"),
+        Arc28EventArg(name="asset_out", type="uint64"),
+        Arc28EventArg(name="amount_in", type="uint64"),
+        Arc28EventArg(name="amount_out", type="uint64"),
+    ],
+)
+LIQUIDITY = Arc28Event(
+    name="Liquidity",
+    args=[Arc28EventArg(name="pool", type="address"), Arc28EventArg(name="lp", type="uint64")],
+)
+DEX_APP_ID = 1001
+
+
+def _account(n: int) -> str:
+    return ACCOUNTS[n % len(ACCOUNTS)]
+
+
+def dense_payment_block(round_: int, transactions: int = 5000) -> algod.BlockResponse:
+    """A full block of payments and asset transfers between many accounts."""
+    return make_block(
+        round_,
+        [
+            make_payment(round_, sender=_account(i), receiver=_account(i * 7 + 1), amount=i)
+            if i % 4
+            else make_asset_transfer(
+                round_, asset_id=i % 50 + 1, sender=_account(i), receiver=_account(i + 3)
+            )
+            for i in range(transactions)
+        ],
+    )
+
+
+def _inner_tree(
+    round_: int, depth: int, fanout: int, ids: "itertools.count[int]"
+) -> list[algod.SignedTxnWithAD]:
+    if depth == 0:
+        return []
+    return [
+        as_inner(
+            make_app_call(
+                round_,
+                app_id=next(ids),
+                sender=_account(round_),
+                inner_txns=_inner_tree(round_, depth - 1, fanout, ids)
+                or [as_inner(make_payment(round_, sender=_account(round_)))],
+            )
+        )
+        for _ in range(fanout)
+    ]
+
+
+def inner_transaction_tree_block(
+    round_: int, transactions: int = 50, depth: int = 4, fanout: int = 3
+) -> algod.BlockResponse:
+    """
+    A block of app calls that each have a deep tree of inner app calls, ending in
+    payments (each top-level transaction has (fanout ^ depth) leaves).
+    """
+    ids = itertools.count(2000)
+    return make_block(
+        round_,
+        [
+            make_app_call(
+                round_,
+                app_id=DEX_APP_ID,
+                sender=_account(i),
+                inner_txns=_inner_tree(round_, depth, fanout, ids),
+            )
+            for i in range(transactions)
+        ],
+    )
+
+
+def _swap_log(n: int) -> bytes:
+    return SWAPPED.prefix + SWAPPED.abi_type.encode([n % 50 + 1, n % 49 + 2, n * 1000, n * 997])
+
+
+def _liquidity_log(n: int) -> bytes:
+    return LIQUIDITY.prefix + LIQUIDITY.abi_type.encode([_account(n), n])
+
+
+def log_heavy_app_call_block(
+    round_: int, transactions: int = 1000, logs: int = 16
+) -> algod.BlockResponse:
+    """A block of DEX app calls that each emit many ARC-28 events and some other logs."""
+    return make_block(
+        round_,
+        [
+            make_app_call(
+                round_,
+                app_id=DEX_APP_ID,
+                sender=_account(i),
+                args=[SWAPPED.prefix, i.to_bytes(8, "big")],
+                logs=[
+                    _swap_log(i + j)
+                    if j % 3 == 0
+                    else _liquidity_log(i + j)
+                    if j % 3 == 1
+                    else b"trace: " + j.to_bytes(8, "big")
+                    for j in range(logs)
+                ],
+            )
+            for i in range(transactions)
+        ],
+    )
+
+
+def _merkle_proof(depth: int, seed: int) -> sp.MerkleArrayProof:
+    return sp.MerkleArrayProof(
+        path=[bytes([(seed + i) % 256]) * 64 for i in range(depth)],
+        hash_factory=sp.HashFactory(hash_type=1),
+        tree_depth=depth,
+    )
+
+
+def _state_proof_transaction(round_: int, reveals: int) -> Transaction:
+    return Transaction(
+        transaction_type=TransactionType.StateProof,
+        sender="XM6FEYVJ2XDU2IBH4OT6VZGW75YM63CM4TC6AV6BD3JZXFJUIICYTVB5EU",
+        first_valid=round_,
+        last_valid=round_ + 1000,
+        genesis_id=GENESIS_ID,
+        genesis_hash=GENESIS_HASH,
+        state_proof=StateProofTransactionFields(
+            state_proof_type=0,
+            state_proof=sp.StateProof(
+                sig_commit=bytes(64),
+                signed_weight=2**50,
+                sig_proofs=_merkle_proof(20, round_),
+                part_proofs=_merkle_proof(20, round_ + 1),
+                merkle_signature_salt_version=0,
+                reveals={
+                    position: sp.Reveal(
+                        participant=sp.Participant(
+                            verifier=sp.MerkleSignatureVerifier(
+                                commitment=bytes([position % 256]) * 64, key_lifetime=256
+                            ),
+                            weight=10**12 + position,
+                        ),
+                        sigslot=sp.SigslotCommit(
+                            sig=sp.FalconSignatureStruct(
+                                signature=bytes([position % 256]) * 1230,
+                                vector_commitment_index=position,
+                                proof=_merkle_proof(16, position),
+                                verifying_key=sp.FalconVerifier(public_key=bytes(1793)),
+                            ),
+                            lower_sig_weight=position,
+                        ),
+                    )
+                    for position in range(reveals)
+                },
+                positions_to_reveal=list(range(reveals)),
+            ),
+            message=sp.StateProofMessage(
+                block_headers_commitment=bytes(32),
+                voters_commitment=bytes(32),
+                ln_proven_weight=2**40,
+                first_attested_round=round_ - 256,
+                last_attested_round=round_,
+            ),
+        ),
+    )
+
+
+def state_proof_block(round_: int, reveals: int = 200) -> algod.BlockResponse:
+    """A block with a (large) state proof transaction alongside some payments."""
+    return make_block(
+        round_,
+        [
+            in_block(_state_proof_transaction(round_, reveals)),
+            *(make_payment(round_, sender=_account(i), amount=i) for i in range(100)),
+        ],
+    )
+
+
+def heartbeat_block(round_: int, transactions: int = 500) -> algod.BlockResponse:
+    """A block of heartbeat transactions for many online accounts."""
+    return make_block(
+        round_,
+        [
+            in_block(
+                Transaction(
+                    transaction_type=TransactionType.Heartbeat,
+                    sender=_account(i),
+                    fee=0,
+                    first_valid=round_,
+                    last_valid=round_ + 10,
+                    genesis_id=GENESIS_ID,
+                    genesis_hash=GENESIS_HASH,
+                    heartbeat=HeartbeatTransactionFields(
+                        address=_account(i + 1),
+                        proof=HeartbeatProof(
+                            signature=bytes(64),
+                            public_key=bytes(32),
+                            public_key_2=bytes(32),
+                            public_key_1_signature=bytes(64),
+                            public_key_2_signature=bytes(64),
+                        ),
+                        seed=bytes(32),
+                        vote_id=bytes(32),
+                        key_dilution=10_000,
+                    ),
+                )
+            )
+            for i in range(transactions)
+        ],
+    )
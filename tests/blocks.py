@@ -0,0 +1,151 @@
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+from algokit_algod_client import models as algod
+from algokit_indexer_client import models as indexer
+
+from algokit_subscriber._transform import get_block_transactions
+from synthetic.blocks import FakeAlgod
+
+
+class FakeAsyncAlgod:
+    """An asyncio stand-in for algod serving pre-built blocks."""
+
+    def __init__(self, blocks: list[algod.BlockResponse]) -> None:
+        self.algod = FakeAlgod(blocks)
+
+    async def block(self, round_: int) -> algod.BlockResponse:
+        await asyncio.sleep(0)
+        return self.algod.block(round_)
+
+    async def status(self) -> SimpleNamespace:
+        return self.algod.status()
+
+    async def status_after_block(self, _round: int) -> SimpleNamespace:
+        await asyncio.sleep(0)
+        return self.algod.status()
+
+
+def _matches_search(  # noqa: PLR0913
+    txn: indexer.Transaction,
+    *,
+    tx_type: str | None = None,
+    address: str | None = None,
+    address_role: str | None = None,
+    application_id: int | None = None,
+    asset_id: int | None = None,
+) -> bool:
+    # Like indexer, a transaction matches if it or any of its inner transactions match
+    if any(
+        _matches_search(
+            t,
+            tx_type=tx_type,
+            address=address,
+            address_role=address_role,
+            application_id=application_id,
+            asset_id=asset_id,
+        )
+        for t in txn.inner_txns or []
+    ):
+        return True
+    receiver = (txn.payment_transaction and txn.payment_transaction.receiver) or (
+        txn.asset_transfer_transaction and txn.asset_transfer_transaction.receiver
+    )
+    if tx_type is not None and txn.tx_type != tx_type:
+        return False
+    if address is not None and address_role == "sender" and txn.sender != address:
+        return False
+    if address is not None and address_role == "receiver" and receiver != address:
+        return False
+    if application_id is not None and (
+        txn.application_transaction is None
+        or txn.application_transaction.application_id != application_id
+    ):
+        return False
+    return asset_id is None or (
+        txn.asset_transfer_transaction is not None
+        and txn.asset_transfer_transaction.asset_id == asset_id
+    )
+
+
+def _position(txn: indexer.Transaction) -> tuple[int, int]:
+    return txn.confirmed_round or 0, txn.intra_round_offset or 0
+
+
+class FakeIndexer:
+    """
+    An in-memory stand-in for the indexer client searching pre-built blocks.
+
+    Only the type, address, application and asset search criteria are applied; the
+    rest are left to the subscriber's post-filters. Like indexer, results are returned
+    newest to oldest when searching by address, and the next token is the position of the
+    last result, so it can continue a search over a different round range.
+    """
+
+    def __init__(
+        self,
+        blocks: list[algod.BlockResponse],
+        delay: float = 0,
+        max_page_size: int | None = None,
+    ) -> None:
+        self.transactions = [t for b in blocks for t in get_block_transactions(b.block)]
+        self.delay = delay
+        self.max_page_size = max_page_size
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def search_for_transactions(  # noqa: PLR0913
+        self,
+        *,
+        limit: int | None = None,
+        next_: str | None = None,
+        min_round: int | None = None,
+        max_round: int | None = None,
+        tx_type: str | None = None,
+        address: str | None = None,
+        address_role: str | None = None,
+        application_id: int | None = None,
+        asset_id: int | None = None,
+        **_kwargs: object,
+    ) -> SimpleNamespace:
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            matches = [
+                t
+                for t in self.transactions
+                if (min_round or 0) <= (t.confirmed_round or 0) <= (max_round or 2**64)
+                and _matches_search(
+                    t,
+                    tx_type=tx_type,
+                    address=address,
+                    address_role=address_role,
+                    application_id=application_id,
+                    asset_id=asset_id,
+                )
+            ]
+            if address is not None:
+                matches.reverse()
+            if next_:
+                last = tuple(int(part) for part in next_.split(":"))
+                matches = [
+                    t
+                    for t in matches
+                    if (_position(t) < last if address is not None else _position(t) > last)
+                ]
+            limit = min(limit or len(matches), self.max_page_size or len(matches))
+            page = matches[:limit]
+            return SimpleNamespace(
+                transactions=page,
+                next_token=":".join(str(p) for p in _position(page[-1])) if page else None,
+            )
+        finally:
+            with self._lock:
+                self.in_flight -= 1
@@ -0,0 +1,278 @@
+import dataclasses
+
+import pytest
+from algokit_indexer_client.models import Transaction
+from algokit_transact import Transaction as AlgodTransaction
+
+from algokit_subscriber import compile_filters, get_subscribed_transactions
+from algokit_subscriber._subscription import (
+    _extract_balance_changes_from_indexer_transaction,
+    _get_balance_changes,
+)
+from algokit_subscriber._transform import get_block_transactions
+from algokit_subscriber.types.subscription import (
+    BalanceChange,
+    BalanceChangeFilter,
+    NamedTransactionFilter,
+    TransactionFilter,
+    TransactionSubscriptionParams,
+    TransactionSubscriptionResult,
+)
+from synthetic.blocks import (
+    RECEIVER,
+    SENDER,
+    FakeAlgod,
+    as_inner,
+    make_app_call,
+    make_asset_transfer,
+    make_block,
+    make_payment,
+)
+
+OTHER = "A4DQOBYHA4DQOBYHA4DQOBYHA4DQOBYHA4DQOBYHA4DQOBYHA4DVZ36IB4"
+
+
+def _chain(rounds: int) -> FakeAlgod:
+    return FakeAlgod(
+        [
+            make_block(
+                r,
+                [
+                    make_payment(r, amount=r),
+                    make_payment(r, sender=OTHER, receiver=SENDER, amount=r),
+                    make_asset_transfer(r, asset_id=r % 3 + 1),
+                ],
+            )
+            for r in range(1, rounds + 1)
+        ]
+    )
+
+
+def _subscribe(algod: FakeAlgod, **kwargs: object) -> TransactionSubscriptionResult:
+    return get_subscribed_transactions(
+        TransactionSubscriptionParams(
+            filters=[
+                NamedTransactionFilter(
+                    name="payments", filter=TransactionFilter(type="pay", receiver=RECEIVER)
+                ),
+                NamedTransactionFilter(
+                    name="asset-1", filter=TransactionFilter(type="axfer", asset_id=1)
+                ),
+                NamedTransactionFilter(name="sender", filter=TransactionFilter(sender=SENDER)),
+            ],
+            watermark=0,
+            current_round=95,
+            max_rounds_to_sync=100,
+            sync_behaviour="sync-oldest",
+            **kwargs,  # type: ignore[arg-type]
+        ),
+        algod,  # type: ignore[arg-type]
+    )
+
+
+def _summary(result: TransactionSubscriptionResult) -> object:
+    return (
+        result.synced_round_range,
+        result.new_watermark,
+        [(t.id_, t.filters_matched) for t in result.subscribed_transactions],
+        [b.round for b in result.block_metadata or []],
+    )
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"max_concurrent_block_requests": 4},
+        {"prefetch_blocks": True},
+        {"prefetch_blocks": True, "max_concurrent_block_requests": 8},
+    ],
+)
+def test_concurrent_and_prefetched_sync_match_sequential_sync(options: dict[str, object]) -> None:
+    expected = _subscribe(_chain(95))
+
+    result = _subscribe(_chain(95), **options)
+
+    assert _summary(result) == _summary(expected)
+    assert len(expected.subscribed_transactions) == 95 * 2
+    assert expected.new_watermark == 95
+
+
+def test_prefetch_raises_block_errors() -> None:
+    algod = _chain(95)
+    del algod.blocks[64]
+
+    with pytest.raises(KeyError):
+        _subscribe(algod, prefetch_blocks=True)
+
+
+def _nested_chain(rounds: int) -> FakeAlgod:
+    return FakeAlgod(
+        [
+            make_block(
+                r,
+                [
+                    make_payment(r, sender=OTHER, amount=r),
+                    make_app_call(
+                        r,
+                        app_id=10 + r % 2,
+                        sender=OTHER,
+                        inner_txns=[
+                            as_inner(make_asset_transfer(r, asset_id=5, sender=OTHER)),
+                            as_inner(
+                                make_app_call(
+                                    r,
+                                    app_id=20,
+                                    sender=OTHER,
+                                    inner_txns=[as_inner(make_payment(r, note=b"inner:1"))],
+                                )
+                            ),
+                        ],
+                    ),
+                    make_payment(r, sender=OTHER, receiver=OTHER, note=b"outer:2"),
+                    make_asset_transfer(r, asset_id=r, sender=OTHER, receiver=OTHER),
+                ],
+            )
+            for r in range(1, rounds + 1)
+        ]
+    )
+
+
+_PUSHDOWN_FILTERS = [
+    NamedTransactionFilter(name="inner-sender", filter=TransactionFilter(sender=SENDER)),
+    NamedTransactionFilter(name="app", filter=TransactionFilter(app_id=[11, 20])),
+    NamedTransactionFilter(name="asset", filter=TransactionFilter(type="axfer", asset_id=7)),
+    NamedTransactionFilter(name="note", filter=TransactionFilter(note_prefix="outer:")),
+    NamedTransactionFilter(
+        name="receiver",
+        filter=TransactionFilter(receiver=RECEIVER, custom_filter=lambda t: t.fee == 1000),
+    ),
+]
+
+
+def _full_summary(result: TransactionSubscriptionResult) -> object:
+    return [
+        (t.id_, t.intra_round_offset, t.parent_transaction_id, t.filters_matched)
+        for t in result.subscribed_transactions
+    ]
+
+
+@pytest.mark.parametrize("filters", [[f] for f in _PUSHDOWN_FILTERS] + [_PUSHDOWN_FILTERS])
+def test_algod_pre_filter_matches_full_transform(filters: list[NamedTransactionFilter]) -> None:
+    params = TransactionSubscriptionParams(
+        filters=filters,
+        watermark=0,
+        current_round=12,
+        max_rounds_to_sync=100,
+        sync_behaviour="sync-oldest",
+    )
+    compiled = compile_filters(filters)
+    assert all(f.algod_pre_filter is not None for f in compiled)
+
+    result = get_subscribed_transactions(params, _nested_chain(12), compiled_filters=compiled)  # type: ignore[arg-type]
+    expected = get_subscribed_transactions(
+        params,
+        _nested_chain(12),  # type: ignore[arg-type]
+        compiled_filters=[dataclasses.replace(f, algod_pre_filter=None) for f in compiled],
+    )
+
+    assert _full_summary(result) == _full_summary(expected)
+    assert result.subscribed_transactions
+
+
+def test_non_candidate_transactions_are_not_transformed() -> None:
+    block = _nested_chain(7).blocks[7].block
+    (f,) = compile_filters([_PUSHDOWN_FILTERS[2]])
+
+    transactions = get_block_transactions(block, f.algod_pre_filter)
+
+    # only the asset transfer for asset 7 is transformed, at the same offset as in a full
+    # transform of the block: payment (0), app call and its 3 inner txns (1-4), payment (5)
+    assert [(t.tx_type, t.intra_round_offset) for t in transactions] == [("axfer", 6)]
+    assert transactions[0].id_ == get_block_transactions(block)[3].id_
+
+
+def test_balance_changes_are_extracted_once_per_transaction(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    extracted = list[tuple[int | None, int | None]]()
+
+    def counting_extract(transaction: Transaction) -> list[BalanceChange]:
+        # transaction IDs are only assigned once a transaction has matched
+        extracted.append((transaction.confirmed_round, transaction.intra_round_offset))
+        return _extract_balance_changes_from_indexer_transaction(transaction)
+
+    monkeypatch.setattr(
+        "algokit_subscriber._subscription._extract_balance_changes_from_indexer_transaction",
+        counting_extract,
+    )
+
+    result = get_subscribed_transactions(
+        TransactionSubscriptionParams(
+            filters=[
+                NamedTransactionFilter(
+                    name=f"balance-{amount}",
+                    filter=TransactionFilter(
+                        balance_changes=[BalanceChangeFilter(min_absolute_amount=amount)]
+                    ),
+                )
+                for amount in range(5)
+            ],
+            watermark=0,
+            current_round=10,
+            max_rounds_to_sync=100,
+            sync_behaviour="sync-oldest",
+        ),
+        _nested_chain(10),  # type: ignore[arg-type]
+    )
+
+    # 4 top-level and 3 inner transactions per round
+    assert len(extracted) == len(set(extracted)) == 10 * 7
+    assert all(t.balance_changes for t in result.subscribed_transactions)
+    first = result.subscribed_transactions[0]
+    assert first.balance_changes == _extract_balance_changes_from_indexer_transaction(first)
+    # outside of a poll, balance changes aren't shared
+    _get_balance_changes(first)
+    _get_balance_changes(first)
+    assert len(extracted) == 10 * 7 + 2
+
+
+def test_transaction_ids_are_only_computed_for_matches(monkeypatch: pytest.MonkeyPatch) -> None:
+    tx_id = AlgodTransaction.tx_id
+    computed = list[str]()
+
+    def counting_tx_id(transaction: AlgodTransaction) -> str:
+        computed.append(tx_id(transaction))
+        return computed[-1]
+
+    monkeypatch.setattr(AlgodTransaction, "tx_id", counting_tx_id)
+    filters = [NamedTransactionFilter(name="app", filter=TransactionFilter(app_id=20))]
+    params = TransactionSubscriptionParams(
+        filters=filters,
+        watermark=0,
+        current_round=6,
+        max_rounds_to_sync=100,
+        sync_behaviour="sync-oldest",
+    )
+
+    result = get_subscribed_transactions(params, _nested_chain(6))  # type: ignore[arg-type]
+
+    # only the app call holding each matched inner transaction has its ID computed
+    assert len(computed) == 6
+    # a custom filter may read the ID, so every candidate has it computed up front
+    expected = get_subscribed_transactions(
+        dataclasses.replace(
+            params,
+            filters=[
+                NamedTransactionFilter(
+                    name="app",
+                    filter=TransactionFilter(app_id=20, custom_filter=lambda t: bool(t.id_)),
+                )
+            ],
+        ),
+        _nested_chain(6),  # type: ignore[arg-type]
+    )
+    assert len(computed) == 6 + 6
+    assert _full_summary(result) == _full_summary(expected)
+    assert [t.id_ for t in result.subscribed_transactions] == [
+        f"{t.parent_transaction_id}/inner/2" for t in result.subscribed_transactions
+    ]
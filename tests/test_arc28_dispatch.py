@@ -0,0 +1,174 @@
+import dataclasses
+
+import pytest
+from algokit_indexer_client.models import Transaction
+
+from algokit_subscriber import compile_filters, get_subscribed_transactions
+from algokit_subscriber._subscription import _compile_arc28_event_dispatch
+from algokit_subscriber.types.arc28 import (
+    Arc28Event,
+    Arc28EventArg,
+    Arc28EventFilter,
+    Arc28EventGroup,
+)
+from algokit_subscriber.types.subscription import (
+    NamedTransactionFilter,
+    TransactionFilter,
+    TransactionSubscriptionParams,
+    TransactionSubscriptionResult,
+)
+from synthetic.blocks import FakeAlgod, as_inner, make_app_call, make_block
+
+swapped = Arc28Event(
+    name="Swapped",
+    args=[Arc28EventArg(name="a", type="uint64"), Arc28EventArg(name="b", type="uint64")],
+)
+transferred = Arc28Event(name="Transferred", args=[Arc28EventArg(type="uint64")])
+unused = Arc28Event(name="Unused", args=[Arc28EventArg(type="bool")])
+
+
+def _log(event: Arc28Event, *args: int) -> bytes:
+    return event.prefix + event.abi_type.encode(list(args))
+
+
+def _chain(rounds: int, extra_logs: list[bytes] | None = None) -> FakeAlgod:
+    return FakeAlgod(
+        [
+            make_block(
+                r,
+                [
+                    make_app_call(
+                        r,
+                        app_id=1,
+                        logs=[
+                            _log(transferred, r),
+                            b"abc",
+                            b"not an event",
+                            _log(swapped, r, r + 1),
+                            _log(transferred, r + 2),
+                            *(extra_logs or []),
+                        ],
+                        inner_txns=[
+                            as_inner(make_app_call(r, app_id=2, logs=[_log(swapped, 0, r)]))
+                        ],
+                    ),
+                    make_app_call(r, app_id=3, logs=[b"no events here"]),
+                ],
+            )
+            for r in range(1, rounds + 1)
+        ]
+    )
+
+
+def _subscribe(
+    groups: list[Arc28EventGroup],
+    compiled_groups: list[Arc28EventGroup] | None = None,
+    extra_logs: list[bytes] | None = None,
+) -> TransactionSubscriptionResult:
+    filters = [
+        NamedTransactionFilter(
+            name="swaps",
+            filter=TransactionFilter(
+                arc28_events=[Arc28EventFilter(group_name="dex", event_name="Swapped")]
+            ),
+        ),
+        NamedTransactionFilter(name="app-3", filter=TransactionFilter(app_id=3)),
+    ]
+    return get_subscribed_transactions(
+        TransactionSubscriptionParams(
+            filters=filters,
+            arc28_events=groups,
+            watermark=0,
+            current_round=5,
+            max_rounds_to_sync=100,
+            sync_behaviour="sync-oldest",
+        ),
+        _chain(5, extra_logs),  # type: ignore[arg-type]
+        compiled_filters=compile_filters(filters, compiled_groups or groups),
+    )
+
+
+def test_events_are_emitted_in_log_then_group_then_event_order() -> None:
+    checked = list[str]()
+
+    def process_transaction(t: Transaction) -> bool:
+        checked.append(t.id_ or "")
+        return True
+
+    groups = [
+        Arc28EventGroup(group_name="dex", events=[unused, swapped, transferred]),
+        Arc28EventGroup(group_name="unused", events=[unused]),
+        Arc28EventGroup(
+            group_name="all-swaps",
+            events=[swapped],
+            process_transaction=process_transaction,
+        ),
+        Arc28EventGroup(group_name="app-2", events=[swapped], process_for_app_ids=[2]),
+    ]
+
+    result = _subscribe(groups)
+
+    root = result.subscribed_transactions[0]
+    assert [(e.group_name, e.event_name, e.args) for e in root.arc28_events] == [
+        ("dex", "Transferred", [1]),
+        ("dex", "Swapped", [1, 2]),
+        ("all-swaps", "Swapped", [1, 2]),
+        ("dex", "Transferred", [3]),
+    ]
+    assert root.arc28_events[1].args_by_name == {"a": 1, "b": 2}
+    inner = root.inner_txns[0]
+    assert [(e.group_name, e.args) for e in inner.arc28_events] == [
+        ("dex", [0, 1]),
+        ("all-swaps", [0, 1]),
+        ("app-2", [0, 1]),
+    ]
+    assert result.subscribed_transactions[1].id_ == inner.id_
+    assert result.subscribed_transactions[2].arc28_events == []
+    # the predicate is only checked for transactions emitting one of the group's events
+    # i.e. never for the app 3 transactions; the inner transaction is only enriched once,
+    # even though it's both matched on its own and one of the root's inner transactions
+    assert len(checked) == 5 * 2
+    assert result.subscribed_transactions[1] is inner
+    assert not {
+        t.id_
+        for t in result.subscribed_transactions
+        if t.application_transaction and t.application_transaction.application_id == 3
+    } & set(checked)
+
+
+def test_invalid_event_data_is_skipped_when_continuing_on_error() -> None:
+    truncated_swap = swapped.prefix + bytes(3)
+    group = Arc28EventGroup(group_name="dex", events=[swapped], continue_on_error=True)
+
+    result = _subscribe([group], extra_logs=[truncated_swap])
+
+    assert [len(t.arc28_events) for t in result.subscribed_transactions] == [1, 1, 0] * 5
+    with pytest.raises(ValueError, match="expected 16 bytes"):
+        _subscribe(
+            [dataclasses.replace(group, continue_on_error=False)], extra_logs=[truncated_swap]
+        )
+
+
+def test_compiled_event_groups_are_reused_for_the_same_groups(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    groups = [Arc28EventGroup(group_name="dex", events=[swapped, transferred])]
+    compiled = list[list[Arc28EventGroup]]()
+
+    def counting_compile(arc28_groups: list[Arc28EventGroup]) -> object:
+        compiled.append(arc28_groups)
+        return _compile_arc28_event_dispatch(arc28_groups)
+
+    monkeypatch.setattr(
+        "algokit_subscriber._subscription._compile_arc28_event_dispatch", counting_compile
+    )
+
+    _subscribe(groups)
+    assert compiled == [groups]
+
+    other_groups = [Arc28EventGroup(group_name="dex", events=[transferred])]
+    result = _subscribe(other_groups, compiled_groups=groups)
+    assert compiled == [groups, groups, other_groups]
+    assert {e.event_name for e in result.subscribed_transactions[0].arc28_events} == {
+        "Transferred"
+    }
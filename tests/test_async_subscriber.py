@@ -0,0 +1,146 @@
+import asyncio
+
+import pytest
+from algokit_algod_client import models as algod
+
+from algokit_subscriber import (
+    AsyncAlgorandSubscriber,
+    SubscribedTransaction,
+    get_subscribed_transactions,
+    get_subscribed_transactions_async,
+    in_memory_watermark,
+)
+from algokit_subscriber.types import subscription as sub
+from synthetic.blocks import RECEIVER, SENDER, FakeAlgod, make_block, make_payment
+
+from .blocks import FakeAsyncAlgod
+
+OTHER = "A4DQOBYHA4DQOBYHA4DQOBYHA4DQOBYHA4DQOBYHA4DQOBYHA4DVZ36IB4"
+
+
+def _blocks(rounds: int) -> list[algod.BlockResponse]:
+    return [
+        make_block(r, [make_payment(r, amount=r), make_payment(r, sender=OTHER, amount=r)])
+        for r in range(1, rounds + 1)
+    ]
+
+
+def _params(**kwargs: object) -> sub.TransactionSubscriptionParams:
+    return sub.TransactionSubscriptionParams(
+        filters=[
+            sub.NamedTransactionFilter(name="sender", filter=sub.TransactionFilter(sender=SENDER)),
+            sub.NamedTransactionFilter(
+                name="receiver", filter=sub.TransactionFilter(receiver=RECEIVER)
+            ),
+        ],
+        watermark=0,
+        max_rounds_to_sync=100,
+        sync_behaviour="sync-oldest",
+        **kwargs,  # type: ignore[arg-type]
+    )
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{}, {"max_concurrent_block_requests": 5, "prefetch_blocks": True}],
+)
+def test_get_subscribed_transactions_async_matches_sync(options: dict[str, object]) -> None:
+    expected = get_subscribed_transactions(_params(), FakeAlgod(_blocks(70)))  # type: ignore[arg-type]
+
+    result = asyncio.run(
+        get_subscribed_transactions_async(_params(**options), FakeAsyncAlgod(_blocks(70)))  # type: ignore[arg-type]
+    )
+
+    assert result.synced_round_range == expected.synced_round_range == (1, 70)
+    assert result.new_watermark == expected.new_watermark
+    assert [(t.id_, t.filters_matched) for t in result.subscribed_transactions] == [
+        (t.id_, t.filters_matched) for t in expected.subscribed_transactions
+    ]
+    assert [b.round for b in result.block_metadata or []] == list(range(1, 71))
+
+
+def _subscriber(algod_source: FakeAsyncAlgod) -> AsyncAlgorandSubscriber:
+    return AsyncAlgorandSubscriber(
+        config=sub.AlgorandSubscriberConfig(
+            filters=[
+                sub.SubscriberConfigFilter(
+                    name="sender", filter=sub.TransactionFilter(sender=SENDER)
+                ),
+                sub.SubscriberConfigFilter(
+                    name="amounts",
+                    filter=sub.TransactionFilter(sender=OTHER),
+                    mapper=lambda txns: [t.payment_transaction.amount for t in txns],  # type: ignore[union-attr]
+                ),
+            ],
+            watermark_persistence=in_memory_watermark(),
+            sync_behaviour="sync-oldest",
+            max_concurrent_block_requests=4,
+        ),
+        algod=algod_source,  # type: ignore[arg-type]
+    )
+
+
+def test_poll_once_awaits_async_listeners_in_order() -> None:
+    subscriber = _subscriber(FakeAsyncAlgod(_blocks(5)))
+    events = list[str]()
+
+    async def on_sender(txn: SubscribedTransaction, name: str) -> None:
+        await asyncio.sleep(0)
+        events.append(f"{name}:{txn.confirmed_round}")
+
+    subscriber.on_before_poll(lambda m, _: events.append(f"before:{m.watermark}"))
+    subscriber.on("sender", on_sender)
+    subscriber.on_batch("amounts", lambda amounts, _: events.append(f"amounts:{amounts}"))
+    subscriber.on_poll(lambda r, _: events.append(f"poll:{r.new_watermark}"))
+
+    result = asyncio.run(subscriber.poll_once())
+
+    assert result.new_watermark == 5
+    assert subscriber.config.watermark_persistence.get() == 5
+    assert events == [
+        "before:0",
+        *(f"sender:{r}" for r in range(1, 6)),
+        "amounts:[1, 2, 3, 4, 5]",
+        "poll:5",
+    ]
+
+
+def test_subscribers_share_one_event_loop() -> None:
+    subscribers = [_subscriber(FakeAsyncAlgod(_blocks(40))) for _ in range(10)]
+    received = [list[int]() for _ in subscribers]
+    for subscriber, txns in zip(subscribers, received, strict=True):
+        subscriber.on("sender", lambda t, _, txns=txns: txns.append(t.confirmed_round))  # type: ignore[misc]
+
+    async def run() -> None:
+        await asyncio.gather(*(s.poll_once() for s in subscribers))
+
+    asyncio.run(run())
+
+    assert all(txns == list(range(1, 41)) for txns in received)
+
+
+def test_start_stops_when_requested() -> None:
+    subscriber = _subscriber(FakeAsyncAlgod(_blocks(3)))
+    polls = list[int]()
+
+    def inspect(result: sub.TransactionSubscriptionResult) -> None:
+        polls.append(result.new_watermark)
+        subscriber.stop("done")
+
+    asyncio.run(subscriber.start(inspect, suppress_log=True))
+
+    assert polls == [3]
+    assert not subscriber.started
+
+
+def test_errors_are_raised_to_the_caller_by_default() -> None:
+    subscriber = _subscriber(FakeAsyncAlgod(_blocks(3)))
+
+    async def fail(*_: object) -> None:
+        raise ValueError("handler failed")
+
+    subscriber.on("sender", fail)
+
+    with pytest.raises(ValueError, match="handler failed"):
+        asyncio.run(subscriber.start(suppress_log=True))
+    assert subscriber.config.watermark_persistence.get() == 0
@@ -0,0 +1,64 @@
+from algokit_subscriber import get_subscribed_transactions
+from algokit_subscriber.types.subscription import TransactionSubscriptionParams
+from benchmarks.__main__ import (
+    ARC28_GROUPS,
+    FILTERS,
+    StageResult,
+    find_regressions,
+    measure,
+)
+from benchmarks.blocks import count_transactions
+from synthetic.blocks import (
+    FakeAlgod,
+    dense_payment_block,
+    heartbeat_block,
+    inner_transaction_tree_block,
+    log_heavy_app_call_block,
+    state_proof_block,
+)
+
+
+def test_synthetic_blocks_are_subscribed_to() -> None:
+    blocks = [
+        dense_payment_block(1, transactions=40),
+        inner_transaction_tree_block(2, transactions=2, depth=2, fanout=2),
+        log_heavy_app_call_block(3, transactions=3, logs=6),
+        state_proof_block(4, reveals=2),
+        heartbeat_block(5, transactions=4),
+    ]
+
+    result = get_subscribed_transactions(
+        TransactionSubscriptionParams(
+            filters=FILTERS,
+            arc28_events=ARC28_GROUPS,
+            watermark=0,
+            current_round=5,
+            max_rounds_to_sync=5,
+            sync_behaviour="sync-oldest",
+        ),
+        FakeAlgod(blocks),  # type: ignore[arg-type]
+    )
+
+    # 2 top-level calls, each with 2 calls that each have 2 calls with a payment
+    assert count_transactions(blocks[1:2]) == 2 * (1 + 2 + 4 + 4)
+    assert result.stats.transactions_retrieved == 40 + 2 + 3 + 101 + 4
+    # none of the 40 payments are large enough to be large transfers
+    assert set(result.transactions_by_filter) == {f.name for f in FILTERS} - {"large-transfers"}
+    assert [len(t.arc28_events) for t in result.transactions_by_filter["swaps"]] == [4, 4, 4]
+    assert len(result.transactions_by_filter["state-proofs"]) == 1
+    assert len(result.transactions_by_filter["heartbeats"]) == 4
+
+
+def test_regressions_are_found_against_a_baseline() -> None:
+    result = measure("scenario", "stage", 1000, lambda: sum(range(1000)), repeat=2)
+    assert result.items_per_second > 0
+
+    def stage(name: str, seconds: float) -> StageResult:
+        return StageResult("scenario", name, 1000, seconds, 0)
+
+    baseline = [stage("faster", 1.0), stage("same", 1.0), stage("slower", 1.0)]
+    results = [stage("faster", 0.5), stage("same", 1.1), stage("slower", 1.5), stage("new", 9)]
+
+    assert find_regressions(results, baseline, max_regression=0.2) == [
+        "scenario / slower: 1,000/s -> 667/s (-33%)"
+    ]
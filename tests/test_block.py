@@ -0,0 +1,60 @@
+import threading
+import time
+
+import pytest
+from algokit_algod_client import models as algod
+
+from algokit_subscriber._block import get_blocks_bulk
+from synthetic.blocks import FakeAlgod, make_block, make_payment
+
+
+class _SlowAlgod(FakeAlgod):
+    def __init__(self, blocks: list[algod.BlockResponse], *, fail_round: int | None = None):
+        super().__init__(blocks)
+        self.fail_round = fail_round
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def block(self, round_: int) -> algod.BlockResponse:
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            # later rounds complete first to check ordering is preserved
+            time.sleep(0.001 * (100 - round_ % 100))
+            if round_ == self.fail_round:
+                raise ValueError(f"round {round_} unavailable")
+            return super().block(round_)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def _blocks(count: int) -> list[algod.BlockResponse]:
+    return [make_block(r, [make_payment(r)]) for r in range(1, count + 1)]
+
+
+def test_sequential_fetch_returns_blocks_in_round_order() -> None:
+    client = FakeAlgod(_blocks(45))
+
+    blocks = get_blocks_bulk(1, 45, client)  # type: ignore[arg-type]
+
+    assert [b.block.header.round for b in blocks] == list(range(1, 46))
+    assert client.requested_rounds == list(range(1, 46))
+
+
+def test_concurrent_fetch_returns_blocks_in_round_order() -> None:
+    client = _SlowAlgod(_blocks(65))
+
+    blocks = get_blocks_bulk(1, 65, client, max_concurrent_requests=8)  # type: ignore[arg-type]
+
+    assert [b.block.header.round for b in blocks] == list(range(1, 66))
+    assert 1 < client.max_in_flight <= 8
+
+
+def test_concurrent_fetch_raises_block_error() -> None:
+    client = _SlowAlgod(_blocks(40), fail_round=35)
+
+    with pytest.raises(ValueError, match="round 35 unavailable"):
+        get_blocks_bulk(1, 40, client, max_concurrent_requests=4)  # type: ignore[arg-type]
@@ -0,0 +1,131 @@
+import asyncio
+from pathlib import Path
+
+from algokit_algod_client import models as algod
+from algokit_common import to_wire
+
+from algokit_subscriber import (
+    file_block_cache,
+    get_subscribed_transactions,
+    get_subscribed_transactions_async,
+)
+from algokit_subscriber._block import get_blocks_bulk
+from algokit_subscriber.types.subscription import (
+    NamedTransactionFilter,
+    TransactionFilter,
+    TransactionSubscriptionParams,
+    TransactionSubscriptionResult,
+)
+from synthetic.blocks import SENDER, FakeAlgod, make_app_call, make_block, make_payment
+
+from .blocks import FakeAsyncAlgod
+
+
+def _blocks(rounds: range) -> list[algod.BlockResponse]:
+    return [
+        make_block(
+            r,
+            [make_payment(r, amount=r), make_app_call(r, app_id=r, args=[b"a"], logs=[b"l"])],
+        )
+        for r in rounds
+    ]
+
+
+def _params(**kwargs: object) -> TransactionSubscriptionParams:
+    return TransactionSubscriptionParams(
+        filters=[NamedTransactionFilter(name="sender", filter=TransactionFilter(sender=SENDER))],
+        watermark=0,
+        current_round=70,
+        max_rounds_to_sync=100,
+        sync_behaviour="sync-oldest",
+        **kwargs,  # type: ignore[arg-type]
+    )
+
+
+def _summary(result: TransactionSubscriptionResult) -> object:
+    return (
+        result.new_watermark,
+        [(t.id_, t.filters_matched) for t in result.subscribed_transactions],
+        [b.round for b in result.block_metadata or []],
+    )
+
+
+def test_cached_blocks_are_served_without_algod(tmp_path: Path) -> None:
+    blocks = _blocks(range(1, 71))
+    cache = file_block_cache(tmp_path)
+    first_algod = FakeAlgod(blocks)
+
+    first = get_blocks_bulk(1, 70, first_algod, cache=cache)  # type: ignore[arg-type]
+    # a fresh cache over the same directory reads the persisted segments
+    reopened_algod = FakeAlgod(blocks)
+    second = get_blocks_bulk(
+        1,
+        70,
+        reopened_algod,  # type: ignore[arg-type]
+        max_concurrent_requests=4,
+        cache=file_block_cache(tmp_path),
+    )
+
+    assert sorted(first_algod.requested_rounds) == list(range(1, 71))
+    assert reopened_algod.requested_rounds == []
+    assert [to_wire(b) for b in second] == [to_wire(b) for b in first]
+
+
+def test_only_missing_rounds_are_requested(tmp_path: Path) -> None:
+    blocks = _blocks(range(1, 71))
+    cache = file_block_cache(tmp_path)
+    get_blocks_bulk(20, 40, FakeAlgod(blocks), cache=cache)  # type: ignore[arg-type]
+    algod_client = FakeAlgod(blocks)
+
+    result = get_blocks_bulk(1, 70, algod_client, cache=cache)  # type: ignore[arg-type]
+
+    assert [b.block.header.round for b in result] == list(range(1, 71))
+    assert sorted(algod_client.requested_rounds) == [*range(1, 20), *range(41, 71)]
+
+
+def test_subscription_results_are_identical_from_cache(tmp_path: Path) -> None:
+    cache = file_block_cache(tmp_path)
+    expected = get_subscribed_transactions(_params(), FakeAlgod(_blocks(range(1, 71))))  # type: ignore[arg-type]
+    get_subscribed_transactions(_params(block_cache=cache), FakeAlgod(_blocks(range(1, 71))))  # type: ignore[arg-type]
+    empty_algod = FakeAlgod([])
+
+    result = get_subscribed_transactions(_params(block_cache=cache), empty_algod)  # type: ignore[arg-type]
+    async_result = asyncio.run(
+        get_subscribed_transactions_async(
+            _params(block_cache=cache, prefetch_blocks=True),
+            FakeAsyncAlgod([]),  # type: ignore[arg-type]
+        )
+    )
+
+    assert empty_algod.requested_rounds == []
+    assert _summary(result) == _summary(async_result) == _summary(expected)
+    assert len(expected.subscribed_transactions) == 140
+
+
+def test_oldest_segments_are_evicted_when_full(tmp_path: Path) -> None:
+    cache = file_block_cache(tmp_path, max_size_bytes=20_000, segment_size_bytes=5_000)
+    get_blocks_bulk(1, 200, FakeAlgod(_blocks(range(1, 201))), cache=cache)  # type: ignore[arg-type]
+
+    total_size = sum(path.stat().st_size for path in tmp_path.glob("*.seg"))
+    assert 0 < total_size <= 20_000
+    assert cache.get(1) is None
+    assert cache.get(200) is not None
+    # eviction is by whole segment, so the cached rounds are a contiguous tail
+    cached = [r for r in range(1, 201) if cache.get(r) is not None]
+    assert cached == list(range(cached[0], 201))
+    assert file_block_cache(tmp_path).get(cached[0]) is not None
+
+
+def test_partially_written_records_are_ignored(tmp_path: Path) -> None:
+    get_blocks_bulk(1, 10, FakeAlgod(_blocks(range(1, 11))), cache=file_block_cache(tmp_path))  # type: ignore[arg-type]
+    segment = next(tmp_path.glob("*.seg"))
+    segment.write_bytes(segment.read_bytes()[:-10])
+
+    cache = file_block_cache(tmp_path)
+
+    assert cache.get(9) is not None
+    assert cache.get(10) is None
+    # the round can be re-cached after the truncated record
+    block = _blocks(range(10, 11))[0]
+    cache.put(10, block)
+    assert to_wire(file_block_cache(tmp_path).get(10)) == to_wire(block)
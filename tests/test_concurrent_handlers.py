@@ -0,0 +1,216 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from algokit_algod_client import models as algod
+
+from algokit_subscriber import (
+    AlgorandSubscriber,
+    AsyncAlgorandSubscriber,
+    SubscribedTransaction,
+    in_memory_watermark,
+)
+from algokit_subscriber.types import subscription as sub
+from algokit_subscriber.types.event_emitter import EventEmitter
+from synthetic.blocks import RECEIVER, SENDER, FakeAlgod, make_block, make_payment
+
+from .blocks import FakeAsyncAlgod
+
+OTHER = "A4DQOBYHA4DQOBYHA4DQOBYHA4DQOBYHA4DQOBYHA4DQOBYHA4DVZ36IB4"
+
+
+def _blocks(rounds: int) -> list[algod.BlockResponse]:
+    return [
+        make_block(r, [make_payment(r, amount=r), make_payment(r, sender=OTHER, amount=r)])
+        for r in range(1, rounds + 1)
+    ]
+
+
+def _config(**kwargs: object) -> sub.AlgorandSubscriberConfig:
+    return sub.AlgorandSubscriberConfig(
+        filters=[
+            sub.SubscriberConfigFilter(name="sender", filter=sub.TransactionFilter(sender=SENDER)),
+            sub.SubscriberConfigFilter(name="other", filter=sub.TransactionFilter(sender=OTHER)),
+            sub.SubscriberConfigFilter(
+                name="receiver", filter=sub.TransactionFilter(receiver=RECEIVER)
+            ),
+        ],
+        watermark_persistence=in_memory_watermark(),
+        sync_behaviour="sync-oldest",
+        **kwargs,  # type: ignore[arg-type]
+    )
+
+
+class _Recorder:
+    """Records handled events, along with how many handlers were running at once."""
+
+    def __init__(self, delay: float = 0.002) -> None:
+        self.delay = delay
+        self.events = list[tuple[str, int]]()
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+
+    def __call__(
+        self, txn: SubscribedTransaction | list[SubscribedTransaction], name: str
+    ) -> None:
+        with self._lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(self.delay)
+        with self._lock:
+            self.running -= 1
+            rounds = (
+                [t.confirmed_round for t in txn]
+                if isinstance(txn, list)
+                else [txn.confirmed_round]
+            )
+            self.events.extend((name, r or 0) for r in rounds)
+
+
+def _events_for(recorder: _Recorder, name: str) -> list[int]:
+    return [r for n, r in recorder.events if n == name]
+
+
+def test_handlers_for_different_filters_run_concurrently_in_order_per_filter() -> None:
+    subscriber = AlgorandSubscriber(
+        _config(max_concurrent_handlers=3),
+        FakeAlgod(_blocks(20)),  # type: ignore[arg-type]
+    )
+    recorder = _Recorder()
+    handled_before_watermark = list[int]()
+    for name in ("sender", "other", "receiver"):
+        subscriber.on(name, recorder)
+    subscriber.on_batch("other", recorder)
+    subscriber.on_poll(lambda *_: handled_before_watermark.append(len(recorder.events)))
+
+    result = subscriber.poll_once()
+
+    assert result.new_watermark == subscriber.config.watermark_persistence.get() == 20
+    assert 1 < recorder.max_running <= 3
+    assert _events_for(recorder, "sender") == list(range(1, 21))
+    # the batch is handled before the filter's individual transactions
+    assert _events_for(recorder, "batch:other") == list(range(1, 21))
+    assert recorder.events.index(("batch:other", 20)) < recorder.events.index(("other", 1))
+    assert _events_for(recorder, "other") == list(range(1, 21))
+    # both payments in each round are to the receiver
+    assert _events_for(recorder, "receiver") == [r for r in range(1, 21) for _ in range(2)]
+    assert handled_before_watermark == [len(recorder.events)] == [20 * 5]
+
+
+def test_events_are_ordered_by_the_given_key() -> None:
+    subscriber = AlgorandSubscriber(
+        _config(
+            max_concurrent_handlers=4,
+            handler_ordering_key=lambda _, t: t.confirmed_round % 4,
+        ),
+        FakeAlgod(_blocks(20)),  # type: ignore[arg-type]
+    )
+    recorder = _Recorder()
+    subscriber.on("sender", recorder)
+
+    subscriber.poll_once()
+
+    assert sorted(_events_for(recorder, "sender")) == list(range(1, 21))
+    assert 1 < recorder.max_running <= 4
+    for key in range(4):
+        assert [r for r in _events_for(recorder, "sender") if r % 4 == key] == list(
+            range(key or 4, 21, 4)
+        )
+
+
+def test_watermark_is_not_advanced_when_a_handler_fails() -> None:
+    subscriber = AlgorandSubscriber(
+        _config(max_concurrent_handlers=3),
+        FakeAlgod(_blocks(10)),  # type: ignore[arg-type]
+    )
+    recorder = _Recorder(delay=0)
+    handled_sender = list[int]()
+
+    def fail_on_round_5(txn: SubscribedTransaction, _: str) -> None:
+        if txn.confirmed_round == 5:
+            raise ValueError("handler failed")
+        handled_sender.append(txn.confirmed_round or 0)
+
+    subscriber.on("sender", fail_on_round_5)
+    subscriber.on("other", recorder)
+
+    with pytest.raises(ValueError, match="handler failed"):
+        subscriber.poll_once()
+
+    assert handled_sender == [1, 2, 3, 4]
+    assert _events_for(recorder, "other") == list(range(1, 11))
+    assert subscriber.config.watermark_persistence.get() == 0
+
+
+def test_handler_threads_are_reused_across_polls_until_stopped() -> None:
+    algod = FakeAlgod(_blocks(10))
+    subscriber = AlgorandSubscriber(
+        _config(max_concurrent_handlers=3, max_rounds_to_sync=5),
+        algod,  # type: ignore[arg-type]
+    )
+    handler_threads = set[str]()
+    subscriber.on("sender", lambda *_: handler_threads.add(threading.current_thread().name))
+
+    subscriber.poll_once()
+    executor = subscriber._handler_executor  # noqa: SLF001
+    subscriber.poll_once()
+
+    assert subscriber.config.watermark_persistence.get() == 10
+    assert executor is not None
+    assert subscriber._handler_executor is executor  # noqa: SLF001
+    assert all(name.startswith("subscriber-handler") for name in handler_threads)
+
+    subscriber.stop("done")
+
+    with pytest.raises(RuntimeError):
+        executor.submit(print)
+    assert subscriber._handler_executor is None  # noqa: SLF001
+
+
+def test_one_time_listeners_are_called_once_by_concurrent_emitters() -> None:
+    emitter = EventEmitter()
+    calls = list[int]()
+    for _ in range(50):
+        emitter.once("event", lambda event, _: calls.append(event))
+    emitter.on("event", lambda event, _: calls.append(-event))
+    start = threading.Barrier(8)
+
+    def emit(event: int) -> None:
+        start.wait()
+        emitter.emit("event", event)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(emit, range(1, 9)))
+
+    assert len([c for c in calls if c > 0]) == 50
+    assert sorted(c for c in calls if c < 0) == list(range(-8, 0))
+
+
+def test_async_handlers_run_concurrently_in_order_per_filter() -> None:
+    subscriber = AsyncAlgorandSubscriber(
+        _config(max_concurrent_handlers=2),
+        FakeAsyncAlgod(_blocks(10)),  # type: ignore[arg-type]
+    )
+    events = list[tuple[str, int]]()
+    running = [0, 0]
+
+    async def handle(txn: SubscribedTransaction, name: str) -> None:
+        running[0] += 1
+        running[1] = max(running)
+        await asyncio.sleep(0.001)
+        running[0] -= 1
+        events.append((name, txn.confirmed_round or 0))
+
+    for name in ("sender", "other", "receiver"):
+        subscriber.on(name, handle)
+
+    result = asyncio.run(subscriber.poll_once())
+
+    assert result.new_watermark == 10
+    assert running[1] == 2
+    for name in ("sender", "other"):
+        assert [r for n, r in events if n == name] == list(range(1, 11))
+    assert [r for n, r in events if n == "receiver"] == [r for r in range(1, 11) for _ in range(2)]
@@ -0,0 +1,346 @@
+import dataclasses
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from algokit_common import address_from_public_key
+from algokit_indexer_client.models import Transaction
+
+from algokit_subscriber import compile_filters, get_subscribed_transactions
+from algokit_subscriber._internal_types import CompiledFilter, TransactionFeatures
+from algokit_subscriber._subscription import _generate_transaction_filter, _get_txn_features
+from algokit_subscriber._utils import method_selector_bytes
+from algokit_subscriber.types.subscription import (
+    BalanceChangeFilter,
+    NamedTransactionFilter,
+    SubscribedTransaction,
+    TransactionFilter,
+    TransactionSubscriptionParams,
+    TransactionSubscriptionResult,
+)
+from synthetic.blocks import (
+    RECEIVER,
+    SENDER,
+    FakeAlgod,
+    as_inner,
+    make_app_call,
+    make_asset_transfer,
+    make_block,
+    make_payment,
+)
+
+WALLETS = [address_from_public_key(bytes([i]) * 32) for i in range(1, 41)]
+METHOD = "hello(string)string"
+
+
+def _chain(rounds: int) -> FakeAlgod:
+    return FakeAlgod(
+        [
+            make_block(
+                r,
+                [
+                    make_payment(r, sender=WALLETS[r % 40], receiver=WALLETS[(r + 1) % 40]),
+                    make_asset_transfer(r, asset_id=r % 4, sender=WALLETS[(r + 2) % 40]),
+                    make_app_call(
+                        r,
+                        app_id=r % 3 + 1,
+                        sender=WALLETS[(r + 3) % 40],
+                        args=[method_selector_bytes(METHOD) if r % 2 else b"other"],
+                        inner_txns=[as_inner(make_payment(r, note=b"inner"))],
+                    ),
+                ],
+            )
+            for r in range(1, rounds + 1)
+        ]
+    )
+
+
+def _filters() -> list[NamedTransactionFilter]:
+    return [
+        *(
+            NamedTransactionFilter(name=f"wallet-{i}", filter=TransactionFilter(sender=wallet))
+            for i, wallet in enumerate(WALLETS)
+        ),
+        NamedTransactionFilter(
+            name="received", filter=TransactionFilter(receiver=[WALLETS[3], RECEIVER])
+        ),
+        NamedTransactionFilter(name="apps", filter=TransactionFilter(app_id=[2, 3])),
+        NamedTransactionFilter(name="asset", filter=TransactionFilter(asset_id=1, min_amount=1)),
+        NamedTransactionFilter(name="method", filter=TransactionFilter(method_signature=METHOD)),
+        NamedTransactionFilter(name="axfer", filter=TransactionFilter(type="axfer")),
+        NamedTransactionFilter(name="note", filter=TransactionFilter(note_prefix="inner")),
+        NamedTransactionFilter(name="all", filter=TransactionFilter()),
+        NamedTransactionFilter(name="wallet-0-again", filter=TransactionFilter(sender=WALLETS[0])),
+    ]
+
+
+def _subscribe(compiled_filters: list[CompiledFilter]) -> TransactionSubscriptionResult:
+    return get_subscribed_transactions(
+        TransactionSubscriptionParams(
+            filters=_filters(),
+            watermark=0,
+            current_round=60,
+            max_rounds_to_sync=100,
+            sync_behaviour="sync-oldest",
+        ),
+        _chain(60),  # type: ignore[arg-type]
+        compiled_filters=compiled_filters,
+    )
+
+
+def test_indexed_filters_match_the_same_transactions_in_filter_order() -> None:
+    compiled = compile_filters(_filters())
+    assert {name for name, _ in (f.index_key for f in compiled if f.index_key)} == {
+        "sender",
+        "receiver",
+        "app_id",
+        "asset_id",
+        "method_selector",
+        "type",
+    }
+    assert [compiled[i].name for i in compiled.residual] == ["note", "all"]
+
+    result = _subscribe(compiled)
+    unindexed = _subscribe([dataclasses.replace(f, index_key=None) for f in compiled])
+
+    assert [(t.id_, t.filters_matched) for t in result.subscribed_transactions] == [
+        (t.id_, t.filters_matched) for t in unindexed.subscribed_transactions
+    ]
+    matched = {name for t in result.subscribed_transactions for name in t.filters_matched}
+    assert matched == {f.name for f in _filters()}
+    wallet_0 = next(t for t in result.subscribed_transactions if t.sender == WALLETS[0])
+    assert wallet_0.filters_matched[0] == "wallet-0"
+    assert wallet_0.filters_matched[-1] == "wallet-0-again"
+
+
+def test_post_filters_only_run_against_transactions_with_indexed_values() -> None:
+    tested_senders = list[str]()
+
+    def custom_filter(t: object) -> bool:
+        tested_senders.append(t.sender)  # type: ignore[attr-defined]
+        return True
+
+    filters = [
+        NamedTransactionFilter(
+            name=f"wallet-{i}",
+            filter=TransactionFilter(sender=wallet, custom_filter=custom_filter),
+        )
+        for i, wallet in enumerate([*WALLETS, SENDER])
+    ]
+
+    result = get_subscribed_transactions(
+        TransactionSubscriptionParams(
+            filters=filters,
+            watermark=0,
+            current_round=60,
+            max_rounds_to_sync=100,
+            sync_behaviour="sync-oldest",
+        ),
+        _chain(60),  # type: ignore[arg-type]
+    )
+
+    # 60 rounds of 3 top-level transactions and 1 inner transaction, each tested once
+    assert len(tested_senders) == len(result.subscribed_transactions) == 60 * 4
+
+
+def test_hand_built_filters_can_read_transaction_ids() -> None:
+    all_ids = [t.id_ for t in _subscribe(compile_filters(_filters())).subscribed_transactions]
+    wanted = set(all_ids[::7])
+    match_all = compile_filters(
+        [NamedTransactionFilter(name="by-id", filter=TransactionFilter())]
+    )[0]
+    by_id = CompiledFilter(
+        name="by-id", pre_filter=match_all.pre_filter, post_filter=lambda t: t.id_ in wanted
+    )
+
+    result = _subscribe([by_id])
+
+    assert by_id.reads_transaction_id
+    assert {t.id_ for t in result.subscribed_transactions} == wanted
+
+
+def test_transaction_features_are_extracted_once_for_all_filters(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    extracted = list[TransactionFeatures]()
+
+    def counting_get_txn_features(t: Transaction) -> TransactionFeatures:
+        extracted.append(_get_txn_features(t))
+        return extracted[-1]
+
+    monkeypatch.setattr(
+        "algokit_subscriber._subscription._get_txn_features", counting_get_txn_features
+    )
+
+    result = _subscribe(compile_filters(_filters()))
+
+    # 60 rounds of 3 top-level transactions and 1 inner transaction
+    assert len(extracted) == 60 * 4
+    assert result.subscribed_transactions
+    assert extracted[2] == (
+        "appl",
+        WALLETS[4],
+        None,
+        2,
+        None,
+        0,
+        "noop",
+        method_selector_bytes(METHOD),
+        b"",
+    )
+
+
+def test_generated_predicates_match_the_same_transactions() -> None:
+    filters = [
+        *_filters(),
+        NamedTransactionFilter(
+            name="several",
+            filter=TransactionFilter(
+                type=["pay", "appl"],
+                sender=[*WALLETS[:20], SENDER],
+                note_prefix=b"inner",
+                max_amount=5000,
+                asset_create=False,
+                app_create=False,
+            ),
+        ),
+        NamedTransactionFilter(
+            name="noop-calls",
+            filter=TransactionFilter(
+                app_on_complete="noop",
+                method_signature=[METHOD, "other()void"],
+                app_call_arguments_match=lambda args: bool(args and len(args) == 1),
+            ),
+        ),
+        NamedTransactionFilter(
+            name="balances",
+            filter=TransactionFilter(
+                balance_changes=[BalanceChangeFilter(asset_id=0, min_absolute_amount=1)],
+                custom_filter=lambda t: (t.confirmed_round or 0) % 2 == 0,
+            ),
+        ),
+    ]
+
+    def subscribe(*, generate_code: bool) -> list[SubscribedTransaction]:
+        return get_subscribed_transactions(
+            TransactionSubscriptionParams(
+                filters=filters,
+                watermark=0,
+                current_round=60,
+                max_rounds_to_sync=100,
+                sync_behaviour="sync-oldest",
+            ),
+            _chain(60),  # type: ignore[arg-type]
+            compiled_filters=compile_filters(filters, generate_code=generate_code),
+        ).subscribed_transactions
+
+    generated = subscribe(generate_code=True)
+
+    assert generated == subscribe(generate_code=False)
+    matched = {name for t in generated for name in t.filters_matched}
+    assert matched == {f.name for f in filters}
+
+
+def test_checks_are_reordered_by_their_cost_and_selectivity() -> None:
+    checked = list[str | None]()
+
+    def custom_filter(t: Transaction) -> bool:
+        checked.append(t.id_)
+        return True
+
+    filters = [
+        NamedTransactionFilter(
+            name="asset-1",
+            filter=TransactionFilter(
+                type=["pay", "axfer", "appl"], asset_id=1, custom_filter=custom_filter
+            ),
+        )
+    ]
+
+    def subscribe(reorder_after: int | None) -> list[SubscribedTransaction]:
+        compiled = compile_filters(filters, generate_code=True, reorder_after=reorder_after)
+        checked.clear()
+        transactions = get_subscribed_transactions(
+            TransactionSubscriptionParams(
+                filters=filters,
+                watermark=0,
+                current_round=60,
+                max_rounds_to_sync=100,
+                sync_behaviour="sync-oldest",
+            ),
+            _chain(60),  # type: ignore[arg-type]
+            # test every transaction against the filter, rather than those for asset 1
+            compiled_filters=[
+                dataclasses.replace(f, algod_pre_filter=None, index_key=None) for f in compiled
+            ],
+        ).subscribed_transactions
+        # once reordered, the asset ID (which fails most often) is checked first
+        assert compiled[0].predicate
+        assert compiled[0].predicate.__code__.co_names[:2] == (
+            ("asset_ids", "txn_types") if reorder_after else ("txn_types", "asset_ids")
+        )
+        return transactions
+
+    in_order = subscribe(reorder_after=None)
+    checked_in_order = list(checked)
+
+    assert subscribe(reorder_after=20) == in_order
+    # the custom filter is only called when the other checks pass, either way
+    assert checked == checked_in_order
+    assert len(checked) == len(in_order) == 15
+
+
+def test_checks_are_reordered_once_by_concurrent_callers() -> None:
+    transactions = _subscribe(compile_filters(_filters())).subscribed_transactions
+    features = [_get_txn_features(t) for t in transactions]
+    reorders = list[object]()
+    predicate = _generate_transaction_filter(
+        TransactionFilter(type=["pay", "axfer", "appl"], asset_id=1),
+        [],
+        reorder_after=100,
+        on_reordered=reorders.append,
+    )
+    start = threading.Barrier(8)
+
+    def apply_filter() -> list[bool]:
+        start.wait()
+        return [predicate(t, f) for t, f in zip(transactions, features, strict=True)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: apply_filter(), range(8)))
+
+    assert len(reorders) == 1
+    # only asset transfers have an asset ID (the 5th feature)
+    expected = [f[4] == 1 for f in features]
+    assert results == [expected] * 8
+    assert sum(expected) == 15
+
+
+def test_transactions_are_grouped_by_filter_name_once_each() -> None:
+    filters = [
+        *_filters(),
+        NamedTransactionFilter(name="wallet-0", filter=TransactionFilter(type="pay")),
+        NamedTransactionFilter(name="unmatched", filter=TransactionFilter(app_id=99)),
+    ]
+
+    result = get_subscribed_transactions(
+        TransactionSubscriptionParams(
+            filters=filters,
+            watermark=0,
+            current_round=60,
+            max_rounds_to_sync=100,
+            sync_behaviour="sync-oldest",
+        ),
+        _chain(60),  # type: ignore[arg-type]
+    )
+
+    names = dict.fromkeys(f.name for f in filters)
+    assert result.transactions_by_filter == {
+        name: matched
+        for name in names
+        if (matched := [t for t in result.subscribed_transactions if name in t.filters_matched])
+    }
+    assert "unmatched" not in result.transactions_by_filter
+    wallet_0 = result.transactions_by_filter["wallet-0"]
+    assert len({t.id_ for t in wallet_0}) == len(wallet_0)
+    assert any(t.filters_matched.count("wallet-0") > 1 for t in wallet_0)
@@ -0,0 +1,114 @@
+from pathlib import Path
+
+import pytest
+from algokit_algod_client import models as algod
+
+from algokit_subscriber import file_indexer_checkpoint_store, get_subscribed_transactions
+from algokit_subscriber.types.subscription import (
+    IndexerCheckpointStore,
+    NamedTransactionFilter,
+    TransactionFilter,
+    TransactionSubscriptionParams,
+    TransactionSubscriptionResult,
+)
+from synthetic.blocks import RECEIVER, FakeAlgod, as_inner, make_app_call, make_block, make_payment
+
+from .blocks import FakeIndexer
+
+
+def _blocks() -> list[algod.BlockResponse]:
+    return [
+        make_block(
+            r,
+            [
+                *(make_payment(r, amount=i) for i in range(r % 5)),
+                make_app_call(r, app_id=1, inner_txns=[as_inner(make_payment(r))]),
+            ],
+        )
+        for r in range(1, 121)
+    ]
+
+
+class _IndexerStoppedError(Exception):
+    pass
+
+
+class _StoppingIndexer(FakeIndexer):
+    """Fails every request after the first `stop_after`, like a process that's killed."""
+
+    def __init__(self, stop_after: int) -> None:
+        super().__init__(_blocks(), max_page_size=10)
+        self.stop_after = stop_after
+
+    def search_for_transactions(self, **kwargs: object) -> object:  # type: ignore[override]
+        if self.requests >= self.stop_after:
+            raise _IndexerStoppedError
+        return super().search_for_transactions(**kwargs)  # type: ignore[arg-type]
+
+
+def _subscribe(
+    indexer: FakeIndexer, store: IndexerCheckpointStore | None, current_round: int = 100
+) -> TransactionSubscriptionResult:
+    return get_subscribed_transactions(
+        TransactionSubscriptionParams(
+            filters=[
+                NamedTransactionFilter(name="pay", filter=TransactionFilter(receiver=RECEIVER)),
+                NamedTransactionFilter(name="app", filter=TransactionFilter(app_id=1)),
+            ],
+            watermark=0,
+            current_round=current_round,
+            max_rounds_to_sync=10,
+            sync_behaviour="catchup-with-indexer",
+            indexer_checkpoint_store=store,
+        ),
+        FakeAlgod(_blocks()),  # type: ignore[arg-type]
+        indexer,  # type: ignore[arg-type]
+    )
+
+
+def _summary(result: TransactionSubscriptionResult) -> object:
+    return [(t.id_, t.filters_matched) for t in result.subscribed_transactions]
+
+
+def test_interrupted_catchup_resumes_from_the_last_page(tmp_path: Path) -> None:
+    uninterrupted_indexer = FakeIndexer(_blocks(), max_page_size=10)
+    expected = _subscribe(uninterrupted_indexer, None)
+
+    with pytest.raises(_IndexerStoppedError):
+        _subscribe(_StoppingIndexer(stop_after=15), file_indexer_checkpoint_store(tmp_path))
+    resumed_indexer = FakeIndexer(_blocks(), max_page_size=10)
+    result = _subscribe(resumed_indexer, file_indexer_checkpoint_store(tmp_path))
+
+    assert _summary(result) == _summary(expected)
+    assert result.new_watermark == expected.new_watermark == 100
+    # only the pages that weren't consumed before the interruption are requested again
+    assert resumed_indexer.requests == uninterrupted_indexer.requests - 15
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_resumed_catchup_includes_new_rounds(tmp_path: Path) -> None:
+    expected = _subscribe(FakeIndexer(_blocks(), max_page_size=10), None, current_round=120)
+
+    with pytest.raises(_IndexerStoppedError):
+        _subscribe(_StoppingIndexer(stop_after=8), file_indexer_checkpoint_store(tmp_path))
+    result = _subscribe(
+        FakeIndexer(_blocks(), max_page_size=10),
+        file_indexer_checkpoint_store(tmp_path),
+        current_round=120,
+    )
+
+    assert _summary(result) == _summary(expected)
+
+
+def test_partially_written_pages_are_ignored(tmp_path: Path) -> None:
+    expected = _subscribe(FakeIndexer(_blocks(), max_page_size=10), None)
+    with pytest.raises(_IndexerStoppedError):
+        _subscribe(_StoppingIndexer(stop_after=6), file_indexer_checkpoint_store(tmp_path))
+    for checkpoint in tmp_path.iterdir():
+        checkpoint.write_bytes(checkpoint.read_bytes()[:-5])
+
+    result = _subscribe(
+        FakeIndexer(_blocks(), max_page_size=10), file_indexer_checkpoint_store(tmp_path)
+    )
+
+    assert _summary(result) == _summary(expected)
@@ -0,0 +1,240 @@
+import typing
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+from algokit_algod_client import models as algod
+from algokit_common import address_from_public_key
+
+from algokit_subscriber import get_subscribed_transactions
+from algokit_subscriber._indexer_lookup import search_transactions
+from algokit_subscriber._internal_types import IndexerTransactionFilter
+from algokit_subscriber.types.subscription import (
+    NamedTransactionFilter,
+    TransactionFilter,
+    TransactionSubscriptionParams,
+    TransactionSubscriptionResult,
+)
+from synthetic.blocks import (
+    RECEIVER,
+    FakeAlgod,
+    as_inner,
+    make_app_call,
+    make_asset_transfer,
+    make_block,
+    make_payment,
+)
+
+from .blocks import FakeIndexer
+
+WALLETS = [address_from_public_key(bytes([i]) * 32) for i in range(1, 11)]
+
+
+def _blocks() -> list[algod.BlockResponse]:
+    return [
+        make_block(
+            r,
+            [
+                make_payment(r, sender=WALLETS[r % 10], receiver=WALLETS[(r + 1) % 10]),
+                make_asset_transfer(r, asset_id=r % 3, sender=WALLETS[(r + 2) % 10]),
+                make_app_call(
+                    r,
+                    app_id=r % 2 + 1,
+                    sender=WALLETS[(r + 3) % 10],
+                    inner_txns=[as_inner(make_payment(r, sender=WALLETS[r % 10]))],
+                ),
+            ],
+        )
+        for r in range(1, 61)
+    ]
+
+
+def _filters() -> list[NamedTransactionFilter]:
+    return [
+        *(
+            NamedTransactionFilter(name=f"wallet-{i}", filter=TransactionFilter(sender=wallet))
+            for i, wallet in enumerate(WALLETS)
+        ),
+        NamedTransactionFilter(name="received", filter=TransactionFilter(receiver=RECEIVER)),
+        NamedTransactionFilter(name="app", filter=TransactionFilter(app_id=2)),
+        NamedTransactionFilter(name="asset", filter=TransactionFilter(asset_id=1)),
+        NamedTransactionFilter(name="axfer", filter=TransactionFilter(type="axfer")),
+    ]
+
+
+def _subscribe(indexer: FakeIndexer, max_concurrent: int) -> TransactionSubscriptionResult:
+    return get_subscribed_transactions(
+        TransactionSubscriptionParams(
+            filters=_filters(),
+            watermark=0,
+            current_round=60,
+            max_rounds_to_sync=10,
+            sync_behaviour="catchup-with-indexer",
+            max_concurrent_indexer_requests=max_concurrent,
+        ),
+        FakeAlgod(_blocks()),  # type: ignore[arg-type]
+        indexer,  # type: ignore[arg-type]
+    )
+
+
+def test_concurrent_searches_return_identical_results() -> None:
+    sequential_indexer = FakeIndexer(_blocks())
+    concurrent_indexer = FakeIndexer(_blocks(), delay=0.01)
+
+    sequential = _subscribe(sequential_indexer, 1)
+    concurrent = _subscribe(concurrent_indexer, 4)
+
+    assert [(t.id_, t.filters_matched) for t in concurrent.subscribed_transactions] == [
+        (t.id_, t.filters_matched) for t in sequential.subscribed_transactions
+    ]
+    assert concurrent.new_watermark == sequential.new_watermark == 60
+    assert {t.confirmed_round for t in sequential.subscribed_transactions} == set(range(1, 61))
+    assert sequential_indexer.max_in_flight == 1
+    assert 1 < concurrent_indexer.max_in_flight <= 4
+
+
+def test_inner_transactions_are_shared_with_their_matched_parents() -> None:
+    from_indexer = _subscribe(FakeIndexer(_blocks()), 1).subscribed_transactions
+    from_algod = get_subscribed_transactions(
+        TransactionSubscriptionParams(
+            filters=_filters(),
+            watermark=0,
+            current_round=60,
+            max_rounds_to_sync=60,
+            sync_behaviour="sync-oldest",
+        ),
+        FakeAlgod(_blocks()),  # type: ignore[arg-type]
+    ).subscribed_transactions
+
+    by_id = {t.id_: t for t in from_indexer}
+    shared = [
+        inner
+        for t in from_indexer
+        for inner in t.inner_txns
+        if inner.id_ in by_id and by_id[inner.id_] is inner
+    ]
+    # every app call and the payment it makes are each matched by a wallet filter
+    assert len(shared) == 60
+    assert all(inner.filters_matched for inner in shared)
+    assert from_indexer == from_algod
+
+
+def test_search_failures_are_raised(monkeypatch: pytest.MonkeyPatch) -> None:
+    indexer = FakeIndexer(_blocks(), delay=0.01)
+    search = indexer.search_for_transactions
+
+    def failing_search(**kwargs: object) -> object:
+        if kwargs.get("address") == WALLETS[5]:
+            raise RuntimeError("indexer unavailable")
+        return search(**kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(indexer, "search_for_transactions", failing_search)
+
+    with pytest.raises(RuntimeError, match="indexer unavailable"):
+        _subscribe(indexer, 4)
+
+
+def _dense_blocks() -> list[algod.BlockResponse]:
+    # bursts of busy rounds (up to 25 transactions) between quiet ones
+    return [
+        make_block(
+            r,
+            [
+                make_payment(r, sender=WALLETS[i % 2], amount=i)
+                for i in range(25 if r % 20 in {3, 4} else r % 4)
+            ],
+        )
+        for r in range(1, 101)
+    ]
+
+
+@pytest.mark.parametrize("address", [None, WALLETS[0]])
+def test_split_round_ranges_return_the_same_transactions_in_order(address: str | None) -> None:
+    pre_filter = IndexerTransactionFilter(
+        tx_type="pay", address=address, address_role="sender" if address else None
+    )
+    sequential_indexer = FakeIndexer(_dense_blocks())
+    split_indexer = FakeIndexer(_dense_blocks(), delay=0.005)
+
+    sequential = search_transactions(
+        sequential_indexer,  # type: ignore[arg-type]
+        pre_filter,
+        min_round=2,
+        max_round=99,
+        pagination_limit=10,
+    )
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        split = search_transactions(
+            split_indexer,  # type: ignore[arg-type]
+            pre_filter,
+            min_round=2,
+            max_round=99,
+            pagination_limit=10,
+            executor=executor,
+            max_concurrent_requests=4,
+        )
+
+    assert [t.id_ for t in split] == [t.id_ for t in sequential]
+    assert len({t.confirmed_round for t in sequential}) > 50
+    assert 1 < split_indexer.max_in_flight <= 4
+
+
+def test_a_page_of_only_the_boundary_round_is_not_retrieved_again() -> None:
+    indexer = FakeIndexer(_dense_blocks())
+    search = indexer.search_for_transactions
+    retrieved = list[str | None]()
+
+    def recording_search(**kwargs: typing.Any) -> SimpleNamespace:
+        response = search(**kwargs)
+        retrieved.extend(t.id_ for t in response.transactions)
+        return response
+
+    indexer.search_for_transactions = recording_search  # type: ignore[method-assign]
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        # the first page of rounds 3-6 is entirely round 3, which has 25 transactions
+        result = search_transactions(
+            indexer,  # type: ignore[arg-type]
+            IndexerTransactionFilter(tx_type="pay"),
+            min_round=3,
+            max_round=10,
+            pagination_limit=10,
+            executor=executor,
+            max_concurrent_requests=2,
+        )
+
+    assert [t.id_ for t in result] == [
+        t.id_ for t in indexer.transactions if 3 <= (t.confirmed_round or 0) <= 10
+    ]
+    assert sorted(retrieved, key=str) == sorted((t.id_ for t in result), key=str)
+
+
+def test_split_round_ranges_during_catchup() -> None:
+    filters = [
+        NamedTransactionFilter(name="pay", filter=TransactionFilter(type="pay")),
+        NamedTransactionFilter(name="wallet", filter=TransactionFilter(sender=WALLETS[1])),
+    ]
+
+    def subscribe(indexer: FakeIndexer, **kwargs: object) -> TransactionSubscriptionResult:
+        return get_subscribed_transactions(
+            TransactionSubscriptionParams(
+                filters=filters,
+                watermark=0,
+                current_round=100,
+                max_rounds_to_sync=10,
+                sync_behaviour="catchup-with-indexer",
+                **kwargs,  # type: ignore[arg-type]
+            ),
+            FakeAlgod(_dense_blocks()),  # type: ignore[arg-type]
+            indexer,  # type: ignore[arg-type]
+        )
+
+    split_indexer = FakeIndexer(_dense_blocks(), delay=0.005)
+    expected = subscribe(FakeIndexer(_dense_blocks()))
+    result = subscribe(
+        split_indexer, max_concurrent_indexer_requests=3, split_indexer_round_ranges=True
+    )
+
+    assert [(t.id_, t.filters_matched) for t in result.subscribed_transactions] == [
+        (t.id_, t.filters_matched) for t in expected.subscribed_transactions
+    ]
+    assert 1 < split_indexer.max_in_flight <= 3
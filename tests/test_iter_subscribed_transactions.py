@@ -0,0 +1,118 @@
+import asyncio
+
+from algokit_algod_client import models as algod
+
+from algokit_subscriber import (
+    get_subscribed_transactions,
+    iter_subscribed_transactions,
+    iter_subscribed_transactions_async,
+)
+from algokit_subscriber.types.subscription import (
+    NamedTransactionFilter,
+    SyncBehaviour,
+    TransactionFilter,
+    TransactionSubscriptionParams,
+    TransactionSubscriptionResult,
+)
+from synthetic.blocks import RECEIVER, FakeAlgod, as_inner, make_app_call, make_block, make_payment
+
+from .blocks import FakeAsyncAlgod, FakeIndexer
+
+
+def _blocks() -> list[algod.BlockResponse]:
+    return [
+        make_block(
+            r,
+            [
+                make_payment(r, amount=r),
+                make_app_call(r, app_id=r % 3, inner_txns=[as_inner(make_payment(r))]),
+            ],
+        )
+        for r in range(1, 101)
+    ]
+
+
+def _params(
+    watermark: int = 0, sync_behaviour: SyncBehaviour = "sync-oldest"
+) -> TransactionSubscriptionParams:
+    return TransactionSubscriptionParams(
+        filters=[
+            NamedTransactionFilter(name="pay", filter=TransactionFilter(receiver=RECEIVER)),
+            NamedTransactionFilter(name="app", filter=TransactionFilter(app_id=1)),
+        ],
+        watermark=watermark,
+        current_round=100,
+        max_rounds_to_sync=70,
+        sync_behaviour=sync_behaviour,
+    )
+
+
+def _merged(batches: list[TransactionSubscriptionResult]) -> object:
+    return (
+        [(t.id_, t.filters_matched) for b in batches for t in b.subscribed_transactions],
+        [m.round for b in batches for m in b.block_metadata or []],
+    )
+
+
+def _summary(result: TransactionSubscriptionResult) -> object:
+    return _merged([result])
+
+
+def test_batches_cover_consecutive_rounds_with_the_same_transactions() -> None:
+    expected = get_subscribed_transactions(_params(), FakeAlgod(_blocks()))  # type: ignore[arg-type]
+
+    batches = list(iter_subscribed_transactions(_params(), FakeAlgod(_blocks())))  # type: ignore[arg-type]
+
+    assert [b.synced_round_range for b in batches] == [(1, 30), (31, 60), (61, 70)]
+    assert [(b.starting_watermark, b.new_watermark) for b in batches] == [
+        (0, 30),
+        (30, 60),
+        (60, 70),
+    ]
+    assert _merged(batches) == _summary(expected)
+    assert expected.new_watermark == 70
+
+
+def test_batches_are_yielded_as_blocks_are_retrieved() -> None:
+    algod_client = FakeAlgod(_blocks())
+
+    batches = iter_subscribed_transactions(_params(), algod_client)  # type: ignore[arg-type]
+    first = next(batches)
+
+    assert first.new_watermark == 30
+    assert sorted(algod_client.requested_rounds) == list(range(1, 31))
+
+
+def test_indexer_catchup_is_yielded_before_algod_batches() -> None:
+    params = _params(sync_behaviour="catchup-with-indexer")
+    expected = get_subscribed_transactions(params, FakeAlgod(_blocks()), FakeIndexer(_blocks()))  # type: ignore[arg-type]
+
+    batches = list(
+        iter_subscribed_transactions(params, FakeAlgod(_blocks()), FakeIndexer(_blocks()))  # type: ignore[arg-type]
+    )
+
+    assert [b.synced_round_range for b in batches] == [(1, 30), (31, 60), (61, 90), (91, 100)]
+    assert batches[0].block_metadata == []
+    assert _merged(batches) == _summary(expected)
+    assert expected.synced_round_range == (1, 100)
+
+
+def test_async_batches_match_sync_batches() -> None:
+    async def collect() -> list[TransactionSubscriptionResult]:
+        return [
+            b
+            async for b in iter_subscribed_transactions_async(
+                _params(),
+                FakeAsyncAlgod(_blocks()),  # type: ignore[arg-type]
+            )
+        ]
+
+    batches = asyncio.run(collect())
+    sync_batches = list(iter_subscribed_transactions(_params(), FakeAlgod(_blocks())))  # type: ignore[arg-type]
+
+    assert [b.synced_round_range for b in batches] == [b.synced_round_range for b in sync_batches]
+    assert _merged(batches) == _merged(sync_batches)
+
+
+def test_nothing_is_yielded_at_the_tip() -> None:
+    assert list(iter_subscribed_transactions(_params(watermark=100), FakeAlgod(_blocks()))) == []  # type: ignore[arg-type]
@@ -0,0 +1,102 @@
+import time
+
+from algokit_algod_client import models as algod
+
+from algokit_subscriber import (
+    AlgorandSubscriber,
+    get_subscribed_transactions,
+    in_memory_watermark,
+    iter_subscribed_transactions,
+)
+from algokit_subscriber.types import subscription as sub
+from synthetic.blocks import FakeAlgod, make_app_call, make_block, make_payment
+
+from .blocks import FakeIndexer
+
+
+def _blocks() -> list[algod.BlockResponse]:
+    return [
+        make_block(r, [make_payment(r, amount=r), make_app_call(r, app_id=r % 2 + 1)])
+        for r in range(1, 41)
+    ]
+
+
+def _filters() -> list[sub.SubscriberConfigFilter]:
+    return [
+        sub.SubscriberConfigFilter(name="pay", filter=sub.TransactionFilter(type="pay")),
+        sub.SubscriberConfigFilter(name="app", filter=sub.TransactionFilter(app_id=1)),
+    ]
+
+
+def _params(
+    max_rounds_to_sync: int = 100, sync_behaviour: sub.SyncBehaviour = "sync-oldest"
+) -> sub.TransactionSubscriptionParams:
+    return sub.TransactionSubscriptionParams(
+        filters=_filters(),
+        watermark=0,
+        current_round=40,
+        max_rounds_to_sync=max_rounds_to_sync,
+        sync_behaviour=sync_behaviour,
+    )
+
+
+def test_algod_sync_stats() -> None:
+    result = get_subscribed_transactions(_params(), FakeAlgod(_blocks()))  # type: ignore[arg-type]
+
+    stats = result.stats
+    assert stats.blocks_fetched == 40
+    assert stats.transactions_retrieved == 80
+    # the app calls for app 2 can't match either filter so they're never transformed
+    assert stats.transactions_transformed == 60
+    assert stats.transactions_matched == {"pay": 40, "app": 20}
+    assert stats.indexer_pages_fetched == 0
+    assert stats.fetch_seconds > 0
+    assert stats.mapping_seconds > 0
+    assert stats.filtering_seconds > 0
+    assert stats.handler_seconds == 0
+
+
+def test_batch_stats_add_up_to_the_poll_stats() -> None:
+    batches = list(iter_subscribed_transactions(_params(), FakeAlgod(_blocks())))  # type: ignore[arg-type]
+
+    assert [b.stats.blocks_fetched for b in batches] == [30, 10]
+    assert [b.stats.transactions_matched for b in batches] == [
+        {"pay": 30, "app": 15},
+        {"pay": 10, "app": 5},
+    ]
+
+
+def test_indexer_catchup_stats() -> None:
+    indexer = FakeIndexer(_blocks(), max_page_size=8)
+
+    result = get_subscribed_transactions(
+        _params(max_rounds_to_sync=10, sync_behaviour="catchup-with-indexer"),
+        FakeAlgod(_blocks()),  # type: ignore[arg-type]
+        indexer,  # type: ignore[arg-type]
+    )
+
+    assert result.synced_round_range == (1, 40)
+    assert result.stats.indexer_pages_fetched == indexer.requests > 2
+    assert result.stats.indexer_seconds > 0
+    assert result.stats.blocks_fetched == 10
+    assert result.stats.transactions_matched == {"pay": 40, "app": 20}
+
+
+def test_subscriber_records_handler_time_before_the_poll_event() -> None:
+    subscriber = AlgorandSubscriber(
+        sub.AlgorandSubscriberConfig(
+            filters=_filters(),
+            watermark_persistence=in_memory_watermark(0),
+            sync_behaviour="sync-oldest",
+            max_rounds_to_sync=100,
+        ),
+        FakeAlgod(_blocks()),  # type: ignore[arg-type]
+    )
+    subscriber.on_batch("app", lambda _, __: time.sleep(0.02))
+    handler_seconds = list[float]()
+    subscriber.on_poll(lambda result, _: handler_seconds.append(result.stats.handler_seconds))
+
+    result = subscriber.poll_once()
+
+    assert handler_seconds == [result.stats.handler_seconds]
+    assert result.stats.handler_seconds >= 0.02
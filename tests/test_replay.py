@@ -0,0 +1,90 @@
+import dataclasses
+import time
+from pathlib import Path
+
+import pytest
+from algokit_algod_client import models as algod
+
+from algokit_subscriber import (
+    AlgorandSubscriber,
+    in_memory_watermark,
+    record_api_calls,
+    replay_api_calls,
+)
+from algokit_subscriber.types import subscription as sub
+from synthetic.blocks import FakeAlgod, as_inner, make_app_call, make_block, make_payment
+
+from .blocks import FakeIndexer
+
+
+def _blocks() -> list[algod.BlockResponse]:
+    return [
+        make_block(
+            r,
+            [
+                make_payment(r, amount=r),
+                make_app_call(r, app_id=r % 3 + 1, inner_txns=[as_inner(make_payment(r))]),
+            ],
+        )
+        for r in range(1, 81)
+    ]
+
+
+def _poll_twice(
+    algod_client: object, indexer: object, sync_behaviour: sub.SyncBehaviour
+) -> list[sub.TransactionSubscriptionResult]:
+    subscriber = AlgorandSubscriber(
+        sub.AlgorandSubscriberConfig(
+            filters=[
+                sub.SubscriberConfigFilter(name="pay", filter=sub.TransactionFilter(type="pay")),
+                sub.SubscriberConfigFilter(name="app", filter=sub.TransactionFilter(app_id=2)),
+            ],
+            watermark_persistence=in_memory_watermark(0),
+            sync_behaviour=sync_behaviour,
+            max_rounds_to_sync=50,
+        ),
+        algod_client,  # type: ignore[arg-type]
+        indexer,  # type: ignore[arg-type]
+    )
+    # the timings (unlike everything else) differ between polls
+    return [
+        dataclasses.replace(subscriber.poll_once(), stats=sub.SubscriptionPollStats())
+        for _ in range(2)
+    ]
+
+
+@pytest.mark.parametrize("sync_behaviour", ["sync-oldest", "catchup-with-indexer"])
+def test_replayed_polls_match_the_recorded_ones(
+    tmp_path: Path, sync_behaviour: sub.SyncBehaviour
+) -> None:
+    path = tmp_path / "poll.replay"
+    with record_api_calls(
+        path,
+        FakeAlgod(_blocks()),  # type: ignore[arg-type]
+        FakeIndexer(_blocks(), max_page_size=20),  # type: ignore[arg-type]
+    ) as (algod_client, indexer):
+        recorded = _poll_twice(algod_client, indexer, sync_behaviour)
+
+    replayed = _poll_twice(*replay_api_calls(path), sync_behaviour)
+
+    assert replayed == recorded
+    assert [r.synced_round_range for r in recorded] == (
+        [(1, 50), (51, 80)] if sync_behaviour == "sync-oldest" else [(1, 80), (80, 80)]
+    )
+
+
+def test_replay_latency_and_missing_requests(tmp_path: Path) -> None:
+    path = tmp_path / "blocks.replay"
+    with record_api_calls(path, FakeAlgod(_blocks())) as (algod_client, indexer):  # type: ignore[arg-type]
+        assert indexer is None
+        for round_ in range(1, 6):
+            algod_client.block(round_)
+
+    replay_algod, _ = replay_api_calls(path, latency=0.01, jitter=0.01, seed=1)
+    start = time.time()
+    blocks = [replay_algod.block(round_) for round_ in range(1, 6)]
+    assert time.time() - start >= 0.05
+    assert [b.block.header.round for b in blocks] == [1, 2, 3, 4, 5]
+
+    with pytest.raises(LookupError, match="No response was recorded for block 6"):
+        replay_algod.block(6)
@@ -0,0 +1,107 @@
+import threading
+import time
+
+from algokit_algod_client import models as algod
+
+from algokit_subscriber import (
+    AlgorandSubscriber,
+    AlgorandSubscriberHub,
+    SubscribedTransaction,
+    in_memory_watermark,
+)
+from algokit_subscriber._hub import _SharedAlgod
+from algokit_subscriber.types import subscription as sub
+from synthetic.blocks import FakeAlgod, make_app_call, make_block, make_payment
+
+
+def _blocks(rounds: int) -> list[algod.BlockResponse]:
+    return [
+        make_block(r, [make_payment(r, amount=r), make_app_call(r, app_id=r % 5 + 1)])
+        for r in range(1, rounds + 1)
+    ]
+
+
+def _config(app_id: int, watermark: int = 0) -> sub.AlgorandSubscriberConfig:
+    return sub.AlgorandSubscriberConfig(
+        filters=[
+            sub.SubscriberConfigFilter(
+                name="app",
+                filter=sub.TransactionFilter(app_id=app_id),
+                mapper=lambda txns: [t.confirmed_round for t in txns],
+            )
+        ],
+        watermark_persistence=in_memory_watermark(watermark),
+        sync_behaviour="sync-oldest",
+        max_rounds_to_sync=40,
+    )
+
+
+def test_each_round_is_retrieved_once_for_every_subscription() -> None:
+    algod_client = FakeAlgod(_blocks(60))
+    hub = AlgorandSubscriberHub(algod_client)  # type: ignore[arg-type]
+    received = {app_id: list[int]() for app_id in range(1, 6)}
+    for app_id, rounds in received.items():
+        hub.subscribe(_config(app_id, watermark=0 if app_id == 1 else 20)).on(
+            "app",
+            lambda r, _, rounds=rounds: rounds.append(r),  # type: ignore[misc]
+        )
+
+    first = hub.poll_once()
+    second = hub.poll_once()
+
+    # the subscription that started behind catches up through the rounds already retrieved
+    assert [r.synced_round_range for r in first] == [(1, 40)] + [(21, 60)] * 4
+    assert [r.synced_round_range for r in second] == [(41, 60)] + [(60, 60)] * 4
+    assert sorted(algod_client.requested_rounds) == list(range(1, 61))
+    assert algod_client.status_calls == 2
+    for app_id, rounds in received.items():
+        start = 1 if app_id == 1 else 21
+        assert rounds == [r for r in range(start, 61) if r % 5 + 1 == app_id]
+
+
+def test_subscriptions_match_standalone_subscribers() -> None:
+    hub = AlgorandSubscriberHub(FakeAlgod(_blocks(30)))  # type: ignore[arg-type]
+    hub_subscribers = [hub.subscribe(_config(app_id)) for app_id in range(1, 4)]
+    standalone = [
+        AlgorandSubscriber(_config(app_id), FakeAlgod(_blocks(30)))  # type: ignore[arg-type]
+        for app_id in range(1, 4)
+    ]
+
+    results = hub.poll_once()
+
+    def summary(transactions: list[SubscribedTransaction]) -> list[tuple[str, list[str]]]:
+        return [(t.id_, t.filters_matched) for t in transactions]
+
+    for result, subscriber in zip(results, standalone, strict=True):
+        assert summary(result.subscribed_transactions) == summary(
+            subscriber.poll_once().subscribed_transactions
+        )
+    assert [s.config.watermark_persistence.get() for s in hub_subscribers] == [30] * 3
+
+
+def test_concurrent_requests_for_a_round_share_one_request() -> None:
+    algod_client = FakeAlgod(_blocks(3))
+    block = algod_client.block
+
+    def slow_block(round_: int) -> algod.BlockResponse:
+        time.sleep(0.02)
+        return block(round_)
+
+    algod_client.block = slow_block  # type: ignore[method-assign]
+    shared = _SharedAlgod(algod_client, max_cached_blocks=2)  # type: ignore[arg-type]
+    threads = [threading.Thread(target=shared.block, args=(r % 3 + 1,)) for r in range(9)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(algod_client.requested_rounds) == [1, 2, 3]
+    # only the most recently used blocks are kept (which ones are cached after the
+    # concurrent requests depends on the order they finish in)
+    shared.block(3)
+    shared.block(2)
+    del algod_client.requested_rounds[:]
+    shared.block(1)
+    shared.block(2)
+    shared.block(3)
+    assert algod_client.requested_rounds == [1, 3]
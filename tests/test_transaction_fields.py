@@ -0,0 +1,106 @@
+import pytest
+from algokit_algod_client import models as algod
+from algokit_transact.models import app_call
+
+from algokit_subscriber import get_subscribed_transactions
+from algokit_subscriber._transform import project_transaction
+from algokit_subscriber.types import subscription as sub
+from synthetic.blocks import (
+    SENDER,
+    FakeAlgod,
+    as_inner,
+    heartbeat_block,
+    make_app_call,
+    make_block,
+    make_payment,
+    state_proof_block,
+)
+
+from .blocks import FakeIndexer
+
+
+def _app_call_with_state(round_: int) -> algod.SignedTxnInBlock:
+    return make_app_call(
+        round_,
+        app_id=7,
+        box_references=[app_call.BoxReference(app_id=0, name=b"box")],
+        global_delta={b"counter": algod.BlockEvalDelta(action=2, uint=round_)},
+        local_deltas={0: {b"seen": algod.BlockEvalDelta(action=2, uint=1)}},
+        inner_txns=[as_inner(make_payment(round_))],
+    )
+
+
+def _blocks() -> list[algod.BlockResponse]:
+    return [
+        make_block(1, [_app_call_with_state(1), make_payment(1)]),
+        state_proof_block(2, reveals=3),
+        heartbeat_block(3, transactions=2),
+        make_block(4, [_app_call_with_state(4)]),
+    ]
+
+
+_FILTERS = [
+    sub.NamedTransactionFilter(name="app", filter=sub.TransactionFilter(app_id=7)),
+    sub.NamedTransactionFilter(name="sender", filter=sub.TransactionFilter(sender=SENDER)),
+    sub.NamedTransactionFilter(name="stpf", filter=sub.TransactionFilter(type="stpf")),
+    sub.NamedTransactionFilter(name="hb", filter=sub.TransactionFilter(type="hb")),
+]
+
+
+def _subscribe(
+    fields: list[sub.TransactionFieldGroup] | None,
+    sync_behaviour: sub.SyncBehaviour = "sync-oldest",
+) -> list[sub.SubscribedTransaction]:
+    return get_subscribed_transactions(
+        sub.TransactionSubscriptionParams(
+            filters=_FILTERS,
+            transaction_fields=fields,
+            watermark=0,
+            current_round=4,
+            # when catching up, rounds 1-3 are retrieved from indexer
+            max_rounds_to_sync=1 if sync_behaviour == "catchup-with-indexer" else 4,
+            sync_behaviour=sync_behaviour,
+        ),
+        FakeAlgod(_blocks()),  # type: ignore[arg-type]
+        FakeIndexer(_blocks()),  # type: ignore[arg-type]
+    ).subscribed_transactions
+
+
+def test_excluded_fields_are_not_converted() -> None:
+    full = _subscribe(None)
+    projected = _subscribe([])
+
+    app_call, _, _, state_proof, heartbeat, *_ = full
+    assert app_call.signature
+    assert app_call.global_state_delta
+    assert app_call.local_state_delta
+    assert app_call.application_transaction
+    assert app_call.application_transaction.box_references
+    assert state_proof.state_proof_transaction
+    assert state_proof.state_proof_transaction.state_proof
+    assert heartbeat.heartbeat_transaction
+    assert heartbeat.heartbeat_transaction.hb_proof.hb_sig
+
+    app_call, _, _, state_proof, heartbeat, *_ = projected
+    assert app_call.signature is None
+    assert app_call.global_state_delta is None
+    assert app_call.local_state_delta is None
+    assert app_call.application_transaction
+    assert app_call.application_transaction.box_references is None
+    assert state_proof.state_proof_transaction
+    assert state_proof.state_proof_transaction.state_proof is None
+    assert state_proof.state_proof_transaction.message
+    assert heartbeat.heartbeat_transaction
+    assert heartbeat.heartbeat_transaction.hb_proof.hb_sig is None
+    # everything else is the same, including the matches and balance changes
+    assert projected == [project_transaction(t, []) for t in full]
+
+
+@pytest.mark.parametrize(
+    "fields", [[], ["signature"], ["state-deltas", "app-references"], ["state-proof"]]
+)
+def test_indexer_catchup_projects_the_same_fields(fields: list[sub.TransactionFieldGroup]) -> None:
+    from_algod = _subscribe(fields)
+
+    assert _subscribe(fields, "catchup-with-indexer") == from_algod
+    assert from_algod == [project_transaction(t, fields) for t in _subscribe(None)]